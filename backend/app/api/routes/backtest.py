@@ -11,6 +11,7 @@ from app.backtest.walk_forward import (
     WalkForwardType,
     create_walk_forward_engine,
 )
+from app.backtest.param_search import SearchMethod
 from datetime import datetime, timedelta
 import json
 import pandas as pd
@@ -30,6 +31,8 @@ class WalkForwardRequest(BaseModel):
     step_days: int = Field(default=30, description="Step forward in days")
     walk_type: str = Field(default="rolling", description="rolling, anchored, or expanding")
     optimize_metric: str = Field(default="sharpe_ratio", description="Metric to optimize")
+    search_method: str = Field(default="grid", description="grid, random, halving, or tpe")
+    search_budget: int = Field(default=100, description="Parameter sets per window (random / halving / tpe)")
     initial_capital: float = Field(default=100000.0)
     
     class Config:
@@ -43,6 +46,8 @@ class WalkForwardRequest(BaseModel):
                 "step_days": 30,
                 "walk_type": "rolling",
                 "optimize_metric": "sharpe_ratio",
+                "search_method": "grid",
+                "search_budget": 100,
                 "initial_capital": 100000.0,
             }
         }
@@ -302,6 +307,8 @@ async def run_walk_forward_analysis(request: WalkForwardRequest):
                 'slow_sma': [15, 20, 30, 50],
                 'symbol': [request.symbol],
             },
+            search_method=SearchMethod(request.search_method),
+            search_budget=request.search_budget,
             initial_capital=request.initial_capital,
         )
         
@@ -4,8 +4,10 @@ KeepGaining Trading Platform
 
 Provides comprehensive backtesting capabilities:
 - BacktestEngine: Core execution engine with slippage, commission modeling
+- VectorizedBacktestEngine: Array-based backtests of indicator-rule strategies
 - EnhancedEngine: Advanced metrics (Sharpe, Sortino, drawdown)
 - WalkForwardEngine: Walk-forward optimization and validation
+  (grid, random, successive halving or TPE parameter search)
 - MonteCarloSimulator: Robustness testing via simulation
 - BacktestRunner: Unified orchestrator for all backtest types
 """
@@ -21,6 +23,12 @@ from app.backtest.backtest_engine import (
     BacktestTrade,
 )
 
+# Vectorized engine for indicator-rule strategies
+from app.backtest.vectorized_engine import (
+    CandleArrays,
+    VectorizedBacktestEngine,
+)
+
 # Enhanced engine with metrics
 from app.backtest.enhanced_engine import (
     BacktestEngine as EnhancedBacktestEngine,
@@ -38,6 +46,11 @@ from app.backtest.walk_forward import (
     WalkForwardType,
     create_walk_forward_engine,
 )
+from app.backtest.param_search import (
+    ParameterSearch,
+    SearchMethod,
+    create_search,
+)
 
 # Monte Carlo simulation
 from app.backtest.monte_carlo import (
@@ -66,6 +79,9 @@ __all__ = [
     "BacktestOrder",
     "BacktestPosition",
     "BacktestTrade",
+    # Vectorized
+    "VectorizedBacktestEngine",
+    "CandleArrays",
     # Enhanced
     "EnhancedBacktestEngine",
     "EnhancedConfig",
@@ -78,6 +94,9 @@ __all__ = [
     "WalkForwardWindow",
     "WalkForwardType",
     "create_walk_forward_engine",
+    "ParameterSearch",
+    "SearchMethod",
+    "create_search",
     # Monte Carlo
     "MonteCarloSimulator",
     "MonteCarloResult",
@@ -23,6 +23,7 @@ Usage:
 import asyncio
 import logging
 import sqlite3
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta, time
 from decimal import Decimal
@@ -44,6 +45,45 @@ from app.services.strategy_engine import (
 logger = logging.getLogger(__name__)
 IST = ZoneInfo("Asia/Kolkata")
 
+# candle_data columns that are not passed to strategies as indicators
+CANDLE_COLUMNS = ("symbol", "timestamp", "open", "high", "low", "close", "volume")
+
+# Known indicator columns (from indicator_computation.py), offered first
+INDICATOR_COLUMNS = [
+    # Moving averages
+    "sma_9", "sma_20", "sma_50", "sma_200",
+    "ema_9", "ema_20", "ema_50", "ema_200",
+    "vwma_9", "vwma_20", "vwma_22", "vwma_31",
+    # RSI
+    "rsi_14", "rsi_7", "rsi_21",
+    # MACD
+    "macd", "macd_signal", "macd_histogram",
+    # Bollinger Bands
+    "bb_upper", "bb_middle", "bb_lower", "bb_width",
+    # Supertrend
+    "supertrend", "supertrend_direction",
+    # ATR
+    "atr_14", "atr_7", "atr_21",
+    # Volume
+    "volume_sma_20", "volume_ratio",
+    # Pivots
+    "pivot", "r1", "r2", "r3", "s1", "s2", "s3",
+    # VWAP
+    "vwap",
+    # ADX
+    "adx", "plus_di", "minus_di",
+    # Stochastic
+    "stoch_k", "stoch_d",
+    # CCI
+    "cci",
+    # Williams %R
+    "williams_r",
+    # OBV
+    "obv",
+    # MFI
+    "mfi",
+]
+
 
 class OrderSide(str, Enum):
     """Order side."""
@@ -166,6 +206,39 @@ class BacktestMetrics:
     max_consecutive_losses: int = 0
 
 
+class IndicatorRow(Mapping):
+    """Read-only indicator dict over one row of column arrays (fast mode).
+    
+    Values are read on access; as in _get_indicator_dict, NaN cells are
+    absent. ``copy()`` returns a plain dict for strategies that keep one.
+    """
+    __slots__ = ("_columns", "_pos")
+    
+    def __init__(self, columns: Dict[str, np.ndarray], pos: int):
+        self._columns = columns
+        self._pos = pos
+    
+    def __getitem__(self, name: str) -> float:
+        value = self._columns[name][self._pos]
+        if value != value:
+            raise KeyError(name)
+        return float(value)
+    
+    def __iter__(self):
+        pos = self._pos
+        return (name for name, values in self._columns.items() if values[pos] == values[pos])
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def copy(self) -> Dict[str, float]:
+        return dict(self)
+
+
+def _since_midnight(t: time) -> pd.Timedelta:
+    return pd.Timedelta(hours=t.hour, minutes=t.minute, seconds=t.second, microseconds=t.microsecond)
+
+
 @dataclass
 class BacktestResult:
     """Complete backtest result."""
@@ -278,49 +351,13 @@ class BacktestEngine:
         """Extract indicator values from DataFrame row."""
         indicators = {}
         
-        # Known indicator columns (from indicator_computation.py)
-        indicator_cols = [
-            # Moving averages
-            "sma_9", "sma_20", "sma_50", "sma_200",
-            "ema_9", "ema_20", "ema_50", "ema_200",
-            "vwma_9", "vwma_20", "vwma_22", "vwma_31",
-            # RSI
-            "rsi_14", "rsi_7", "rsi_21",
-            # MACD
-            "macd", "macd_signal", "macd_histogram",
-            # Bollinger Bands
-            "bb_upper", "bb_middle", "bb_lower", "bb_width",
-            # Supertrend
-            "supertrend", "supertrend_direction",
-            # ATR
-            "atr_14", "atr_7", "atr_21",
-            # Volume
-            "volume_sma_20", "volume_ratio",
-            # Pivots
-            "pivot", "r1", "r2", "r3", "s1", "s2", "s3",
-            # VWAP
-            "vwap",
-            # ADX
-            "adx", "plus_di", "minus_di",
-            # Stochastic
-            "stoch_k", "stoch_d",
-            # CCI
-            "cci",
-            # Williams %R
-            "williams_r",
-            # OBV
-            "obv",
-            # MFI
-            "mfi",
-        ]
-        
-        for col in indicator_cols:
+        for col in INDICATOR_COLUMNS:
             if col in row.index and pd.notna(row[col]):
                 indicators[col] = float(row[col])
         
         # Also include any other numeric columns as potential indicators
         for col in row.index:
-            if col not in ["symbol", "timestamp", "open", "high", "low", "close", "volume"]:
+            if col not in CANDLE_COLUMNS:
                 if col not in indicators and pd.notna(row[col]):
                     try:
                         indicators[col] = float(row[col])
@@ -685,61 +722,8 @@ class BacktestEngine:
         
         return metrics
     
-    async def run_backtest(
-        self,
-        strategy: BaseStrategy,
-        symbols: List[str],
-        start_date: date,
-        end_date: date,
-        config: Optional[BacktestConfig] = None
-    ) -> BacktestResult:
-        """
-        Run backtest for a strategy over historical data.
-        
-        Args:
-            strategy: Strategy instance to test
-            symbols: List of symbols to trade
-            start_date: Backtest start date
-            end_date: Backtest end date
-            config: Optional backtest configuration
-            
-        Returns:
-            BacktestResult with performance metrics and trade history
-        """
-        if config:
-            self.config = config
-        
-        # Reset state
-        self._capital = self.config.initial_capital
-        self._positions = {}
-        self._orders = []
-        self._trades = []
-        self._equity_curve = [(datetime.combine(start_date, time(9, 15), IST), self._capital)]
-        self._peak_equity = self._capital
-        self._max_drawdown = Decimal("0")
-        self._signals_generated = 0
-        self._signals_executed = 0
-        
-        logger.info(f"Starting backtest: {strategy.name} on {len(symbols)} symbols")
-        logger.info(f"Period: {start_date} to {end_date}")
-        logger.info(f"Initial capital: {self.config.initial_capital}")
-        
-        # Load historical data
-        df = self._load_candle_data(symbols, start_date, end_date)
-        
-        if df.empty:
-            logger.warning("No data loaded for backtest")
-            return BacktestResult(
-                strategy_name=strategy.name,
-                symbols=symbols,
-                start_date=start_date,
-                end_date=end_date,
-                config=self.config,
-                metrics=BacktestMetrics(),
-                trades=[],
-                equity_curve=[],
-            )
-        
+    async def _run_rows(self, strategy: BaseStrategy, df: pd.DataFrame) -> None:
+        """Simulate the loaded candles row by row (Decimal money)."""
         # Process candles chronologically
         current_date = None
         
@@ -802,6 +786,182 @@ class BacktestEngine:
         # Final equity update
         if not df.empty:
             self._update_equity_curve(df["timestamp"].iloc[-1])
+    
+    def _indicator_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Indicator columns as float64 arrays in _get_indicator_dict order; NaN where a row has no value."""
+        names = [col for col in INDICATOR_COLUMNS if col in df.columns]
+        names += [col for col in df.columns if col not in CANDLE_COLUMNS and col not in names]
+        
+        def to_float(value) -> float:
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                return np.nan
+        
+        columns = {}
+        for name in names:
+            values = df[name]
+            if values.dtype.kind not in "biuf":
+                values = values.map(to_float, na_action="ignore")
+            columns[name] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return columns
+    
+    def _session_masks(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """(in trading hours, first row of a new date) per row, as the row loop decides them."""
+        stamps = df["timestamp"]
+        time_of_day = stamps - stamps.dt.normalize()
+        in_hours = ((time_of_day >= _since_midnight(self.config.trade_start_time))
+                    & (time_of_day <= _since_midnight(self.config.trade_end_time))).to_numpy()
+        days = stamps.dt.normalize().to_numpy()
+        new_day = np.zeros(len(df), dtype=bool)
+        new_day[1:] = days[1:] != days[:-1]
+        return in_hours, new_day
+    
+    async def _run_columnar(self, strategy: BaseStrategy, df: pd.DataFrame) -> None:
+        """Simulate the loaded candles from column arrays (fast mode).
+        
+        Same rules and fills as _run_rows, but columns are extracted once
+        and rows visited by position: strategies get a plain candle dict
+        and a lazy IndicatorRow, trading hours and day changes are
+        precomputed, and open positions are screened against float stop /
+        target levels. Float comparison is monotonic, so only a row that
+        passes the screen can exit and _check_exits confirms it in Decimal;
+        fills and P&L (once per trade) keep the Decimal accounting, so
+        trades are identical to the row-by-row engine.
+        """
+        cfg = self.config
+        n = len(df)
+        timestamps = df["timestamp"].tolist()
+        symbols = df["symbol"].tolist()
+        opens, highs, lows, closes = (df[col].to_numpy(dtype=np.float64).tolist()
+                                      for col in ("open", "high", "low", "close"))
+        volumes = df["volume"].fillna(0).to_numpy().astype(np.int64).tolist()
+        indicator_columns = self._indicator_columns(df)
+        
+        in_hours, new_day = self._session_masks(df)
+        in_hours, new_day = in_hours.tolist(), new_day.tolist()
+        
+        levels: Dict[str, Tuple[float, float]] = {}  # position_id -> (stop, target)
+        
+        for i in range(n):
+            timestamp = timestamps[i]
+            symbol = symbols[i]
+            
+            if new_day[i]:
+                if cfg.exit_at_eod and self._positions:
+                    eod_time = datetime.combine(timestamps[i - 1].date(), cfg.market_close_time)
+                    for pos in list(self._positions.values()):
+                        self._close_position(pos, pos.entry_price, "eod", eod_time)
+                self._update_equity_curve(timestamp)
+            
+            if not in_hours[i]:
+                continue
+            
+            candle = {
+                "timestamp": timestamp,
+                "open": opens[i],
+                "high": highs[i],
+                "low": lows[i],
+                "close": closes[i],
+                "volume": volumes[i],
+            }
+            
+            # Check exits first
+            position = self._positions.get(symbol)
+            if position is not None:
+                if position.position_id not in levels:
+                    levels[position.position_id] = (float(position.stop_loss), float(position.target))
+                stop, target = levels[position.position_id]
+                if position.side == PositionSide.LONG:
+                    touched = lows[i] <= stop or highs[i] >= target
+                else:
+                    touched = highs[i] >= stop or lows[i] <= target
+                if touched:
+                    self._check_exits(candle, symbol)
+            
+            try:
+                signal = await strategy.evaluate(
+                    symbol=symbol,
+                    timeframe="1m",
+                    indicators=IndicatorRow(indicator_columns, i),
+                    candle=candle
+                )
+                if signal:
+                    self._signals_generated += 1
+                    self._execute_signal(signal, candle)
+            except Exception as e:
+                logger.error(f"Strategy evaluation error: {e}")
+        
+        # Close remaining positions at end
+        for pos in list(self._positions.values()):
+            self._close_position(pos, pos.entry_price, "end_of_backtest", timestamps[-1])
+        self._update_equity_curve(timestamps[-1])
+    
+    def _reset_state(self, start_date: date):
+        """Start a run from initial capital with no positions, trades or signals."""
+        self._capital = self.config.initial_capital
+        self._positions = {}
+        self._orders = []
+        self._trades = []
+        self._equity_curve = [(datetime.combine(start_date, time(9, 15), IST), self._capital)]
+        self._peak_equity = self._capital
+        self._max_drawdown = Decimal("0")
+        self._signals_generated = 0
+        self._signals_executed = 0
+    
+    async def run_backtest(
+        self,
+        strategy: BaseStrategy,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        config: Optional[BacktestConfig] = None,
+        fast: bool = False
+    ) -> BacktestResult:
+        """
+        Run backtest for a strategy over historical data.
+        
+        Args:
+            strategy: Strategy instance to test
+            symbols: List of symbols to trade
+            start_date: Backtest start date
+            end_date: Backtest end date
+            config: Optional backtest configuration
+            fast: Columnar event loop (same trades, much faster on long
+                multi-symbol runs)
+            
+        Returns:
+            BacktestResult with performance metrics and trade history
+        """
+        if config:
+            self.config = config
+        
+        self._reset_state(start_date)
+        
+        logger.info(f"Starting backtest: {strategy.name} on {len(symbols)} symbols")
+        logger.info(f"Period: {start_date} to {end_date}")
+        logger.info(f"Initial capital: {self.config.initial_capital}")
+        
+        # Load historical data
+        df = self._load_candle_data(symbols, start_date, end_date)
+        
+        if df.empty:
+            logger.warning("No data loaded for backtest")
+            return BacktestResult(
+                strategy_name=strategy.name,
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                config=self.config,
+                metrics=BacktestMetrics(),
+                trades=[],
+                equity_curve=[],
+            )
+        
+        if fast:
+            await self._run_columnar(strategy, df)
+        else:
+            await self._run_rows(strategy, df)
         
         # Calculate metrics
         metrics = self._calculate_metrics()
@@ -6,6 +6,13 @@ Provides statistical robustness testing for trading strategies by:
 - Shuffling trade order to test path-dependency
 - Bootstrap resampling to assess variance
 - Calculating probability of ruin and confidence intervals
+
+Simulations run batched by default: each chunk of paths is one 2-D matrix
+(one simulated trade sequence per row) whose equity curves, drawdowns and
+Sharpe ratios are computed along axis 1. ``memory_limit_mb`` caps the size
+of a chunk. Draws come from a seeded np.random.Generator, row by row in the
+same order as the per-simulation loops, so both modes simulate the same
+paths for a given seed.
 """
 
 from dataclasses import dataclass, field
@@ -16,6 +23,10 @@ import pandas as pd
 from enum import Enum
 from loguru import logger
 
+# float64 matrices held per simulated trade while a chunk is evaluated
+# (random keys / indices, paths, equity, running max, drawdowns, returns)
+_BYTES_PER_CELL = 6 * 8
+
 
 class SimulationType(str, Enum):
     """Types of Monte Carlo simulation."""
@@ -112,6 +123,8 @@ class MonteCarloSimulator:
         initial_capital: float = 100000.0,
         ruin_threshold: float = 0.5,  # 50% drawdown = ruin
         seed: Optional[int] = None,
+        batched: bool = True,
+        memory_limit_mb: float = 256.0,
     ):
         """
         Initialize Monte Carlo simulator.
@@ -120,12 +133,14 @@ class MonteCarloSimulator:
             initial_capital: Starting capital
             ruin_threshold: Drawdown percentage that constitutes ruin (0.5 = 50%)
             seed: Random seed for reproducibility
+            batched: Simulate chunks of paths as matrices instead of one at a time
+            memory_limit_mb: Approximate memory cap per batched chunk
         """
         self.initial_capital = initial_capital
         self.ruin_threshold = ruin_threshold
-        
-        if seed is not None:
-            np.random.seed(seed)
+        self.batched = batched
+        self.memory_limit_mb = memory_limit_mb
+        self.rng = np.random.default_rng(seed)
     
     def run(
         self,
@@ -144,6 +159,7 @@ class MonteCarloSimulator:
         Returns:
             MonteCarloResult with comprehensive statistics
         """
+        sim_type = SimulationType(sim_type)  # ValueError for an unknown type
         if len(trades) < 5:
             logger.warning(f"Only {len(trades)} trades - results may not be statistically significant")
         
@@ -154,7 +170,9 @@ class MonteCarloSimulator:
         logger.info(f"Running {simulations} Monte Carlo simulations ({sim_type.value}) on {len(trades)} trades")
         
         # Run simulations
-        if sim_type == SimulationType.SHUFFLE:
+        if self.batched:
+            results = self._run_batched_simulation(pnls, simulations, sim_type)
+        elif sim_type == SimulationType.SHUFFLE:
             results = self._run_shuffle_simulation(pnls, simulations)
         elif sim_type == SimulationType.BOOTSTRAP:
             results = self._run_bootstrap_simulation(pnls, simulations)
@@ -175,13 +193,14 @@ class MonteCarloSimulator:
         Run shuffle simulation - randomly reorder trades.
         Tests if strategy results are path-dependent.
         """
+        n_trades = len(pnls)
         returns = []
         max_drawdowns = []
         sharpe_ratios = []
         
         for _ in range(simulations):
-            # Shuffle trade order
-            shuffled = np.random.permutation(pnls)
+            # Shuffle trade order (sorting random keys, as the batched mode does)
+            shuffled = pnls[np.argsort(self.rng.random(n_trades))]
             
             # Calculate equity curve
             equity_curve = self.initial_capital + np.cumsum(shuffled)
@@ -225,7 +244,7 @@ class MonteCarloSimulator:
         
         for _ in range(simulations):
             # Sample with replacement
-            indices = np.random.choice(n_trades, size=n_trades, replace=True)
+            indices = self.rng.integers(0, n_trades, n_trades)
             sampled = pnls[indices]
             
             # Calculate equity curve
@@ -283,7 +302,7 @@ class MonteCarloSimulator:
         
         for _ in range(simulations):
             # Generate synthetic trades
-            synthetic_pnls = np.random.normal(mean_pnl, std_pnl, n_trades)
+            synthetic_pnls = self.rng.normal(mean_pnl, std_pnl, n_trades)
             
             # Calculate equity curve
             equity_curve = self.initial_capital + np.cumsum(synthetic_pnls)
@@ -314,6 +333,57 @@ class MonteCarloSimulator:
             "sharpe_ratios": sharpe_ratios,
         }
     
+    def _run_batched_simulation(
+        self,
+        pnls: np.ndarray,
+        simulations: int,
+        sim_type: SimulationType,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run any simulation type in chunks of paths, one path per matrix row.
+        Chunk rows are sized so the chunk's matrices fit memory_limit_mb.
+        """
+        n_trades = len(pnls)
+        chunk = max(1, int(self.memory_limit_mb * 2**20) // (max(n_trades, 1) * _BYTES_PER_CELL))
+        results: Dict[str, List[np.ndarray]] = {"returns": [], "max_drawdowns": [], "sharpe_ratios": []}
+        
+        for start in range(0, simulations, chunk):
+            paths = self._draw_paths(pnls, min(chunk, simulations - start), sim_type)
+            
+            # Equity curves, one per row
+            equity_curves = self.initial_capital + np.cumsum(paths, axis=1)
+            if sim_type == SimulationType.PARAMETRIC:
+                np.maximum(equity_curves, 1, out=equity_curves)
+            results["returns"].append((equity_curves[:, -1] - self.initial_capital) / self.initial_capital)
+            
+            # Max drawdown per row
+            running_max = np.maximum.accumulate(equity_curves, axis=1)
+            results["max_drawdowns"].append(np.max((running_max - equity_curves) / running_max, axis=1))
+            
+            # Sharpe per row, 0 where returns do not vary
+            daily_returns = paths / self.initial_capital
+            std = np.std(daily_returns, axis=1)
+            sharpe = np.zeros(len(paths))
+            np.divide(np.mean(daily_returns, axis=1), std, out=sharpe, where=std > 0)
+            results["sharpe_ratios"].append(sharpe * np.sqrt(252))
+        
+        return {key: np.concatenate(values) for key, values in results.items()}
+    
+    def _draw_paths(
+        self,
+        pnls: np.ndarray,
+        rows: int,
+        sim_type: SimulationType,
+    ) -> np.ndarray:
+        """``rows`` simulated trade sequences as a (rows, trades) matrix."""
+        n_trades = len(pnls)
+        if sim_type == SimulationType.SHUFFLE:
+            # Sorting each row of random keys gives an independent permutation per row
+            return pnls[np.argsort(self.rng.random((rows, n_trades)), axis=1)]
+        if sim_type == SimulationType.BOOTSTRAP:
+            return pnls[self.rng.integers(0, n_trades, (rows, n_trades))]
+        return self.rng.normal(np.mean(pnls), np.std(pnls), (rows, n_trades))
+    
     def _calculate_statistics(
         self,
         results: Dict[str, List[float]],
@@ -429,10 +499,14 @@ def create_monte_carlo_simulator(
     initial_capital: float = 100000.0,
     ruin_threshold: float = 0.5,
     seed: Optional[int] = None,
+    batched: bool = True,
+    memory_limit_mb: float = 256.0,
 ) -> MonteCarloSimulator:
     """Factory function to create Monte Carlo simulator."""
     return MonteCarloSimulator(
         initial_capital=initial_capital,
         ruin_threshold=ruin_threshold,
         seed=seed,
+        batched=batched,
+        memory_limit_mb=memory_limit_mb,
     )
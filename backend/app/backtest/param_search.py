@@ -0,0 +1,251 @@
+"""
+Parameter Search Strategies
+KeepGaining Trading Platform
+
+Search strategies for walk-forward optimization over ``parameter_ranges``
+(a list of candidate values per parameter):
+
+- GridSearch: every combination (the original behaviour)
+- RandomSearch: ``budget`` distinct combinations sampled from the grid
+- SuccessiveHalving: ``budget`` sampled combinations run on the most recent
+  part of the training period; the best 1/eta advance to eta times more
+  data until the survivors run on all of it
+- TPESearch: Tree-structured Parzen Estimator; after random start-up rounds
+  each batch samples the values that are likely among the best quarter of
+  results so far and unlikely among the rest
+
+Searches run in rounds: ``ask()`` returns the next candidates and the
+fraction of the training period to run them on, ``tell()`` takes their
+scores (None = unusable: error or too few trades). WalkForwardEngine drives
+the rounds, sequentially or with every window's round on one process pool.
+"""
+
+import itertools
+import math
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+
+class SearchMethod(str, Enum):
+    """Parameter search strategies."""
+    GRID = "grid"          # Every combination
+    RANDOM = "random"      # Budgeted random sample
+    HALVING = "halving"    # Successive halving on growing data
+    TPE = "tpe"            # Tree-structured Parzen Estimator
+
+
+class ParameterSearch(ABC):
+    """
+    Proposes parameter sets in rounds.
+
+    Combinations are addressed by their index in the grid (last parameter
+    varying fastest, as itertools.product orders them), so searches can
+    sample huge grids without materializing them.
+    """
+
+    def __init__(
+        self,
+        parameter_ranges: Dict[str, List[Any]],
+        budget: int,
+        rng: np.random.Generator,
+    ):
+        self.keys = list(parameter_ranges.keys())
+        self.values = [list(parameter_ranges[k]) for k in self.keys]
+        self.sizes = [len(v) for v in self.values]
+        self.grid_size = math.prod(self.sizes)
+        self.budget = max(1, min(budget, self.grid_size))
+        self.rng = rng
+
+    @abstractmethod
+    def ask(self) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """Next (candidates, training fraction), or None when the search is done."""
+
+    @abstractmethod
+    def tell(self, candidates: List[Dict[str, Any]], scores: List[Optional[float]]) -> None:
+        """Scores of the candidates from the last ask()."""
+
+    def _digits(self, grid_index: int) -> Tuple[int, ...]:
+        """Value index per parameter of a grid index."""
+        digits = []
+        for size in reversed(self.sizes):
+            grid_index, digit = divmod(grid_index, size)
+            digits.append(digit)
+        return tuple(reversed(digits))
+
+    def _params(self, digits: Sequence[int]) -> Dict[str, Any]:
+        return {key: values[d] for key, values, d in zip(self.keys, self.values, digits)}
+
+    def _sample(self, n: int) -> List[Tuple[int, ...]]:
+        """``n`` distinct combinations; the whole grid, in order, when n covers it."""
+        if n >= self.grid_size:
+            return [self._digits(i) for i in range(self.grid_size)]
+        return [self._digits(int(i)) for i in self.rng.choice(self.grid_size, size=n, replace=False)]
+
+
+class GridSearch(ParameterSearch):
+    """Every combination on the full training period, in one round."""
+
+    def __init__(self, parameter_ranges: Dict[str, List[Any]], budget: int, rng: np.random.Generator):
+        super().__init__(parameter_ranges, budget, rng)
+        self._done = False
+
+    def ask(self) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        if self._done:
+            return None
+        self._done = True
+        return [dict(zip(self.keys, combo)) for combo in itertools.product(*self.values)], 1.0
+
+    def tell(self, candidates: List[Dict[str, Any]], scores: List[Optional[float]]) -> None:
+        pass
+
+
+class RandomSearch(GridSearch):
+    """``budget`` distinct random combinations, in one round."""
+
+    def ask(self) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        if self._done:
+            return None
+        self._done = True
+        return [self._params(digits) for digits in self._sample(self.budget)], 1.0
+
+
+class SuccessiveHalving(ParameterSearch):
+    """
+    Runs ``budget`` sampled combinations on the last 1/eta^k of the
+    training period and keeps the best 1/eta for the next, eta times
+    longer, round; the last round uses the full period. The first round
+    uses at least ``min_fraction`` of the period.
+    """
+
+    def __init__(
+        self,
+        parameter_ranges: Dict[str, List[Any]],
+        budget: int,
+        rng: np.random.Generator,
+        eta: int = 3,
+        min_fraction: float = 0.1,
+    ):
+        super().__init__(parameter_ranges, budget, rng)
+        self.eta = eta
+        rounds = max(1, math.ceil(math.log(self.budget, eta))) if self.budget > 1 else 1
+        rounds = min(rounds, int(math.log(1 / min_fraction, eta) + 1e-9) + 1)
+        self._fractions = [eta ** -k for k in range(rounds - 1, -1, -1)]
+        self._candidates = [self._params(digits) for digits in self._sample(self.budget)]
+
+    def ask(self) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        if not self._fractions or not self._candidates:
+            return None
+        return list(self._candidates), self._fractions[0]
+
+    def tell(self, candidates: List[Dict[str, Any]], scores: List[Optional[float]]) -> None:
+        self._fractions.pop(0)
+        keep = math.ceil(len(candidates) / self.eta)
+        # Stable sort: equal scores keep sampling order; unusable results go last
+        order = sorted(range(len(candidates)),
+                       key=lambda i: (scores[i] is None, -scores[i] if scores[i] is not None else 0.0))
+        self._candidates = [candidates[i] for i in order[:keep]]
+
+
+class TPESearch(ParameterSearch):
+    """
+    Tree-structured Parzen Estimator over the discrete parameter values.
+
+    After ``startup`` random combinations, results are split into the best
+    ``gamma`` share (good) and the rest (bad), each parameter gets smoothed
+    value frequencies l(x) for good and g(x) for bad results, and every
+    proposal is the unevaluated draw from l with the highest l(x) / g(x)
+    out of ``candidates_per_proposal``. Proposals come ``batch_size`` at a
+    time until ``budget`` combinations have run.
+    """
+
+    def __init__(
+        self,
+        parameter_ranges: Dict[str, List[Any]],
+        budget: int,
+        rng: np.random.Generator,
+        startup: int = 10,
+        batch_size: int = 8,
+        gamma: float = 0.25,
+        candidates_per_proposal: int = 24,
+    ):
+        super().__init__(parameter_ranges, budget, rng)
+        self.startup = min(startup, self.budget)
+        self.batch_size = batch_size
+        self.gamma = gamma
+        self.candidates_per_proposal = candidates_per_proposal
+        self._pending: List[Tuple[int, ...]] = []
+        self._seen: set = set()
+        self._history: List[Tuple[Tuple[int, ...], float]] = []  # (digits, score), unusable as -inf
+
+    def ask(self) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        remaining = self.budget - len(self._seen)
+        if remaining <= 0:
+            return None
+        if not self._history:
+            self._pending = self._sample(self.startup)
+        else:
+            self._pending = self._propose(min(self.batch_size, remaining))
+        self._seen.update(self._pending)
+        return [self._params(digits) for digits in self._pending], 1.0
+
+    def tell(self, candidates: List[Dict[str, Any]], scores: List[Optional[float]]) -> None:
+        for digits, score in zip(self._pending, scores):
+            usable = score is not None and not math.isnan(score)
+            self._history.append((digits, score if usable else float("-inf")))
+
+    def _densities(self, rows: List[Tuple[int, ...]]) -> List[np.ndarray]:
+        """Per parameter: value frequencies of ``rows`` with one pseudo-count per value."""
+        densities = []
+        for d, size in enumerate(self.sizes):
+            counts = np.bincount([row[d] for row in rows], minlength=size) + 1.0
+            densities.append(counts / counts.sum())
+        return densities
+
+    def _propose(self, n: int) -> List[Tuple[int, ...]]:
+        ranked = sorted(self._history, key=lambda h: -h[1])  # stable: ties keep evaluation order
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = self._densities([digits for digits, _ in ranked[:n_good]])
+        bad = self._densities([digits for digits, _ in ranked[n_good:]])
+
+        proposals: List[Tuple[int, ...]] = []
+        taken = set(self._seen)
+        for _ in range(n):
+            draws = np.stack([self.rng.choice(size, size=self.candidates_per_proposal, p=good[d])
+                              for d, size in enumerate(self.sizes)], axis=1)
+            ratio = sum(np.log(good[d][draws[:, d]]) - np.log(bad[d][draws[:, d]]) for d in range(len(self.sizes)))
+            best = None
+            for i in np.argsort(-ratio, kind="stable"):
+                digits = tuple(int(v) for v in draws[i])
+                if digits not in taken:
+                    best = digits
+                    break
+            if best is None:
+                # Every draw was evaluated already: fall back to an unseen random combination
+                if len(taken) >= self.grid_size:
+                    break
+                while best is None or best in taken:
+                    best = self._digits(int(self.rng.integers(self.grid_size)))
+            proposals.append(best)
+            taken.add(best)
+        return proposals
+
+
+SEARCH_METHODS: Dict[SearchMethod, Type[ParameterSearch]] = {
+    SearchMethod.GRID: GridSearch,
+    SearchMethod.RANDOM: RandomSearch,
+    SearchMethod.HALVING: SuccessiveHalving,
+    SearchMethod.TPE: TPESearch,
+}
+
+
+def create_search(
+    method: SearchMethod,
+    parameter_ranges: Dict[str, List[Any]],
+    budget: int,
+    seed: Any,
+) -> ParameterSearch:
+    """Search of the given method; ``seed`` feeds np.random.default_rng."""
+    return SEARCH_METHODS[SearchMethod(method)](parameter_ranges, budget, np.random.default_rng(seed))
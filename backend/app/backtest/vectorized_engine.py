@@ -0,0 +1,400 @@
+"""
+Vectorized Signal Backtester
+KeepGaining Trading Platform
+
+Backtests strategies whose entries are pure functions of indicator columns
+(the SimpleIndicatorStrategy family) without an event loop:
+
+- The strategy turns the loaded columns into long / short entry masks
+  (SimpleIndicatorStrategy.signal_masks) in one pass
+- Stop loss / target exits are located with array scans from each entry,
+  EOD exits from the precomputed day boundaries
+- Only the resulting trades go through BacktestEngine's Decimal fills,
+  sizing and capital checks, so results have the BacktestResult shape and
+  match the event-driven engine trade for trade
+
+Data comes from the SQLite candle_data table (as BacktestEngine) or from the
+indicator Parquet dataset written by the pipeline (stage 2 / --stream).
+Loading and column preparation are shared across a parameter screen.
+
+Usage:
+    engine = VectorizedBacktestEngine(parquet_dir="data/indicators")
+    results = await engine.screen(
+        [EMACrossoverStrategy({"fast_ema": 9, "slow_ema": slow}) for slow in (21, 50)],
+        symbols=["RELIANCE", "TCS"],
+        start_date=date(2024, 6, 1),
+        end_date=date(2024, 11, 30),
+    )
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.backtest.backtest_engine import (
+    IST,
+    BacktestConfig,
+    BacktestEngine,
+    BacktestMetrics,
+    BacktestPosition,
+    BacktestResult,
+    IndicatorRow,
+    PositionSide,
+)
+from app.services.strategy_engine import BaseStrategy, SignalStrength, SignalType
+
+logger = logging.getLogger(__name__)
+
+# Parquet columns that are not indicators
+PARQUET_METADATA_COLUMNS = ("instrument_id", "timeframe")
+
+# First exit-scan window (rows); grows 4x while nothing is touched
+EXIT_SCAN_ROWS = 64
+
+
+@dataclass
+class CandleArrays:
+    """
+    Loaded candles as column arrays, sorted by symbol then timestamp.
+
+    Strategies build their entry masks from these (see
+    SimpleIndicatorStrategy.signal_masks).
+    """
+    symbols: List[str]
+    timestamps: List[datetime]
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    indicators: Dict[str, np.ndarray]  # float64, NaN where a row has no value
+    in_hours: np.ndarray  # rows the event engine evaluates
+    new_day: np.ndarray  # first row of a new date
+    block_start: np.ndarray  # first row of the row's symbol
+    block_end: np.ndarray  # one past the last row of the row's symbol
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def column(self, name: str, default: float = np.nan) -> np.ndarray:
+        """Indicator column with missing values (or a missing column) as ``default``."""
+        values = self.indicators.get(name)
+        if values is None:
+            return np.full(len(self), default)
+        if np.isnan(default):
+            return values
+        return np.where(np.isnan(values), default, values)
+
+    def previous(self, values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """
+        ``values`` at the previous evaluated row of the same symbol.
+
+        Mirrors the per-symbol ``_prev_*`` state strategies keep: it only
+        advances on rows evaluated in trading hours where ``valid`` (the
+        strategy's required indicators are present). NaN where there is no
+        such row.
+        """
+        rows = np.flatnonzero(valid & self.in_hours)
+        out = np.full(len(self), np.nan)
+        if len(rows) > 1:
+            same_symbol = self.block_start[rows[1:]] == self.block_start[rows[:-1]]
+            out[rows[1:][same_symbol]] = values[rows[:-1][same_symbol]]
+        return out
+
+    def candle(self, row: int) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamps[row],
+            "high": float(self.high[row]),
+            "low": float(self.low[row]),
+            "close": float(self.close[row]),
+        }
+
+
+class VectorizedBacktestEngine(BacktestEngine):
+    """
+    Backtesting engine for strategies with vectorized entry rules.
+
+    Same fills, sizing, exits and metrics as BacktestEngine; the strategy
+    must implement ``signal_masks``.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        config: Optional[BacktestConfig] = None,
+        parquet_dir: Optional[str] = None,
+        timeframe: str = "1m",
+    ):
+        super().__init__(db_path=db_path, config=config)
+        self.parquet_dir = parquet_dir
+        self.timeframe = timeframe
+
+    def _load_parquet_data(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date
+    ) -> pd.DataFrame:
+        """
+        Load indicator Parquet files (one or more per symbol, as stage 2 and
+        the streaming pipeline name them) with timestamps in IST.
+        """
+        logger.info(f"Loading Parquet data for {len(symbols)} symbols from {start_date} to {end_date}")
+
+        frames = []
+        for symbol in symbols:
+            safe_symbol = symbol.replace('&', '_').replace(' ', '_').replace('-', '_')
+            paths = sorted(Path(self.parquet_dir).glob(f"{safe_symbol}_indicators_{self.timeframe}*.parquet"))
+            if not paths:
+                logger.warning(f"No Parquet files for {symbol}")
+                continue
+
+            df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+            df = df.drop(columns=[c for c in PARQUET_METADATA_COLUMNS if c in df.columns])
+            timestamps = pd.to_datetime(df["timestamp"])
+            if timestamps.dt.tz is not None:
+                timestamps = timestamps.dt.tz_convert(IST).dt.tz_localize(None)
+            df["timestamp"] = timestamps
+
+            days = timestamps.dt.normalize()
+            df = df[(days >= pd.Timestamp(start_date)) & (days <= pd.Timestamp(end_date))]
+            # Incremental and chunked runs write adjacent files; the latest row wins
+            df = df.drop_duplicates("timestamp", keep="last").sort_values("timestamp")
+            df.insert(0, "symbol", symbol)
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True).sort_values(["symbol", "timestamp"], kind="stable")
+        logger.info(f"Loaded {len(df)} candles for {df['symbol'].nunique()} symbols")
+        return df.reset_index(drop=True)
+
+    def _load_data(self, symbols: List[str], start_date: date, end_date: date) -> pd.DataFrame:
+        if self.parquet_dir:
+            return self._load_parquet_data(symbols, start_date, end_date)
+        return self._load_candle_data(symbols, start_date, end_date)
+
+    def prepare(self, df: pd.DataFrame) -> CandleArrays:
+        """Column arrays for loaded candles (sorted by symbol, timestamp)."""
+        n = len(df)
+        symbols = df["symbol"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, symbols[1:] != symbols[:-1]])
+        block = np.searchsorted(starts, np.arange(n), side="right") - 1
+        in_hours, new_day = self._session_masks(df)
+
+        return CandleArrays(
+            symbols=symbols.tolist(),
+            timestamps=df["timestamp"].tolist(),
+            high=df["high"].to_numpy(dtype=np.float64),
+            low=df["low"].to_numpy(dtype=np.float64),
+            close=df["close"].to_numpy(dtype=np.float64),
+            indicators=self._indicator_columns(df),
+            in_hours=in_hours,
+            new_day=new_day,
+            block_start=starts[block],
+            block_end=np.r_[starts[1:], n][block],
+        )
+
+    def _next_touch(
+        self,
+        data: CandleArrays,
+        position: BacktestPosition,
+        start: int,
+        end: int
+    ) -> Optional[int]:
+        """
+        First row in [start, end) within trading hours whose range reaches
+        the position's stop or target, screened in float.
+
+        Float conversion is monotonic, so no row that _check_exits would
+        exit on is skipped; it confirms the row in Decimal.
+        """
+        stop, target = float(position.stop_loss), float(position.target)
+        size = EXIT_SCAN_ROWS
+        while start < end:
+            stop_at = min(end, start + size)
+            high, low = data.high[start:stop_at], data.low[start:stop_at]
+            if position.side == PositionSide.LONG:
+                touched = (low <= stop) | (high >= target)
+            else:
+                touched = (high >= stop) | (low <= target)
+            hits = np.flatnonzero(touched & data.in_hours[start:stop_at])
+            if hits.size:
+                return start + int(hits[0])
+            start = stop_at
+            size *= 4
+        return None
+
+    def _simulate(self, strategy: BaseStrategy, data: CandleArrays) -> None:
+        """
+        Replay entries, exits and day changes in row order.
+
+        Events at the same row keep the event engine's order: the day
+        change (EOD exits, equity point), then the stop / target check,
+        then the entry.
+        """
+        long_mask, short_mask = strategy.signal_masks(data)
+        long_mask = long_mask & data.in_hours
+        short_mask = short_mask & data.in_hours
+        entries = np.flatnonzero(long_mask | short_mask)
+        self._signals_generated = len(entries)
+
+        n = len(data)
+        day_starts = np.flatnonzero(data.new_day)
+        next_day = 0
+        pending: List[Tuple[int, str]] = []  # (row, symbol) of the next possible exit
+        horizon: Dict[str, int] = {}  # symbol -> row its open position is no longer checked from
+
+        def schedule(symbol: str, start: int):
+            row = self._next_touch(data, self._positions[symbol], start, horizon[symbol])
+            if row is not None:
+                heapq.heappush(pending, (row, symbol))
+
+        def replay(until: Tuple[int, int]):
+            """Apply day changes (priority 0) and exits (1) ordered before ``until``."""
+            nonlocal next_day
+            while True:
+                day_row = day_starts[next_day] if next_day < len(day_starts) else n
+                exit_row = pending[0][0] if pending else n
+                if exit_row < day_row and (exit_row, 1) < until:
+                    _, symbol = heapq.heappop(pending)
+                    if symbol in self._positions and self._check_exits(data.candle(exit_row), symbol) is None:
+                        schedule(symbol, exit_row + 1)
+                elif day_row < n and (day_row, 0) < until:
+                    if self.config.exit_at_eod and self._positions:
+                        eod_time = datetime.combine(data.timestamps[day_row - 1].date(), self.config.market_close_time)
+                        for pos in list(self._positions.values()):
+                            self._close_position(pos, pos.entry_price, "eod", eod_time)
+                    self._update_equity_curve(data.timestamps[day_row])
+                    next_day += 1
+                else:
+                    return
+
+        for row in entries.tolist():
+            replay((row, 2))
+            symbol = data.symbols[row]
+            if symbol in self._positions:
+                continue
+
+            candle = data.candle(row)
+            signal = strategy._create_signal(
+                symbol=symbol,
+                signal_type=SignalType.LONG_ENTRY if long_mask[row] else SignalType.SHORT_ENTRY,
+                strength=SignalStrength.MODERATE,
+                entry_price=Decimal(str(candle["close"])),
+                indicators=IndicatorRow(data.indicators, row),
+                candle=candle,
+                reason=f"{strategy.name} entry mask",
+            )
+            if self._execute_signal(signal, candle) is None:
+                continue
+
+            horizon[symbol] = int(data.block_end[row])
+            if self.config.exit_at_eod:
+                k = np.searchsorted(day_starts, row, side="right")
+                if k < len(day_starts):
+                    horizon[symbol] = min(horizon[symbol], int(day_starts[k]))
+            schedule(symbol, row + 1)
+
+        replay((n, 0))
+
+        # Close remaining positions at end
+        for pos in list(self._positions.values()):
+            self._close_position(pos, pos.entry_price, "end_of_backtest", data.timestamps[-1])
+        self._update_equity_curve(data.timestamps[-1])
+
+    def _run(
+        self,
+        strategy: BaseStrategy,
+        data: CandleArrays,
+        symbols: List[str],
+        start_date: date,
+        end_date: date
+    ) -> BacktestResult:
+        self._reset_state(start_date)
+        self._simulate(strategy, data)
+        metrics = self._calculate_metrics()
+
+        logger.info(f"Vectorized backtest {strategy.name}: {metrics.total_trades} trades, "
+                    f"Net P&L: {metrics.net_profit:.2f}")
+
+        return BacktestResult(
+            strategy_name=strategy.name,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            config=self.config,
+            metrics=metrics,
+            trades=self._trades.copy(),
+            equity_curve=self._equity_curve.copy(),
+            signals_generated=self._signals_generated,
+            signals_executed=self._signals_executed,
+        )
+
+    def _empty_result(self, strategy: BaseStrategy, symbols: List[str], start_date: date, end_date: date) -> BacktestResult:
+        return BacktestResult(
+            strategy_name=strategy.name,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            config=self.config,
+            metrics=BacktestMetrics(),
+            trades=[],
+            equity_curve=[],
+        )
+
+    async def run_backtest(
+        self,
+        strategy: BaseStrategy,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        config: Optional[BacktestConfig] = None
+    ) -> BacktestResult:
+        """
+        Run a vectorized backtest for one strategy.
+
+        Args:
+            strategy: Strategy implementing ``signal_masks``
+            symbols: List of symbols to trade
+            start_date: Backtest start date
+            end_date: Backtest end date
+            config: Optional backtest configuration
+
+        Returns:
+            BacktestResult with performance metrics and trade history
+        """
+        results = await self.screen([strategy], symbols, start_date, end_date, config)
+        return results[0]
+
+    async def screen(
+        self,
+        strategies: List[BaseStrategy],
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        config: Optional[BacktestConfig] = None
+    ) -> List[BacktestResult]:
+        """
+        Backtest several strategies (typically one per parameter set) on
+        data loaded and prepared once.
+
+        Returns:
+            One BacktestResult per strategy, in order
+        """
+        if config:
+            self.config = config
+
+        df = self._load_data(symbols, start_date, end_date)
+        if df.empty:
+            logger.warning("No data loaded for backtest")
+            return [self._empty_result(strategy, symbols, start_date, end_date) for strategy in strategies]
+
+        data = self.prepare(df)
+        return [self._run(strategy, data, symbols, start_date, end_date) for strategy in strategies]
@@ -5,10 +5,20 @@ KeepGaining Trading Platform
 Walk-forward analysis divides historical data into multiple in-sample (training)
 and out-of-sample (testing) periods, optimizing parameters on each training
 period and validating on the subsequent test period.
+
+Parameters are searched with a pluggable strategy (param_search: grid,
+random, successive halving, TPE). With ``optimize_workers > 1`` each search
+round of every window runs on a process pool: the market data is copied once
+into shared memory (SharedFrame) and tasks only carry the window, training
+fraction and parameter set.
 """
 
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from multiprocessing import shared_memory
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from enum import Enum
 import pandas as pd
@@ -16,6 +26,7 @@ import numpy as np
 from loguru import logger
 
 from app.backtest.enhanced_engine import BacktestEngine, BacktestConfig, Trade
+from app.backtest.param_search import ParameterSearch, SearchMethod, create_search
 
 
 class WalkForwardType(str, Enum):
@@ -43,6 +54,10 @@ class WalkForwardConfig:
     # Optimization settings
     optimize_metric: str = "sharpe_ratio"  # Metric to optimize
     parameter_ranges: Dict[str, List[Any]] = field(default_factory=dict)
+    search_method: SearchMethod = SearchMethod.GRID
+    search_budget: int = 100        # Parameter sets per window (random / halving / tpe)
+    search_seed: int = 0
+    optimize_workers: int = 1       # > 1: search on a process pool (picklable strategy_runner)
     
     # Backtest config
     initial_capital: float = 100000.0
@@ -82,6 +97,147 @@ class WalkForwardResult:
     parameter_stability: Dict[str, float]  # Std dev of optimized params
 
 
+def _slice_period(
+    data: pd.DataFrame,
+    start: datetime,
+    end: datetime,
+    include_end: bool = False,
+) -> pd.DataFrame:
+    """Rows with start <= index < end (<= end with include_end); a binary search on sorted data."""
+    index = data.index
+    if index.is_monotonic_increasing:
+        lo = index.searchsorted(start, side="left")
+        hi = index.searchsorted(end, side="right" if include_end else "left")
+        return data.iloc[lo:hi]
+    return data[(index >= start) & ((index <= end) if include_end else (index < end))]
+
+
+def _training_period(start: datetime, end: datetime, fraction: float) -> Tuple[datetime, datetime]:
+    """The most recent ``fraction`` of a training period."""
+    if fraction >= 1:
+        return start, end
+    return end - (end - start) * fraction, end
+
+
+def _run_params(
+    strategy_runner: Callable,
+    data: pd.DataFrame,
+    params: Dict[str, Any],
+    backtest_config: BacktestConfig,
+    optimize_metric: str,
+) -> Tuple[int, Any, Optional[str]]:
+    """Run one parameter set: (trades, metric, error)."""
+    try:
+        trades, metrics = strategy_runner(data, params, backtest_config)
+        return len(trades), metrics.get(optimize_metric, 0), None
+    except Exception as e:
+        return 0, None, str(e)
+
+
+class SharedFrame:
+    """
+    A DataFrame copied once into a shared memory block.
+    
+    Pickles as a small layout descriptor, so pool workers attach to the same
+    pages with ``frame()`` instead of each receiving a copy. Text / object
+    columns are stored as categorical codes (categories travel with the
+    descriptor); timezone-aware values as UTC. The creating process must
+    ``unlink()`` the block when done.
+    """
+    
+    def __init__(self, data: pd.DataFrame):
+        arrays = [("index", data.index.name, data.index)]
+        arrays += [("column", name, data[name]) for name in data.columns]
+        
+        self.length = len(data)
+        self.layout: List[Tuple[str, Any, str, int, Any, Any]] = []  # (role, name, dtype, offset, tz, categories)
+        buffers, offset = [], 0
+        for role, name, values in arrays:
+            tz, categories = None, None
+            dtype = getattr(values, "dtype", None)
+            if isinstance(dtype, pd.DatetimeTZDtype):
+                tz = dtype.tz
+                values = pd.DatetimeIndex(values).tz_convert("UTC").tz_localize(None)
+            array = np.asarray(values)
+            if array.dtype.kind not in "biufmM":
+                codes, uniques = pd.factorize(values, use_na_sentinel=True)
+                array, categories = codes, list(uniques)
+            buffers.append((offset, array))
+            self.layout.append((role, name, array.dtype.str, offset, tz, categories))
+            offset += -(-array.nbytes // 8) * 8
+        
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 8))
+        self.name = self._shm.name
+        for start, array in buffers:
+            np.ndarray(array.shape, array.dtype, buffer=self._shm.buf, offset=start)[:] = array
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"name": self.name, "length": self.length, "layout": self.layout}
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._shm = None
+    
+    def frame(self) -> pd.DataFrame:
+        """DataFrame over the shared block (read-only views; attaches on first use)."""
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(name=self.name)
+        
+        index, columns = None, {}
+        for role, name, dtype, offset, tz, categories in self.layout:
+            values = np.ndarray(self.length, np.dtype(dtype), buffer=self._shm.buf, offset=offset)
+            values.flags.writeable = False
+            if categories is not None:
+                values = pd.Categorical.from_codes(values, categories=categories).astype(object)
+            elif tz is not None:
+                values = pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(tz)
+            if role == "index":
+                index = pd.Index(values, name=name)
+            else:
+                columns[name] = values
+        return pd.DataFrame(columns, index=index, copy=False)
+    
+    def unlink(self):
+        """Release the block (creating process, after the workers are done)."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+# Per-process state of search workers (set by _init_optimize_worker)
+_worker: Dict[str, Any] = {}
+
+
+def _init_optimize_worker(
+    shared: SharedFrame,
+    strategy_runner: Callable,
+    periods: Dict[int, Tuple[datetime, datetime]],
+    backtest_config: BacktestConfig,
+    optimize_metric: str,
+):
+    _worker.update(
+        data=shared.frame(),
+        shared=shared,
+        strategy_runner=strategy_runner,
+        periods=periods,
+        backtest_config=backtest_config,
+        optimize_metric=optimize_metric,
+        period=None,
+    )
+
+
+def _evaluate_params(task: Tuple[int, float, Dict[str, Any]]) -> Tuple[int, Any, Optional[str]]:
+    """Run one parameter set on (a fraction of) one training window."""
+    window_id, fraction, params = task
+    if _worker["period"] != (window_id, fraction):
+        # Tasks arrive window by window; slice each training period once
+        _worker["period"] = (window_id, fraction)
+        _worker["training_data"] = _slice_period(
+            _worker["data"], *_training_period(*_worker["periods"][window_id], fraction)
+        )
+    return _run_params(_worker["strategy_runner"], _worker["training_data"], params,
+                       _worker["backtest_config"], _worker["optimize_metric"])
+
+
 class WalkForwardEngine:
     """
     Walk-forward backtesting engine.
@@ -160,73 +316,185 @@ class WalkForwardEngine:
         """
         Optimize parameters on training data.
         
-        Uses grid search over parameter_ranges to find best parameters
-        according to optimize_metric.
+        Searches parameter_ranges with the configured search_method to find
+        the best parameters according to optimize_metric.
         """
         if not self.config.parameter_ranges:
             return {}
         
-        # Filter training data
-        training_data = data[
-            (data.index >= window.training_start) &
-            (data.index < window.training_end)
-        ]
-        
-        if len(training_data) == 0:
+        if len(_slice_period(data, window.training_start, window.training_end)) == 0:
             logger.warning(f"No training data for window {window.window_id}")
             return {}
         
-        best_params = {}
-        best_metric = float('-inf')
+        backtest_config = self._backtest_config()
+        slices: Dict[Tuple[int, float], pd.DataFrame] = {}
         
-        # Generate parameter combinations
-        param_combinations = self._generate_param_combinations()
-        
-        for params in param_combinations:
-            try:
-                # Run strategy with these params
-                backtest_config = BacktestConfig(
-                    initial_capital=self.config.initial_capital,
-                    commission_percent=self.config.commission_percent,
-                    slippage_percent=self.config.slippage_percent,
-                    position_size_percent=self.config.position_size_percent,
-                )
-                
-                trades, metrics = self.strategy_runner(training_data, params, backtest_config)
-                
-                # Check minimum trades
-                if len(trades) < self.config.min_training_trades:
-                    continue
-                
-                # Get optimization metric
-                metric_value = metrics.get(self.config.optimize_metric, 0)
+        def evaluate(requests):
+            outcomes = []
+            for window, fraction, params in requests:
+                if (window.window_id, fraction) not in slices:
+                    period = _training_period(window.training_start, window.training_end, fraction)
+                    slices[window.window_id, fraction] = _slice_period(data, *period)
+                outcomes.append(_run_params(self.strategy_runner, slices[window.window_id, fraction], params,
+                                            backtest_config, self.config.optimize_metric))
+            return outcomes
+        
+        return self._search_windows([window], evaluate)[window.window_id]
+    
+    def optimize_windows_parallel(
+        self,
+        data: pd.DataFrame,
+        windows: List[WalkForwardWindow],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Optimize every window on a process pool.
+        
+        Each search round of all windows is fanned out together; workers
+        attach to one shared memory copy of ``data`` and slice each training
+        period once. Results come back in task order and searches are
+        seeded per window, so the chosen parameters equal
+        optimize_parameters'.
+        
+        Returns:
+            Optimized parameters per window_id
+        """
+        searchable = []
+        for window in windows:
+            if len(_slice_period(data, window.training_start, window.training_end)) == 0:
+                logger.warning(f"No training data for window {window.window_id}")
+            else:
+                searchable.append(window)
+        
+        workers = self.config.optimize_workers
+        logger.info(f"Optimizing {len(windows)} windows ({SearchMethod(self.config.search_method).value} search) "
+                    f"on {workers} processes")
+        
+        periods = {w.window_id: (w.training_start, w.training_end) for w in searchable}
+        shared = SharedFrame(data)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_optimize_worker,
+                initargs=(shared, self.strategy_runner, periods,
+                          self._backtest_config(), self.config.optimize_metric),
+            ) as executor:
+                def evaluate(requests):
+                    tasks = [(window.window_id, fraction, params) for window, fraction, params in requests]
+                    chunksize = max(1, len(tasks) // (workers * 4))
+                    return list(executor.map(_evaluate_params, tasks, chunksize=chunksize))
                 
-                if metric_value > best_metric:
-                    best_metric = metric_value
-                    best_params = params.copy()
-                    
-            except Exception as e:
-                logger.warning(f"Error with params {params}: {e}")
-                continue
+                best = self._search_windows(searchable, evaluate)
+        finally:
+            shared.unlink()
         
-        return best_params
+        return {window.window_id: best.get(window.window_id, {}) for window in windows}
     
-    def _generate_param_combinations(self) -> List[Dict[str, Any]]:
-        """Generate all parameter combinations from ranges."""
-        if not self.config.parameter_ranges:
-            return [{}]
+    def _make_search(self, window: WalkForwardWindow) -> ParameterSearch:
+        """The window's search, seeded by (search_seed, window_id) so any evaluation order agrees."""
+        return create_search(
+            self.config.search_method,
+            self.config.parameter_ranges,
+            self.config.search_budget,
+            [self.config.search_seed, window.window_id],
+        )
+    
+    def _search_windows(
+        self,
+        windows: List[WalkForwardWindow],
+        evaluate: Callable[[List[Tuple[WalkForwardWindow, float, Dict[str, Any]]]], List[Tuple[int, Any, Optional[str]]]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Drive each window's search round by round.
         
-        # Simple grid search implementation
-        import itertools
+        ``evaluate`` runs a batch of (window, training fraction, params) and
+        returns (trades, metric, error) per entry, in order. The best
+        parameters are chosen among full-period runs.
+        """
+        searches = {window.window_id: self._make_search(window) for window in windows}
+        full_runs: Dict[int, Tuple[list, list]] = {window.window_id: ([], []) for window in windows}
+        
+        while searches:
+            requests, asked = [], []
+            for window in windows:
+                search = searches.get(window.window_id)
+                if search is None:
+                    continue
+                proposal = search.ask()
+                if proposal is None:
+                    del searches[window.window_id]
+                    continue
+                candidates, fraction = proposal
+                asked.append((window, candidates, fraction))
+                requests += [(window, fraction, params) for params in candidates]
+            
+            outcomes = iter(evaluate(requests) if requests else [])
+            for window, candidates, fraction in asked:
+                results = [next(outcomes) for _ in candidates]
+                for params, (_, _, error) in zip(candidates, results):
+                    if error is not None:
+                        logger.warning(f"Error with params {params}: {error}")
+                searches[window.window_id].tell(candidates, [self._score(r, fraction) for r in results])
+                if fraction >= 1:
+                    full_runs[window.window_id][0].extend(candidates)
+                    full_runs[window.window_id][1].extend(results)
+        
+        return {window_id: self._select_best(*runs) for window_id, runs in full_runs.items()}
+    
+    def _score(self, outcome: Tuple[int, Any, Optional[str]], fraction: float) -> Optional[float]:
+        """Search feedback: the metric, or None for errors and too few trades (pro rata on partial periods)."""
+        trade_count, metric_value, error = outcome
+        if error is not None or trade_count < self.config.min_training_trades * fraction:
+            return None
+        try:
+            score = float(metric_value)
+        except (TypeError, ValueError):
+            return None
+        return None if math.isnan(score) else score
+    
+    def _select_best(
+        self,
+        param_combinations: List[Dict[str, Any]],
+        outcomes: List[Tuple[int, Any, Optional[str]]],
+    ) -> Dict[str, Any]:
+        """
+        Best parameters from (trades, metric, error) per combination.
         
-        keys = list(self.config.parameter_ranges.keys())
-        values = [self.config.parameter_ranges[k] for k in keys]
+        Combinations are scanned in evaluation order and only a strictly
+        better metric replaces the best, so ties go to the earliest
+        combination whichever way the outcomes were computed.
+        """
+        best_params = {}
+        best_metric = float('-inf')
         
-        combinations = []
-        for combo in itertools.product(*values):
-            combinations.append(dict(zip(keys, combo)))
+        for params, (trade_count, metric_value, error) in zip(param_combinations, outcomes):
+            # Check minimum trades
+            if error is not None or trade_count < self.config.min_training_trades:
+                continue
+            
+            if metric_value > best_metric:
+                best_metric = metric_value
+                best_params = params.copy()
         
-        return combinations
+        return best_params
+    
+    def _parallel_optimization(self) -> bool:
+        """Whether run() can use optimize_windows_parallel."""
+        if self.config.optimize_workers <= 1 or not self.config.parameter_ranges:
+            return False
+        try:
+            pickle.dumps(self.strategy_runner)
+        except Exception as e:
+            logger.warning(f"strategy_runner cannot be sent to worker processes ({e}); optimizing sequentially")
+            return False
+        return True
+    
+    def _backtest_config(self) -> BacktestConfig:
+        return BacktestConfig(
+            initial_capital=self.config.initial_capital,
+            commission_percent=self.config.commission_percent,
+            slippage_percent=self.config.slippage_percent,
+            position_size_percent=self.config.position_size_percent,
+        )
     
     def run_window(
         self,
@@ -235,18 +503,10 @@ class WalkForwardEngine:
         params: Dict[str, Any],
     ) -> WalkForwardWindow:
         """Run a single walk-forward window."""
-        backtest_config = BacktestConfig(
-            initial_capital=self.config.initial_capital,
-            commission_percent=self.config.commission_percent,
-            slippage_percent=self.config.slippage_percent,
-            position_size_percent=self.config.position_size_percent,
-        )
+        backtest_config = self._backtest_config()
         
         # Run on training period (for metrics)
-        training_data = data[
-            (data.index >= window.training_start) &
-            (data.index < window.training_end)
-        ]
+        training_data = _slice_period(data, window.training_start, window.training_end)
         
         if len(training_data) > 0:
             training_trades, training_metrics = self.strategy_runner(
@@ -256,10 +516,7 @@ class WalkForwardEngine:
             window.training_metrics = training_metrics
         
         # Run on testing period (out-of-sample)
-        testing_data = data[
-            (data.index >= window.testing_start) &
-            (data.index <= window.testing_end)
-        ]
+        testing_data = _slice_period(data, window.testing_start, window.testing_end, include_end=True)
         
         if len(testing_data) > 0:
             testing_trades, testing_metrics = self.strategy_runner(
@@ -300,6 +557,8 @@ class WalkForwardEngine:
         if not self.windows:
             raise ValueError("No valid walk-forward windows could be generated")
         
+        optimized = self.optimize_windows_parallel(data, self.windows) if self._parallel_optimization() else None
+        
         # Process each window
         for window in self.windows:
             logger.info(f"Processing window {window.window_id}: "
@@ -307,7 +566,10 @@ class WalkForwardEngine:
                        f"Testing {window.testing_start.date()} - {window.testing_end.date()}")
             
             # Optimize on training data
-            optimized_params = self.optimize_parameters(data, window)
+            if optimized is not None:
+                optimized_params = optimized[window.window_id]
+            else:
+                optimized_params = self.optimize_parameters(data, window)
             
             # Run on both periods
             window = self.run_window(data, window, optimized_params)
@@ -442,6 +704,9 @@ def create_walk_forward_engine(
     optimize_metric: str = "sharpe_ratio",
     parameter_ranges: Optional[Dict[str, List]] = None,
     initial_capital: float = 100000.0,
+    search_method: str = "grid",
+    search_budget: int = 100,
+    optimize_workers: int = 1,
 ) -> WalkForwardEngine:
     """
     Factory function to create a walk-forward engine.
@@ -455,6 +720,9 @@ def create_walk_forward_engine(
         optimize_metric: Metric to optimize ("sharpe_ratio", "total_return_percent", etc.)
         parameter_ranges: Dict of parameter names to list of values to test
         initial_capital: Starting capital
+        search_method: "grid", "random", "halving" or "tpe"
+        search_budget: Parameter sets per window for random / halving / tpe
+        optimize_workers: Processes for the parameter grid search (1 = sequential)
         
     Returns:
         Configured WalkForwardEngine
@@ -467,6 +735,9 @@ def create_walk_forward_engine(
         optimize_metric=optimize_metric,
         parameter_ranges=parameter_ranges or {},
         initial_capital=initial_capital,
+        search_method=SearchMethod(search_method),
+        search_budget=search_budget,
+        optimize_workers=optimize_workers,
     )
     
     return WalkForwardEngine(config, strategy_runner)
@@ -23,7 +23,7 @@ from loguru import logger
 from fyers_apiv3.FyersWebsocket import data_ws
 
 from app.core.config import settings
-from app.core.events import EventBus, TickEvent, EventType, get_event_bus
+from app.core.events import BatchingPublisher, EventBus, TickEvent, EventType, get_event_bus
 from app.brokers.fyers_client import FyersClient
 
 
@@ -134,6 +134,7 @@ class FyersWebSocketAdapter(DataSourceBase):
         client: Optional[FyersClient] = None,
         on_tick: Optional[Callable[[TickData], Coroutine[Any, Any, None]]] = None,
         publish_to_event_bus: bool = True,
+        batch_publish: bool = True,
     ):
         """
         Initialize Fyers WebSocket adapter.
@@ -142,10 +143,13 @@ class FyersWebSocketAdapter(DataSourceBase):
             client: FyersClient instance (creates new if not provided)
             on_tick: Callback function for tick data
             publish_to_event_bus: Whether to publish ticks to event bus
+            batch_publish: Micro-batch ticks into pipelined event bus writes
+                (window/size from settings.redis.tick_batch_*)
         """
         self._client = client
         self._on_tick = on_tick
         self._publish_to_event_bus = publish_to_event_bus
+        self._batch_publish = batch_publish
         
         self._ws: Optional[data_ws.FyersDataSocket] = None
         self._state = ConnectionState.DISCONNECTED
@@ -163,6 +167,7 @@ class FyersWebSocketAdapter(DataSourceBase):
         
         # Event bus
         self._event_bus: Optional[EventBus] = None
+        self._tick_publisher: Optional[BatchingPublisher] = None
         
         # Stats
         self._tick_count = 0
@@ -212,6 +217,15 @@ class FyersWebSocketAdapter(DataSourceBase):
             # Get event bus for publishing
             if self._publish_to_event_bus:
                 self._event_bus = await get_event_bus()
+                if self._batch_publish and self._event_bus.is_remote and self._tick_publisher is None:
+                    redis_settings = settings.redis
+                    self._tick_publisher = BatchingPublisher(
+                        self._event_bus,
+                        window_ms=redis_settings.tick_batch_window_ms,
+                        max_batch=redis_settings.tick_batch_max_events,
+                        max_pending=redis_settings.tick_batch_max_pending,
+                    )
+                    await self._tick_publisher.start()
             
             # Create WebSocket connection
             access_token = f"{settings.FYERS_CLIENT_ID}:{self._client.access_token}"
@@ -258,6 +272,11 @@ class FyersWebSocketAdapter(DataSourceBase):
         
         self._state = ConnectionState.DISCONNECTED
         self._subscribed_symbols.clear()
+        
+        # Flush buffered ticks
+        if self._tick_publisher:
+            await self._tick_publisher.stop()
+            self._tick_publisher = None
         logger.info("Fyers WebSocket disconnected")
     
     async def subscribe(self, symbols: List[str]) -> bool:
@@ -472,10 +491,14 @@ class FyersWebSocketAdapter(DataSourceBase):
                     source="fyers_ws",
                 )
                 
-                asyncio.run_coroutine_threadsafe(
-                    self._event_bus.publish(event),
-                    self._event_loop
-                )
+                # Called on the Fyers socket thread
+                if self._tick_publisher:
+                    self._tick_publisher.submit_threadsafe(event)
+                else:
+                    asyncio.run_coroutine_threadsafe(
+                        self._event_bus.publish(event),
+                        self._event_loop
+                    )
                 
         except Exception as e:
             logger.error(f"Error processing tick for {data.get('symbol', 'unknown')}: {e}")
@@ -517,6 +540,7 @@ class FyersWebSocketAdapter(DataSourceBase):
             "last_tick_time": self._last_tick_time.isoformat() if self._last_tick_time else None,
             "error_count": self._error_count,
             "reconnect_attempts": self._reconnect_attempts,
+            "publisher": self._tick_publisher.get_stats() if self._tick_publisher else None,
         }
 
 
@@ -62,7 +62,7 @@ else:
     pb = None
 
 from app.core.config import settings
-from app.core.events import EventBus, TickEvent, EventType, get_event_bus
+from app.core.events import BatchingPublisher, EventBus, TickEvent, EventType, get_event_bus
 
 
 class ConnectionState(str, Enum):
@@ -82,6 +82,12 @@ class DataMode(str, Enum):
     OPTION_GREEKS = "option_greeks"  # Option Greeks with LTPC
 
 
+class DecodeMode(str, Enum):
+    """How binary feed frames are turned into ticks."""
+    DIRECT = "direct"  # Read protobuf message fields straight into UpstoxTickData
+    DICT = "dict"      # MessageToDict first, then walk the nested dict (legacy)
+
+
 @dataclass
 class UpstoxTickData:
     """Normalized tick data from Upstox WebSocket."""
@@ -114,6 +120,32 @@ class UpstoxTickData:
     vega: Optional[float] = None
     rho: Optional[float] = None
     
+    def reset(self) -> None:
+        """Zero all market fields so the object can be reused for the next feed."""
+        self.ltp = 0.0
+        self.ltt = 0
+        self.ltq = 0
+        self.cp = 0.0
+        self.open = 0.0
+        self.high = 0.0
+        self.low = 0.0
+        self.close = 0.0
+        self.volume = 0
+        self.oi = 0.0
+        self.atp = 0.0
+        self.bid = 0.0
+        self.ask = 0.0
+        self.bid_qty = 0
+        self.ask_qty = 0
+        self.total_buy_qty = 0.0
+        self.total_sell_qty = 0.0
+        self.iv = 0.0
+        self.delta = None
+        self.theta = None
+        self.gamma = None
+        self.vega = None
+        self.rho = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -146,6 +178,124 @@ class UpstoxTickData:
         }
 
 
+def _apply_ltpc(tick: UpstoxTickData, ltpc: Any, with_ltq: bool = True) -> None:
+    """Copy an LTPC message onto a tick, keeping existing values for unset fields."""
+    if ltpc.ltp:
+        tick.ltp = ltpc.ltp
+    if ltpc.ltt:
+        tick.ltt = ltpc.ltt
+    if with_ltq and ltpc.ltq:
+        tick.ltq = ltpc.ltq
+    if ltpc.cp:
+        tick.cp = ltpc.cp
+
+
+def _apply_greeks(tick: UpstoxTickData, greeks: Any) -> None:
+    """Copy an OptionGreeks message onto a tick."""
+    tick.delta = greeks.delta
+    tick.theta = greeks.theta
+    tick.gamma = greeks.gamma
+    tick.vega = greeks.vega
+    tick.rho = greeks.rho
+
+
+def _apply_daily_ohlc(tick: UpstoxTickData, market_ohlc: Any, with_volume: bool) -> None:
+    """Copy the 1d bar of a MarketOHLC message onto a tick."""
+    for ohlc in market_ohlc.ohlc:
+        if ohlc.interval == "1d":
+            tick.open = ohlc.open
+            tick.high = ohlc.high
+            tick.low = ohlc.low
+            tick.close = ohlc.close
+            if with_volume:
+                tick.volume = ohlc.vol
+            break
+
+
+def decode_feed_into(tick: UpstoxTickData, feed: Any) -> UpstoxTickData:
+    """
+    Fill ``tick`` directly from a protobuf ``Feed`` message.
+    
+    Produces the same values as ``MessageToDict`` followed by
+    ``UpstoxWebSocketAdapter._process_feed``, without building the
+    intermediate dict or doing string lookups per field. The tick is
+    expected to be freshly created or ``reset()``.
+    
+    Args:
+        tick: Tick to populate (modified in place)
+        feed: ``MarketDataFeedV3_pb2.Feed`` message
+        
+    Returns:
+        The same tick, for convenience.
+    """
+    kind = feed.WhichOneof("FeedUnion")
+    
+    if kind == "ltpc":
+        ltpc = feed.ltpc
+        tick.ltp = ltpc.ltp
+        tick.ltt = ltpc.ltt
+        tick.ltq = ltpc.ltq
+        tick.cp = ltpc.cp
+    
+    elif kind == "fullFeed":
+        full = feed.fullFeed
+        full_kind = full.WhichOneof("FullFeedUnion")
+        
+        if full_kind == "marketFF":
+            market = full.marketFF
+            if market.HasField("ltpc"):
+                _apply_ltpc(tick, market.ltpc)
+            if market.HasField("marketLevel"):
+                depth = market.marketLevel.bidAskQuote
+                if depth:
+                    top = depth[0]
+                    tick.bid = top.bidP
+                    tick.bid_qty = top.bidQ
+                    tick.ask = top.askP
+                    tick.ask_qty = top.askQ
+            if market.HasField("marketOHLC"):
+                _apply_daily_ohlc(tick, market.marketOHLC, with_volume=True)
+            
+            tick.atp = market.atp
+            tick.oi = market.oi
+            tick.iv = market.iv
+            tick.total_buy_qty = market.tbq
+            tick.total_sell_qty = market.tsq
+            if market.vtt:
+                tick.volume = market.vtt
+            
+            if market.HasField("optionGreeks"):
+                _apply_greeks(tick, market.optionGreeks)
+        
+        elif full_kind == "indexFF":
+            index = full.indexFF
+            if index.HasField("ltpc"):
+                _apply_ltpc(tick, index.ltpc, with_ltq=False)
+            if index.HasField("marketOHLC"):
+                _apply_daily_ohlc(tick, index.marketOHLC, with_volume=False)
+    
+    elif kind == "firstLevelWithGreeks":
+        fl = feed.firstLevelWithGreeks
+        if fl.HasField("ltpc"):
+            _apply_ltpc(tick, fl.ltpc)
+        if fl.HasField("firstDepth"):
+            depth = fl.firstDepth
+            tick.bid = depth.bidP
+            tick.bid_qty = depth.bidQ
+            tick.ask = depth.askP
+            tick.ask_qty = depth.askQ
+        if fl.HasField("optionGreeks"):
+            _apply_greeks(tick, fl.optionGreeks)
+        if fl.vtt:
+            tick.volume = fl.vtt
+        if fl.oi:
+            tick.oi = fl.oi
+        if fl.iv:
+            tick.iv = fl.iv
+    
+    return tick
+
+
 class UpstoxWebSocketAdapter:
     """
     Upstox WebSocket adapter for real-time market data.
@@ -176,6 +326,8 @@ class UpstoxWebSocketAdapter:
         data_mode: DataMode = DataMode.FULL_D5,
         on_tick: Optional[Callable[[UpstoxTickData], Coroutine[Any, Any, None]]] = None,
         publish_to_event_bus: bool = True,
+        decode_mode: DecodeMode = DecodeMode.DIRECT,
+        batch_publish: bool = True,
     ):
         """
         Initialize Upstox WebSocket adapter.
@@ -185,6 +337,10 @@ class UpstoxWebSocketAdapter:
             data_mode: Type of data to receive (ltpc, full, option_greeks)
             on_tick: Optional callback for tick data
             publish_to_event_bus: Whether to publish ticks to event bus
+            decode_mode: DIRECT reads protobuf fields straight into ticks;
+                DICT goes through MessageToDict (slower, kept for debugging)
+            batch_publish: Micro-batch ticks into pipelined event bus writes
+                (window/size from settings.redis.tick_batch_*)
         """
         if not WEBSOCKETS_AVAILABLE:
             raise ImportError("websockets library required. Install: pip install websockets")
@@ -197,6 +353,12 @@ class UpstoxWebSocketAdapter:
         self._data_mode = data_mode
         self._on_tick = on_tick
         self._publish_to_event_bus = publish_to_event_bus
+        self._decode_mode = decode_mode
+        self._batch_publish = batch_publish
+        
+        # Reusable tick objects per instrument (DIRECT mode without on_tick,
+        # where ticks never leave the adapter)
+        self._tick_pool: Dict[str, UpstoxTickData] = {}
         
         self._ws = None
         self._state = ConnectionState.DISCONNECTED
@@ -215,6 +377,7 @@ class UpstoxWebSocketAdapter:
         
         # Event bus
         self._event_bus: Optional[EventBus] = None
+        self._tick_publisher: Optional[BatchingPublisher] = None
         
         # Stats
         self._tick_count = 0
@@ -293,6 +456,15 @@ class UpstoxWebSocketAdapter:
             # Get event bus for publishing
             if self._publish_to_event_bus:
                 self._event_bus = await get_event_bus()
+                if self._batch_publish and self._event_bus.is_remote and self._tick_publisher is None:
+                    redis_settings = settings.redis
+                    self._tick_publisher = BatchingPublisher(
+                        self._event_bus,
+                        window_ms=redis_settings.tick_batch_window_ms,
+                        max_batch=redis_settings.tick_batch_max_events,
+                        max_pending=redis_settings.tick_batch_max_pending,
+                    )
+                    await self._tick_publisher.start()
             
             # Create SSL context
             ssl_context = ssl.create_default_context()
@@ -351,6 +523,11 @@ class UpstoxWebSocketAdapter:
                 logger.error(f"Error closing WebSocket: {e}")
             self._ws = None
         
+        # Flush buffered ticks
+        if self._tick_publisher:
+            await self._tick_publisher.stop()
+            self._tick_publisher = None
+        
         self._subscribed_instruments.clear()
         logger.info("Upstox WebSocket disconnected")
     
@@ -537,6 +714,13 @@ class UpstoxWebSocketAdapter:
             if UPSTOX_PROTO_AVAILABLE and pb:
                 feed_response = pb.FeedResponse()
                 feed_response.ParseFromString(message)
+                
+                if self._decode_mode == DecodeMode.DIRECT:
+                    received_at = datetime.now(timezone.utc)
+                    for instrument_key, feed in feed_response.feeds.items():
+                        await self._process_feed_proto(instrument_key, feed, received_at)
+                    return
+                
                 data = MessageToDict(feed_response)
             else:
                 # Fallback to JSON (less efficient)
@@ -675,32 +859,73 @@ class UpstoxWebSocketAdapter:
                 tick.oi = float(fl.get("oi", tick.oi))
                 tick.iv = float(fl.get("iv", tick.iv))
             
-            # Update stats
-            self._tick_count += 1
-            self._last_tick_time = tick.timestamp
-            
-            # Call user callback
-            if self._on_tick:
-                await self._on_tick(tick)
-            
-            # Publish to event bus
-            if self._event_bus:
-                event = TickEvent(
-                    event_type=EventType.TICK_RECEIVED,
-                    instrument_id=instrument_key,
-                    symbol=tick.symbol,
-                    ltp=tick.ltp,
-                    bid=tick.bid,
-                    ask=tick.ask,
-                    volume=tick.volume,
-                    oi=int(tick.oi),
-                    source="upstox_ws",
-                )
-                await self._event_bus.publish(event)
+            await self._emit_tick(tick)
                 
         except Exception as e:
             logger.error(f"Error processing feed for {instrument_key}: {e}")
     
+    async def _process_feed_proto(
+        self,
+        instrument_key: str,
+        feed: Any,
+        received_at: datetime,
+    ) -> None:
+        """Process a single instrument feed straight from the protobuf message."""
+        try:
+            if self._on_tick is None:
+                tick = self._tick_pool.get(instrument_key)
+                if tick is None:
+                    tick = UpstoxTickData(
+                        symbol=instrument_key.split("|")[-1],
+                        instrument_key=instrument_key,
+                        ltp=0.0,
+                    )
+                    self._tick_pool[instrument_key] = tick
+                else:
+                    tick.reset()
+            else:
+                # Callbacks may keep a reference, so hand out a fresh object
+                tick = UpstoxTickData(
+                    symbol=instrument_key.split("|")[-1],
+                    instrument_key=instrument_key,
+                    ltp=0.0,
+                )
+            tick.timestamp = received_at
+            
+            decode_feed_into(tick, feed)
+            await self._emit_tick(tick)
+            
+        except Exception as e:
+            logger.error(f"Error processing feed for {instrument_key}: {e}")
+    
+    async def _emit_tick(self, tick: UpstoxTickData) -> None:
+        """Update stats and hand a decoded tick to the callback and event bus."""
+        # Update stats
+        self._tick_count += 1
+        self._last_tick_time = tick.timestamp
+        
+        # Call user callback
+        if self._on_tick:
+            await self._on_tick(tick)
+        
+        # Publish to event bus
+        if self._event_bus:
+            event = TickEvent(
+                event_type=EventType.TICK_RECEIVED,
+                instrument_id=tick.instrument_key,
+                symbol=tick.symbol,
+                ltp=tick.ltp,
+                bid=tick.bid,
+                ask=tick.ask,
+                volume=tick.volume,
+                oi=int(tick.oi),
+                source="upstox_ws",
+            )
+            if self._tick_publisher:
+                self._tick_publisher.submit(event)
+            else:
+                await self._event_bus.publish(event)
+    
     async def _handle_reconnect(self) -> None:
         """Handle WebSocket reconnection with exponential backoff."""
         self._reconnect_attempts += 1
@@ -733,6 +958,7 @@ class UpstoxWebSocketAdapter:
         return {
             "state": self._state.value,
             "data_mode": self._data_mode.value,
+            "decode_mode": self._decode_mode.value,
             "subscribed_instruments": len(self._subscribed_instruments),
             "tick_count": self._tick_count,
             "last_tick_time": self._last_tick_time.isoformat() if self._last_tick_time else None,
@@ -740,6 +966,7 @@ class UpstoxWebSocketAdapter:
             "reconnect_attempts": self._reconnect_attempts,
             "connected_at": self._connected_at.isoformat() if self._connected_at else None,
             "max_instruments": self.MAX_INSTRUMENTS,
+            "publisher": self._tick_publisher.get_stats() if self._tick_publisher else None,
         }
 
 
@@ -796,7 +1023,9 @@ async def create_upstox_websocket(
 __all__ = [
     "ConnectionState",
     "DataMode",
+    "DecodeMode",
     "UpstoxTickData",
     "UpstoxWebSocketAdapter",
     "create_upstox_websocket",
+    "decode_feed_into",
 ]
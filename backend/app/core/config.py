@@ -59,6 +59,15 @@ class RedisSettings(BaseSettings):
     stream_max_len: int = Field(default=10000, description="Max stream length")
     consumer_group_prefix: str = Field(default="kg", description="Consumer group prefix")
     
+    # Stream consumers
+    consumer_batch_size: int = Field(default=10, description="Messages per XREADGROUP")
+    consumer_concurrency: int = Field(default=1, description="Messages handled concurrently per stream")
+    
+    # Batched tick publishing
+    tick_batch_window_ms: float = Field(default=5.0, description="Max time a tick waits before flush")
+    tick_batch_max_events: int = Field(default=500, description="Flush as soon as this many ticks are buffered")
+    tick_batch_max_pending: int = Field(default=20000, description="Buffered ticks before backpressure kicks in")
+    
     @property
     def url(self) -> str:
         """Redis URL."""
@@ -223,6 +232,10 @@ class Settings(BaseSettings):
     )
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis URL")
     
+    # Event bus: "redis" (Redis Streams) or "inprocess" (asyncio queues, single node)
+    EVENT_BUS_BACKEND: Literal["redis", "inprocess"] = Field(default="redis", description="Event bus backend")
+    EVENT_BUS_MIRROR_TO_REDIS: bool = Field(default=True, description="In-process bus: mirror events to Redis streams")
+    
     # Fyers credentials
     FYERS_CLIENT_ID: str = Field(default="", description="Fyers client ID")
     FYERS_SECRET_KEY: str = Field(default="", description="Fyers secret key")
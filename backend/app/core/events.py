@@ -14,11 +14,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import (
-    Any, Callable, Coroutine, Dict, Generic, List, 
-    Optional, Type, TypeVar, Union
+    Any, Callable, Coroutine, Dict, Generic, Iterator, List, 
+    Optional, Tuple, Type, TypeVar, Union
 )
 import asyncio
-import json
+import time
 import uuid
 
 from loguru import logger
@@ -39,6 +39,7 @@ class EventType(str, Enum):
     TICK_RECEIVED = "tick.received"
     CANDLE_FORMED = "candle.formed"
     INDICATOR_UPDATED = "indicator.updated"
+    INDICATORS_BATCH_UPDATED = "indicator.batch_updated"
     OPTION_CHAIN_UPDATED = "option_chain.updated"
     
     # Trading Events
@@ -102,7 +103,19 @@ class BaseEvent(BaseModel):
         use_enum_values = True
 
 
+# Event model registry: class name -> model, used to deserialize stream
+# messages into their concrete subclass instead of a generic BaseEvent.
+EVENT_MODEL_REGISTRY: Dict[str, Type[BaseEvent]] = {"BaseEvent": BaseEvent}
+
+
+def register_event_model(model_cls: Type[BaseEvent]) -> Type[BaseEvent]:
+    """Register an event model so consumers receive it as its own type."""
+    EVENT_MODEL_REGISTRY[model_cls.__name__] = model_cls
+    return model_cls
+
+
 # Market Data Events
+@register_event_model
 class TickEvent(BaseEvent):
     """Real-time tick data event."""
     event_type: EventType = EventType.TICK_RECEIVED
@@ -116,6 +129,7 @@ class TickEvent(BaseEvent):
     oi: Optional[int] = None  # Open interest
 
 
+@register_event_model
 class CandleEvent(BaseEvent):
     """Candle formation event."""
     event_type: EventType = EventType.CANDLE_FORMED
@@ -131,6 +145,7 @@ class CandleEvent(BaseEvent):
     is_complete: bool = True
 
 
+@register_event_model
 class IndicatorEvent(BaseEvent):
     """Indicator calculation event."""
     event_type: EventType = EventType.INDICATOR_UPDATED
@@ -141,7 +156,27 @@ class IndicatorEvent(BaseEvent):
     indicators: Dict[str, float]  # e.g., {"rsi_14": 65.5, "ema_21": 1250.0}
 
 
+@register_event_model
+class IndicatorBatchEvent(BaseEvent):
+    """Indicator values for many symbols of one timeframe, column per indicator."""
+    event_type: EventType = EventType.INDICATORS_BATCH_UPDATED
+    
+    timeframe: str
+    symbols: List[str]
+    # e.g., {"rsi_14": [65.5, None, ...]} aligned with symbols; None = not warmed up
+    indicators: Dict[str, List[Optional[float]]]
+    
+    def rows(self) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """Yield (symbol, indicators) pairs like individual IndicatorEvents."""
+        columns = list(self.indicators.items())
+        for i, symbol in enumerate(self.symbols):
+            yield symbol, {
+                name: values[i] for name, values in columns if values[i] is not None
+            }
+
+
 # Trading Events
+@register_event_model
 class SignalEvent(BaseEvent):
     """Trading signal event."""
     event_type: EventType = EventType.SIGNAL_GENERATED
@@ -158,6 +193,7 @@ class SignalEvent(BaseEvent):
     suggested_target: Optional[float] = None
 
 
+@register_event_model
 class OrderEvent(BaseEvent):
     """Order lifecycle event."""
     event_type: EventType = EventType.ORDER_PLACED
@@ -177,6 +213,7 @@ class OrderEvent(BaseEvent):
     rejection_reason: Optional[str] = None
 
 
+@register_event_model
 class TradeEvent(BaseEvent):
     """Trade execution event."""
     event_type: EventType = EventType.TRADE_EXECUTED
@@ -192,6 +229,7 @@ class TradeEvent(BaseEvent):
     broker_trade_id: Optional[str] = None
 
 
+@register_event_model
 class PositionEvent(BaseEvent):
     """Position update event."""
     event_type: EventType = EventType.POSITION_UPDATED
@@ -211,6 +249,7 @@ class PositionEvent(BaseEvent):
 
 
 # Risk Events
+@register_event_model
 class RiskEvent(BaseEvent):
     """Risk management event."""
     event_type: EventType = EventType.RISK_LIMIT_BREACHED
@@ -224,6 +263,7 @@ class RiskEvent(BaseEvent):
 
 
 # System Events
+@register_event_model
 class SystemEvent(BaseEvent):
     """System lifecycle event."""
     event_type: EventType = EventType.SYSTEM_STARTUP
@@ -233,6 +273,7 @@ class SystemEvent(BaseEvent):
     details: Dict[str, Any] = Field(default_factory=dict)
 
 
+@register_event_model
 class BrokerEvent(BaseEvent):
     """Broker connection event."""
     event_type: EventType = EventType.BROKER_CONNECTED
@@ -250,6 +291,55 @@ EventT = TypeVar("EventT", bound=BaseEvent)
 EventHandler = Callable[[BaseEvent], Coroutine[Any, Any, None]]
 
 
+@dataclass
+class HandlerStats:
+    """Latency and lag statistics for one subscriber on one stream."""
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    total_lag_ms: float = 0.0
+    last_lag_ms: float = 0.0
+    
+    def record(self, elapsed_ms: float, lag_ms: float, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.total_lag_ms += lag_ms
+        self.last_lag_ms = lag_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / calls, 3),
+            "max_ms": round(self.max_ms, 3),
+            "avg_lag_ms": round(self.total_lag_ms / calls, 3),
+            "last_lag_ms": round(self.last_lag_ms, 3),
+        }
+
+
+@dataclass
+class StreamStats:
+    """Consumer-side statistics for one stream."""
+    read: int = 0
+    acked: int = 0
+    in_flight: int = 0
+    decode_errors: int = 0
+    handlers: Dict[str, HandlerStats] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "read": self.read,
+            "acked": self.acked,
+            "in_flight": self.in_flight,
+            "decode_errors": self.decode_errors,
+            "handlers": {name: st.to_dict() for name, st in self.handlers.items()},
+        }
+
+
 @dataclass
 class Subscription:
     """Event subscription details."""
@@ -271,6 +361,9 @@ class EventBus:
     - Type-safe event definitions
     """
     
+    # Publishes cross a network hop, so callers benefit from batching
+    is_remote = True
+    
     @staticmethod
     def _get_enum_value(val: Union[EventType, EventPriority, str, int]) -> str:
         """Safely get the string value from an enum or string."""
@@ -284,17 +377,36 @@ class EventBus:
         stream_prefix: str = "kg:events:",
         max_stream_length: int = 10000,
         consumer_group: str = "keepgaining",
+        consumer_batch_size: Optional[int] = None,
+        consumer_concurrency: Optional[int] = None,
     ):
+        """
+        Args:
+            redis_url: Redis connection URL (defaults to settings.REDIS_URL)
+            stream_prefix: Prefix for stream names
+            max_stream_length: Approximate MAXLEN per stream
+            consumer_group: Consumer group name
+            consumer_batch_size: Messages per XREADGROUP
+                (default: settings.redis.consumer_batch_size)
+            consumer_concurrency: Messages handled concurrently per stream.
+                1 processes strictly in order; above 1, messages for
+                different instruments overlap while messages for the same
+                instrument stay ordered (default: settings.redis.consumer_concurrency)
+        """
+        redis_settings = settings.redis
         self.redis_url = redis_url or settings.REDIS_URL
         self.stream_prefix = stream_prefix
         self.max_stream_length = max_stream_length
         self.consumer_group = consumer_group
+        self.consumer_batch_size = consumer_batch_size or redis_settings.consumer_batch_size
+        self.consumer_concurrency = max(1, consumer_concurrency or redis_settings.consumer_concurrency)
         self.consumer_name = f"consumer-{uuid.uuid4().hex[:8]}"
         
         self._redis: Optional[redis.Redis] = None
         self._subscriptions: Dict[EventType, List[Subscription]] = {}
         self._running = False
         self._consumer_tasks: List[asyncio.Task] = []
+        self._stream_stats: Dict[str, StreamStats] = {}
     
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -350,16 +462,10 @@ class EventBus:
         # Handle legacy (event_type_str, data_dict) pattern
         if isinstance(event, str):
             # Resolve event type alias
-            event_type = self.EVENT_TYPE_ALIASES.get(event)
-            if not event_type:
-                # Try to find matching EventType
-                for et in EventType:
-                    if et.value == event or et.name.lower() == event.lower():
-                        event_type = et
-                        break
-                else:
-                    logger.warning(f"Unknown event type for publish: {event}")
-                    return ""
+            event_type = self._resolve_event_type(event)
+            if event_type is None:
+                logger.warning(f"Unknown event type for publish: {event}")
+                return ""
             
             # Create a BaseEvent with the data in metadata
             event = BaseEvent(
@@ -367,6 +473,31 @@ class EventBus:
                 metadata=data or {},
             )
         
+        stream_name, event_data = self._encode_event(event)
+        
+        # Add to stream with max length
+        message_id = await self._redis.xadd(
+            stream_name,
+            event_data,
+            maxlen=self.max_stream_length,
+            approximate=True,
+        )
+        
+        logger.debug(f"Published event {event.event_type}: {event.event_id} -> {message_id}")
+        return message_id
+    
+    def _resolve_event_type(self, name: str) -> Optional[EventType]:
+        """Resolve an alias, value or name to an EventType."""
+        event_type = self.EVENT_TYPE_ALIASES.get(name)
+        if event_type:
+            return event_type
+        for et in EventType:
+            if et.value == name or et.name.lower() == name.lower():
+                return et
+        return None
+    
+    def _encode_event(self, event: BaseEvent) -> tuple:
+        """Serialize an event into its stream name and XADD field dict."""
         stream_name = self._get_stream_name(event.event_type)
         
         # Handle both enum and string values (use_enum_values=True)
@@ -379,28 +510,55 @@ class EventBus:
             "event_type": event_type_value,
             "timestamp": event.timestamp.isoformat(),
             "priority": str(priority_value),
+            "model": type(event).__name__,
         }
+        return stream_name, event_data
+    
+    def _decode_event(self, message_data: Dict[str, str]) -> BaseEvent:
+        """
+        Deserialize a stream message into its concrete event class.
         
-        # Add to stream with max length
-        message_id = await self._redis.xadd(
-            stream_name,
-            event_data,
-            maxlen=self.max_stream_length,
-            approximate=True,
-        )
-        
-        logger.debug(f"Published event {event.event_type}: {event.event_id} -> {message_id}")
-        return message_id
+        Messages written by ``_encode_event`` carry the model name, which is
+        looked up in ``EVENT_MODEL_REGISTRY``. The payload is validated
+        straight from the JSON string by pydantic-core (no intermediate
+        ``json.loads`` dict). Older messages without a model, or with an
+        unknown one, fall back to ``BaseEvent``.
+        """
+        model_cls = EVENT_MODEL_REGISTRY.get(message_data.get("model", ""), BaseEvent)
+        return model_cls.model_validate_json(message_data["data"])
     
     async def publish_many(self, events: List[BaseEvent]) -> List[str]:
-        """Publish multiple events."""
-        return [await self.publish(event) for event in events]
+        """
+        Publish multiple events in a single Redis round-trip.
+        
+        All XADDs go through one non-transactional pipeline, so a batch of
+        ticks costs one network round-trip instead of one per event.
+        """
+        if not events:
+            return []
+        if not self._redis:
+            await self.connect()
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                stream_name, event_data = self._encode_event(event)
+                pipe.xadd(
+                    stream_name,
+                    event_data,
+                    maxlen=self.max_stream_length,
+                    approximate=True,
+                )
+            message_ids = await pipe.execute()
+        
+        logger.debug(f"Published batch of {len(events)} events")
+        return message_ids
     
     # Mapping of short aliases to EventType values
     EVENT_TYPE_ALIASES = {
         "tick": EventType.TICK_RECEIVED,
         "candle": EventType.CANDLE_FORMED,
         "indicator": EventType.INDICATOR_UPDATED,
+        "indicator_batch": EventType.INDICATORS_BATCH_UPDATED,
         "signal": EventType.SIGNAL_GENERATED,
         "order_filled": EventType.ORDER_FILLED,
         "order_placed": EventType.ORDER_PLACED,
@@ -535,46 +693,50 @@ class EventBus:
             if "BUSYGROUP" not in str(e):
                 raise
     
-    async def _process_message(
+    async def _dispatch(
         self,
         stream_name: str,
-        message_id: str,
-        message_data: Dict[str, str],
+        event: BaseEvent,
         subscriptions: List[Subscription],
     ) -> None:
-        """Process a single message from a stream."""
-        try:
-            # Deserialize event
-            event_json = message_data.get("data")
-            event_type_str = message_data.get("event_type")
-            
-            if not event_json or not event_type_str:
-                logger.warning(f"Invalid message format: {message_id}")
-                return
-            
-            # Parse event
-            event_data = json.loads(event_json)
-            event = BaseEvent.model_validate(event_data)
-            
-            # Call handlers
-            for sub in subscriptions:
-                # Check priority filter
-                if sub.priority_filter and event.priority > sub.priority_filter:
-                    continue
-                
-                try:
-                    await sub.handler(event)
-                except Exception as e:
-                    logger.error(f"Handler error for {event.event_type}: {e}")
+        """Run all matching handlers for an event, recording latency and lag."""
+        stats = self._stream_stats.setdefault(stream_name, StreamStats())
+        clock = time.perf_counter
+        timestamp = event.timestamp
+        
+        for sub in subscriptions:
+            # Check priority filter
+            if sub.priority_filter and event.priority > sub.priority_filter:
+                continue
             
-            # Acknowledge message
-            await self._redis.xack(stream_name, self.consumer_group, message_id)
+            name = getattr(sub.handler, "__qualname__", repr(sub.handler))
+            handler_stats = stats.handlers.get(name)
+            if handler_stats is None:
+                handler_stats = stats.handlers[name] = HandlerStats()
             
-        except Exception as e:
-            logger.error(f"Error processing message {message_id}: {e}")
+            lag_ms = 0.0
+            if timestamp.tzinfo is not None:
+                lag_ms = (datetime.now(timezone.utc) - timestamp).total_seconds() * 1000
+            start = clock()
+            failed = False
+            try:
+                await sub.handler(event)
+            except Exception as e:
+                failed = True
+                logger.error(f"Handler error for {event.event_type}: {e}")
+            handler_stats.record((clock() - start) * 1000, lag_ms, failed)
     
     async def _consume_stream(self, event_type: EventType) -> None:
-        """Consume events from a specific stream."""
+        """
+        Consume events from a specific stream.
+        
+        Reads ``consumer_batch_size`` messages per XREADGROUP and acknowledges
+        everything handled since the previous read with a single XACK. With
+        ``consumer_concurrency`` above 1, up to that many messages are
+        handled at once; messages for the same instrument are chained so
+        per-instrument ordering (ticks -> candles) is preserved, and a slow
+        handler only holds up its own instrument.
+        """
         stream_name = self._get_stream_name(event_type)
         subscriptions = self._subscriptions.get(event_type, [])
         
@@ -584,34 +746,105 @@ class EventBus:
         # Ensure consumer group exists
         await self._ensure_consumer_group(stream_name, self.consumer_group)
         
-        logger.info(f"Starting consumer for {self._get_enum_value(event_type)}")
+        logger.info(
+            f"Starting consumer for {self._get_enum_value(event_type)} "
+            f"(batch={self.consumer_batch_size}, concurrency={self.consumer_concurrency})"
+        )
+        
+        stats = self._stream_stats.setdefault(stream_name, StreamStats())
+        acks: List[str] = []
+        semaphore = asyncio.Semaphore(self.consumer_concurrency)
+        in_flight: Dict[str, asyncio.Task] = {}  # last task per ordering key
         
-        while self._running:
+        async def handle(
+            message_id: str,
+            event: BaseEvent,
+            previous: Optional[asyncio.Task],
+        ) -> None:
             try:
-                # Read from consumer group
-                messages = await self._redis.xreadgroup(
-                    groupname=self.consumer_group,
-                    consumername=self.consumer_name,
-                    streams={stream_name: ">"},
-                    count=10,
-                    block=1000,  # Block for 1 second
-                )
-                
-                if messages:
-                    for stream, stream_messages in messages:
+                if previous is not None:
+                    try:
+                        await asyncio.shield(previous)
+                    except Exception:
+                        pass  # Already logged; don't block this instrument
+                await self._dispatch(stream_name, event, subscriptions)
+                acks.append(message_id)
+            finally:
+                stats.in_flight -= 1
+                semaphore.release()
+        
+        try:
+            while self._running:
+                try:
+                    # Read from consumer group
+                    messages = await self._redis.xreadgroup(
+                        groupname=self.consumer_group,
+                        consumername=self.consumer_name,
+                        streams={stream_name: ">"},
+                        count=self.consumer_batch_size,
+                        block=1000,  # Block for 1 second
+                    )
+                    
+                    for _stream, stream_messages in messages or []:
+                        stats.read += len(stream_messages)
                         for message_id, message_data in stream_messages:
-                            await self._process_message(
-                                stream_name,
-                                message_id,
-                                message_data,
-                                subscriptions,
-                            )
+                            try:
+                                event = self._decode_event(message_data)
+                            except Exception as e:
+                                stats.decode_errors += 1
+                                logger.error(f"Error decoding message {message_id}: {e}")
+                                continue
                             
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Consumer error for {self._get_enum_value(event_type)}: {e}")
-                await asyncio.sleep(1)
+                            await semaphore.acquire()
+                            stats.in_flight += 1
+                            
+                            if self.consumer_concurrency == 1:
+                                await handle(message_id, event, None)
+                                continue
+                            
+                            key = getattr(event, "instrument_id", None) or message_id
+                            task = asyncio.create_task(handle(message_id, event, in_flight.get(key)))
+                            in_flight[key] = task
+                            task.add_done_callback(
+                                lambda t, k=key: in_flight.pop(k, None) if in_flight.get(k) is t else None
+                            )
+                    
+                    await self._flush_acks(stream_name, acks, stats)
+                    
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error(f"Consumer error for {self._get_enum_value(event_type)}: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            # Let in-flight handlers finish, then acknowledge them
+            if in_flight:
+                await asyncio.gather(*in_flight.values(), return_exceptions=True)
+            if acks and self._redis:
+                try:
+                    await self._flush_acks(stream_name, acks, stats)
+                except Exception as e:
+                    logger.warning(f"Final XACK failed for {stream_name}: {e}")
+    
+    async def _flush_acks(self, stream_name: str, acks: List[str], stats: StreamStats) -> None:
+        """Acknowledge all handled messages with one XACK."""
+        if not acks:
+            return
+        ids = acks[:]
+        acks.clear()
+        await self._redis.xack(stream_name, self.consumer_group, *ids)
+        stats.acked += len(ids)
+    
+    def get_consumer_metrics(self) -> Dict[str, Any]:
+        """
+        Per-stream consumer metrics.
+        
+        For each stream: messages read/acked/in flight, and per handler the
+        call count, errors, average/max latency, and lag (time between the
+        event timestamp and the handler starting). A handler whose lag keeps
+        growing is the bottleneck for that stream.
+        """
+        return {stream: st.to_dict() for stream, st in self._stream_stats.items()}
     
     async def start_consuming(self) -> None:
         """Start consuming events from all subscribed streams."""
@@ -652,10 +885,8 @@ class EventBus:
         events = []
         for message_id, message_data in messages:
             try:
-                event_json = message_data.get("data")
-                if event_json:
-                    event_data = json.loads(event_json)
-                    events.append(BaseEvent.model_validate(event_data))
+                if message_data.get("data"):
+                    events.append(self._decode_event(message_data))
             except Exception as e:
                 logger.warning(f"Failed to replay event {message_id}: {e}")
         
@@ -670,16 +901,405 @@ class EventBus:
         
         try:
             info = await self._redis.xinfo_stream(stream_name)
-            return {
+            result = {
                 "length": info.get("length", 0),
                 "first_entry": info.get("first-entry"),
                 "last_entry": info.get("last-entry"),
                 "groups": info.get("groups", 0),
             }
+            for group in await self._redis.xinfo_groups(stream_name):
+                if group.get("name") == self.consumer_group:
+                    result["pending"] = group.get("pending", 0)
+                    result["lag"] = group.get("lag")  # Redis >= 7
+            if stream_name in self._stream_stats:
+                result["consumer"] = self._stream_stats[stream_name].to_dict()
+            return result
         except redis.ResponseError:
             return {"length": 0, "exists": False}
 
 
+# =============================================================================
+# Batched Publishing
+# =============================================================================
+
+class BatchingPublisher:
+    """
+    Micro-batching publisher for high-rate events such as ticks.
+    
+    Events are buffered and flushed through ``EventBus.publish_many`` (one
+    Redis pipeline) when either ``max_batch`` events are pending or the
+    oldest pending event has waited ``window_ms``. Only one flush is in
+    flight at a time, so when Redis slows down batches simply grow.
+    
+    Backpressure: once ``max_pending`` events are buffered, the buffer is
+    conflated to the latest event per key (instrument for ticks). If that
+    is still not enough, the oldest events are dropped. Ingestion therefore
+    never blocks on Redis; drops are counted in ``get_stats()``.
+    
+    ``submit`` must be called on the event loop thread; feed callbacks that
+    run on other threads use ``submit_threadsafe``.
+    
+    Usage:
+        publisher = BatchingPublisher(event_bus, window_ms=5, max_batch=500)
+        await publisher.start()
+        publisher.submit(tick_event)
+        ...
+        await publisher.stop()  # flushes what is left
+    """
+    
+    def __init__(
+        self,
+        event_bus: EventBus,
+        window_ms: float = 5.0,
+        max_batch: int = 500,
+        max_pending: int = 20000,
+        key_func: Optional[Callable[[BaseEvent], str]] = None,
+        publish_many: Optional[Callable[[List[BaseEvent]], Coroutine[Any, Any, Any]]] = None,
+    ):
+        self._event_bus = event_bus
+        self._publish_many = publish_many or event_bus.publish_many
+        self._window = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._max_pending = max(max_pending, max_batch)
+        self._key_func = key_func or (lambda e: getattr(e, "instrument_id", e.event_id))
+        
+        self._pending: List[BaseEvent] = []
+        self._wakeup = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        
+        # Stats
+        self._published = 0
+        self._flushes = 0
+        self._conflated = 0
+        self._dropped = 0
+        self._errors = 0
+        self._max_batch_seen = 0
+        self._last_flush_ms = 0.0
+    
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be flushed."""
+        return len(self._pending)
+    
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+    
+    async def stop(self) -> None:
+        """Stop the flush loop and publish anything still buffered."""
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._pending:
+            await self._flush()
+    
+    def submit(self, event: BaseEvent) -> None:
+        """Buffer an event for the next flush (non-blocking)."""
+        pending = self._pending
+        pending.append(event)
+        if len(pending) >= self._max_pending:
+            self._relieve_pressure()
+        if len(pending) >= self._max_batch:
+            self._wakeup.set()
+        elif len(pending) == 1:
+            # First event of a window: wake the loop so it starts the timer
+            self._wakeup.set()
+    
+    def submit_threadsafe(self, event: BaseEvent) -> None:
+        """Buffer an event from a non-event-loop thread."""
+        if self._loop is None:
+            logger.warning("BatchingPublisher not started, dropping event")
+            self._dropped += 1
+            return
+        self._loop.call_soon_threadsafe(self.submit, event)
+    
+    def _relieve_pressure(self) -> None:
+        """Conflate to the latest event per key, then drop oldest if needed."""
+        before = len(self._pending)
+        latest: Dict[str, BaseEvent] = {}
+        key_func = self._key_func
+        for event in self._pending:
+            key = key_func(event)
+            latest.pop(key, None)  # re-insert so order follows last update
+            latest[key] = event
+        conflated = list(latest.values())
+        self._conflated += before - len(conflated)
+        
+        # Leave room for new events so we don't conflate on every submit
+        keep = self._max_pending // 2
+        if len(conflated) > keep:
+            self._dropped += len(conflated) - keep
+            conflated = conflated[-keep:]
+        
+        self._pending = conflated
+        logger.warning(
+            f"Publish backpressure: {before} events buffered, "
+            f"conflated/dropped to {len(conflated)}"
+        )
+    
+    async def _flush_loop(self) -> None:
+        """Wait for events, hold them for at most one window, then flush."""
+        while self._running:
+            try:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                if not self._pending:
+                    continue
+                
+                if len(self._pending) < self._max_batch and self._running:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self._window)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                
+                await self._flush()
+                if self._pending:
+                    self._wakeup.set()
+                    
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Batch publisher error: {e}")
+                await asyncio.sleep(0.1)
+    
+    async def _flush(self) -> None:
+        """Publish up to ``max_batch`` buffered events in one pipeline."""
+        if not self._pending:
+            return
+        batch = self._pending[:self._max_batch]
+        del self._pending[:len(batch)]
+        
+        start = asyncio.get_running_loop().time()
+        try:
+            await self._publish_many(batch)
+            self._published += len(batch)
+        except Exception as e:
+            self._errors += 1
+            self._dropped += len(batch)
+            logger.error(f"Failed to publish batch of {len(batch)} events: {e}")
+        
+        self._flushes += 1
+        self._max_batch_seen = max(self._max_batch_seen, len(batch))
+        self._last_flush_ms = (asyncio.get_running_loop().time() - start) * 1000
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get publisher statistics."""
+        return {
+            "pending": len(self._pending),
+            "published": self._published,
+            "flushes": self._flushes,
+            "avg_batch": round(self._published / self._flushes, 1) if self._flushes else 0.0,
+            "max_batch": self._max_batch_seen,
+            "last_flush_ms": round(self._last_flush_ms, 3),
+            "conflated": self._conflated,
+            "dropped": self._dropped,
+            "errors": self._errors,
+        }
+
+
+# =============================================================================
+# In-Process Event Bus
+# =============================================================================
+
+class InProcessEventBus(EventBus):
+    """
+    Event bus for single-node deployments where every service runs in the
+    same process (``app/main.py``).
+    
+    Same ``publish``/``subscribe`` API as ``EventBus``, but events are
+    handed to subscribers as Python objects through one asyncio queue per
+    event type: no JSON, no Redis round-trip on the hot path. Each queue is
+    drained in order by its own consumer task.
+    
+    With ``mirror_to_redis`` every event is also written to the usual Redis
+    stream in the background (micro-batched via ``BatchingPublisher``), so
+    ``replay_events`` and external consumers keep working. Redis is never
+    read back for delivery, so events are not handled twice.
+    """
+    
+    is_remote = False
+    
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        mirror_to_redis: bool = True,
+        queue_size: int = 100000,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            redis_url: Redis URL used for mirroring/replay
+            mirror_to_redis: Copy events to Redis streams asynchronously
+            queue_size: Max queued events per event type before publishers wait
+            **kwargs: Passed through to ``EventBus``
+        """
+        super().__init__(redis_url=redis_url, **kwargs)
+        self.mirror_to_redis = mirror_to_redis
+        self._queue_size = queue_size
+        self._queues: Dict[EventType, asyncio.Queue] = {}
+        self._mirror: Optional[BatchingPublisher] = None
+    
+    async def connect(self) -> None:
+        """Connect the Redis mirror (no-op when mirroring is off)."""
+        if not self.mirror_to_redis or self._redis is not None:
+            return
+        await super().connect()
+        redis_settings = settings.redis
+        self._mirror = BatchingPublisher(
+            self,
+            window_ms=redis_settings.tick_batch_window_ms,
+            max_batch=redis_settings.tick_batch_max_events,
+            max_pending=redis_settings.tick_batch_max_pending,
+            key_func=self._mirror_key,
+            publish_many=super().publish_many,
+        )
+        await self._mirror.start()
+    
+    @staticmethod
+    def _mirror_key(event: BaseEvent) -> str:
+        """Conflation key for the mirror: only ticks collapse per instrument.
+        
+        The mirror is the durable copy used for replay, so order, trade and
+        position events must never be conflated away under backpressure.
+        """
+        if event.event_type == EventType.TICK_RECEIVED:
+            return getattr(event, "instrument_id", event.event_id)
+        return event.event_id
+    
+    async def disconnect(self) -> None:
+        """Stop local consumers, flush the mirror and disconnect from Redis."""
+        self._running = False
+        for task in self._consumer_tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._consumer_tasks.clear()
+        
+        if self._mirror:
+            await self._mirror.stop()
+            self._mirror = None
+        await super().disconnect()
+    
+    def _get_queue(self, event_type: EventType) -> asyncio.Queue:
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = self._queues[event_type] = asyncio.Queue(maxsize=self._queue_size)
+        return queue
+    
+    async def publish(
+        self,
+        event: Union[BaseEvent, str],
+        data: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Hand an event to local subscribers (and the Redis mirror).
+        
+        Returns:
+            The event ID (there is no stream message ID on this path)
+        """
+        if isinstance(event, str):
+            event_type = self._resolve_event_type(event)
+            if event_type is None:
+                logger.warning(f"Unknown event type for publish: {event}")
+                return ""
+            event = BaseEvent(event_type=event_type, metadata=data or {})
+        
+        event_type = EventType(event.event_type)
+        if event_type in self._subscriptions:
+            queue = self._get_queue(event_type)
+            if self._running:
+                await queue.put(event)  # Backpressure on slow subscribers
+            elif not queue.full():
+                queue.put_nowait(event)  # Buffered until start_consuming()
+            else:
+                logger.warning(f"In-process queue full before start, dropping {event.event_type}")
+        
+        if self._mirror:
+            self._mirror.submit(event)
+        
+        return event.event_id
+    
+    async def subscribe(
+        self,
+        event_type: Union[EventType, str],
+        handler: EventHandler,
+        consumer_group: Optional[str] = None,
+        priority_filter: Optional[EventPriority] = None,
+    ) -> None:
+        """
+        Subscribe to an event type.
+        
+        A type first subscribed after ``start_consuming()`` gets its consumer
+        task right away; otherwise its bounded queue would never be drained
+        and publishers of that type would block once it filled.
+        """
+        known = set(self._subscriptions)
+        await super().subscribe(event_type, handler, consumer_group, priority_filter)
+        if not self._running:
+            return
+        for new_type in self._subscriptions.keys() - known:
+            self._consumer_tasks.append(asyncio.create_task(self._consume_stream(new_type)))
+    
+    async def publish_many(self, events: List[BaseEvent]) -> List[str]:
+        """Publish multiple events locally."""
+        return [await self.publish(event) for event in events]
+    
+    async def _consume_stream(self, event_type: EventType) -> None:
+        """Deliver queued events of one type to its subscribers, in order."""
+        queue = self._get_queue(event_type)
+        stream_name = self._get_stream_name(event_type)
+        stats = self._stream_stats.setdefault(stream_name, StreamStats())
+        
+        logger.info(f"Starting in-process consumer for {self._get_enum_value(event_type)}")
+        
+        while self._running:
+            try:
+                event = await queue.get()
+                stats.read += 1
+                # Re-read subscriptions so late subscribers are picked up
+                await self._dispatch(stream_name, event, self._subscriptions.get(event_type, []))
+                stats.acked += 1
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"In-process consumer error for {self._get_enum_value(event_type)}: {e}")
+    
+    async def start_consuming(self) -> None:
+        """Start one local consumer task per subscribed event type."""
+        await self.connect()
+        self._running = True
+        
+        for event_type in self._subscriptions.keys():
+            task = asyncio.create_task(self._consume_stream(event_type))
+            self._consumer_tasks.append(task)
+        
+        logger.info(f"In-process event bus started with {len(self._consumer_tasks)} consumers")
+    
+    async def replay_events(self, event_type: EventType, *args: Any, **kwargs: Any) -> List[BaseEvent]:
+        """Replay from the Redis mirror (empty when mirroring is off)."""
+        if not self.mirror_to_redis:
+            return []
+        return await super().replay_events(event_type, *args, **kwargs)
+    
+    def get_mirror_stats(self) -> Optional[Dict[str, Any]]:
+        """Statistics of the background Redis mirror."""
+        return self._mirror.get_stats() if self._mirror else None
+
+
 # =============================================================================
 # Global Event Bus Instance
 # =============================================================================
@@ -687,6 +1307,13 @@ class EventBus:
 _event_bus: Optional[EventBus] = None
 
 
+def _create_event_bus() -> EventBus:
+    """Create the event bus backend selected by settings.EVENT_BUS_BACKEND."""
+    if settings.EVENT_BUS_BACKEND == "inprocess":
+        return InProcessEventBus(mirror_to_redis=settings.EVENT_BUS_MIRROR_TO_REDIS)
+    return EventBus()
+
+
 def get_event_bus_sync() -> EventBus:
     """
     Get or create the global event bus instance synchronously.
@@ -696,7 +1323,7 @@ def get_event_bus_sync() -> EventBus:
     """
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus()
+        _event_bus = _create_event_bus()
     return _event_bus
 
 
@@ -704,7 +1331,7 @@ async def get_event_bus() -> EventBus:
     """Get or create the global event bus instance with connection."""
     global _event_bus
     if _event_bus is None:
-        _event_bus = EventBus()
+        _event_bus = _create_event_bus()
         await _event_bus.connect()
     elif _event_bus._redis is None:
         await _event_bus.connect()
@@ -754,11 +1381,14 @@ __all__ = [
     
     # Base Event
     "BaseEvent",
+    "EVENT_MODEL_REGISTRY",
+    "register_event_model",
     
     # Specific Events
     "TickEvent",
     "CandleEvent",
     "IndicatorEvent",
+    "IndicatorBatchEvent",
     "SignalEvent",
     "OrderEvent",
     "TradeEvent",
@@ -769,6 +1399,10 @@ __all__ = [
     
     # Event Bus
     "EventBus",
+    "HandlerStats",
+    "StreamStats",
+    "InProcessEventBus",
+    "BatchingPublisher",
     "get_event_bus",
     "get_event_bus_sync",
     "shutdown_event_bus",
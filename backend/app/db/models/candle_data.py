@@ -1,13 +1,25 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, BigInteger, Index, MetaData
+from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import func
-from app.db.base import Base
+from app.db.base import convention
+
+
+class Base(DeclarativeBase):
+    """Own metadata for the symbol-keyed indicator tables.
+    
+    app.db.models.timeseries.CandleData maps candle_data with the
+    instrument-keyed schema on the shared Base, so this legacy schema
+    cannot be registered there as well.
+    """
+    metadata = MetaData(naming_convention=convention)
+
 
 class CandleData(Base):
     """Store OHLCV candle data with pre-computed indicators"""
     __tablename__ = "candle_data"
     
-    # Primary key
-    id = Column(BigInteger, primary_key=True, index=True)
+    # Primary key (INTEGER on SQLite, the only type it auto-increments)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, index=True)
     
     # Candle identification
     symbol = Column(String(50), nullable=False, index=True)
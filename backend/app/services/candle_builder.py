@@ -8,16 +8,18 @@ Features:
 - Multi-timeframe support (1m, 5m, 15m, 1h, 1D)
 - Proper market hour alignment
 - Event bus integration for publishing completed candles
+- Wall-clock close of due candles, so illiquid symbols don't stall
+- Columnar (NumPy) builder for large multi-symbol universes
 """
 
 import asyncio
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, date, time, timedelta, timezone
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Set
 from enum import Enum
-import copy
 
+import numpy as np
 from loguru import logger
 
 from app.core.config import settings
@@ -41,7 +43,7 @@ class Timeframe(str, Enum):
     D1 = "1D"
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """OHLCV candle data structure."""
     symbol: str
@@ -62,9 +64,10 @@ class Candle:
             self.open = price
             self.high = price
             self.low = price
-        else:
-            self.high = max(self.high, price)
-            self.low = min(self.low, price)
+        elif price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
         
         self.close = price
         self.volume += volume
@@ -104,7 +107,7 @@ class Candle:
     
     def copy(self) -> "Candle":
         """Create a copy of this candle."""
-        return copy.deepcopy(self)
+        return replace(self)
 
 
 def get_candle_start_time(dt: datetime, timeframe: Timeframe) -> datetime:
@@ -139,7 +142,7 @@ def get_candle_start_time(dt: datetime, timeframe: Timeframe) -> datetime:
     elif timeframe == Timeframe.D1:
         # Daily candle starts at market open (09:15 IST)
         market_open = time(9, 15)
-        return datetime.combine(dt.date(), market_open)
+        return datetime.combine(dt.date(), market_open, tzinfo=dt.tzinfo)
     
     return dt
 
@@ -165,7 +168,9 @@ class CandleBuilder:
     """
     Builds candles from tick data for a single symbol.
     
-    Maintains candles for multiple timeframes simultaneously.
+    Maintains candles for multiple timeframes simultaneously. The end of
+    every open candle is computed once when it opens, so a tick inside the
+    current minute is a single comparison plus an in-place update.
     """
     
     def __init__(
@@ -184,14 +189,20 @@ class CandleBuilder:
         """
         self.symbol = symbol
         self.timeframes = timeframes or list(Timeframe)
+        self._higher_timeframes = [tf for tf in self.timeframes if tf != Timeframe.M1]
         self._on_candle_complete = on_candle_complete
         
-        # Current candles by timeframe
+        # Current candles and their end times by timeframe
         self._current_candles: Dict[Timeframe, Candle] = {}
+        self._candle_end: Dict[Timeframe, datetime] = {}
         
-        # History for building higher timeframes
-        self._m1_history: List[Candle] = []
+        # History for building higher timeframes (ring buffer)
         self._max_history = 60  # Keep last 60 1m candles for building hourly
+        self._m1_history: Deque[Candle] = deque(maxlen=self._max_history)
+        
+        # End of the last closed candle per timeframe. Ticks stamped before
+        # it (arriving after a timer close) roll into the next candle.
+        self._closed_until: Dict[Timeframe, datetime] = {}
         
         # Stats
         self._tick_count = 0
@@ -208,36 +219,92 @@ class CandleBuilder:
             List of completed candles (if any).
         """
         self._tick_count += 1
-        completed_candles: List[Candle] = []
         
         tick_time = tick.timestamp
         if tick_time.tzinfo is None:
             tick_time = tick_time.replace(tzinfo=timezone.utc)
         
+        # Fast path: tick inside the open 1m candle (late ticks fold in too)
+        current = self._current_candles.get(Timeframe.M1)
+        if current is not None and tick_time < self._candle_end[Timeframe.M1]:
+            current.update_with_tick(tick.ltp, tick.volume, tick.oi)
+            return []
+        
         # Process 1-minute candle from ticks
         completed_1m = await self._process_tick_to_candle(
             tick, Timeframe.M1, tick_time
         )
         if completed_1m:
-            completed_candles.append(completed_1m)
-            
-            # Store in history for higher timeframes
-            self._m1_history.append(completed_1m)
-            if len(self._m1_history) > self._max_history:
-                self._m1_history.pop(0)
+            return [completed_1m, *await self._roll_up(completed_1m)]
+        
+        return []
+    
+    async def close_due(self, now: datetime) -> List[Candle]:
+        """
+        Close candles whose period has ended by ``now``.
+        
+        Lets a candle complete at its boundary instead of waiting for the
+        symbol's next tick.
+        
+        Args:
+            now: Wall-clock time (timezone-aware)
             
-            # Build higher timeframes from 1m candles
-            for tf in self.timeframes:
-                if tf == Timeframe.M1:
-                    continue
-                
-                completed = await self._check_higher_timeframe(tf, completed_1m)
-                if completed:
-                    completed_candles.append(completed)
-        else:
-            # Update 1m candle with tick
-            candle = self._get_or_create_candle(Timeframe.M1, tick_time)
-            candle.update_with_tick(tick.ltp, tick.volume, tick.oi)
+        Returns:
+            List of completed candles.
+        """
+        completed_candles: List[Candle] = []
+        
+        if self._is_due(Timeframe.M1, now):
+            current = self._current_candles.pop(Timeframe.M1)
+            completed_candles.append(await self._complete(current))
+            completed_candles.extend(await self._roll_up(current))
+        
+        # Higher timeframes whose last 1m candles never traded
+        for tf in self._higher_timeframes:
+            if self._is_due(tf, now):
+                current = self._current_candles.pop(tf)
+                completed_candles.append(await self._complete(current))
+        
+        return completed_candles
+    
+    def _is_due(self, timeframe: Timeframe, now: datetime) -> bool:
+        candle = self._current_candles.get(timeframe)
+        return (
+            candle is not None
+            and candle.tick_count > 0
+            and self._candle_end[timeframe] <= now
+        )
+    
+    def _open_candle(self, timeframe: Timeframe, start: datetime) -> Candle:
+        """Start a new candle and precompute its end."""
+        candle = Candle(symbol=self.symbol, timeframe=timeframe, timestamp=start)
+        self._current_candles[timeframe] = candle
+        self._candle_end[timeframe] = get_next_candle_time(start, timeframe)
+        return candle
+    
+    async def _complete(self, candle: Candle) -> Candle:
+        """Mark a candle complete and notify the callback."""
+        candle.is_complete = True
+        self._candle_count += 1
+        self._closed_until[candle.timeframe] = self._candle_end[candle.timeframe]
+        
+        if self._on_candle_complete:
+            await self._on_candle_complete(candle)
+        
+        return candle
+    
+    async def _roll_up(self, completed_1m: Candle) -> List[Candle]:
+        """Feed a completed 1m candle into the higher timeframes."""
+        completed_candles: List[Candle] = []
+        
+        # Store in history for higher timeframes
+        self._m1_history.append(completed_1m)
+        
+        m1_end = self._closed_until[Timeframe.M1]
+        for tf in self._higher_timeframes:
+            completed_candles.extend(
+                await self._check_higher_timeframe(tf, completed_1m, m1_end)
+            )
         
         return completed_candles
     
@@ -248,93 +315,70 @@ class CandleBuilder:
         tick_time: datetime,
     ) -> Optional[Candle]:
         """Process tick for a specific timeframe."""
-        candle_start = get_candle_start_time(tick_time, timeframe)
-        next_candle = get_next_candle_time(candle_start, timeframe)
-        
         current = self._current_candles.get(timeframe)
+        if current is not None and tick_time < self._candle_end[timeframe]:
+            current.update_with_tick(tick.ltp, tick.volume, tick.oi)
+            return None
         
-        # Check if we've moved to a new candle period
-        if current and tick_time >= next_candle:
-            # Complete current candle
-            current.is_complete = True
-            self._candle_count += 1
-            
-            # Callback
-            if self._on_candle_complete:
-                await self._on_candle_complete(current)
-            
-            # Start new candle
-            new_candle_start = get_candle_start_time(tick_time, timeframe)
-            self._current_candles[timeframe] = Candle(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                timestamp=new_candle_start,
-            )
-            self._current_candles[timeframe].update_with_tick(
-                tick.ltp, tick.volume, tick.oi
-            )
-            
-            return current
-        
-        # Update current candle
-        if not current:
-            self._current_candles[timeframe] = Candle(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                timestamp=candle_start,
-            )
+        candle_start = get_candle_start_time(tick_time, timeframe)
+        closed_until = self._closed_until.get(timeframe)
+        if closed_until and candle_start < closed_until:
+            candle_start = closed_until
+        
+        # Moved to a new candle period: complete the current candle
+        if current is not None:
+            await self._complete(current)
         
-        self._current_candles[timeframe].update_with_tick(
+        self._open_candle(timeframe, candle_start).update_with_tick(
             tick.ltp, tick.volume, tick.oi
         )
         
-        return None
+        return current
     
     async def _check_higher_timeframe(
         self,
         timeframe: Timeframe,
         completed_1m: Candle,
-    ) -> Optional[Candle]:
-        """Check if a higher timeframe candle should complete."""
-        candle_start = get_candle_start_time(completed_1m.timestamp, timeframe)
-        next_candle = get_next_candle_time(candle_start, timeframe)
+        m1_end: datetime,
+    ) -> List[Candle]:
+        """Merge a 1m candle into a higher timeframe, completing it if due."""
+        completed_candles: List[Candle] = []
         
-        # Get or create higher timeframe candle
-        current = self._current_candles.get(timeframe)
+        stale = self._merge_1m(timeframe, completed_1m)
+        if stale is not None:
+            completed_candles.append(await self._complete(stale))
         
-        if current is None:
-            current = Candle(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                timestamp=candle_start,
+        # A higher TF candle completes when the 1m candle that just completed
+        # is the last one of that period
+        if m1_end >= self._candle_end[timeframe]:
+            completed_candles.append(
+                await self._complete(self._current_candles.pop(timeframe))
             )
-            self._current_candles[timeframe] = current
         
-        # Merge 1m candle
-        current.merge_candle(completed_1m)
+        return completed_candles
+    
+    def _merge_1m(self, timeframe: Timeframe, candle_1m: Candle) -> Optional[Candle]:
+        """
+        Merge a 1m candle into the open candle of a higher timeframe.
         
-        # Check if period complete
-        # A higher TF candle completes when the 1m candle that just completed
-        # is the last one of that period
-        next_1m = get_next_candle_time(completed_1m.timestamp, Timeframe.M1)
-        if next_1m >= next_candle:
-            current.is_complete = True
-            self._candle_count += 1
-            
-            # Callback
-            if self._on_candle_complete:
-                await self._on_candle_complete(current)
-            
-            # Start new candle
-            self._current_candles[timeframe] = Candle(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                timestamp=next_candle,
+        Returns the previous open candle if a gap in 1m candles skipped past
+        its end; the caller completes it.
+        """
+        stale = None
+        current = self._current_candles.get(timeframe)
+        if current is not None and candle_1m.timestamp >= self._candle_end[timeframe]:
+            del self._current_candles[timeframe]
+            if current.tick_count > 0:
+                stale = current
+            current = None
+        
+        if current is None:
+            current = self._open_candle(
+                timeframe, get_candle_start_time(candle_1m.timestamp, timeframe)
             )
-            
-            return current
         
-        return None
+        current.merge_candle(candle_1m)
+        return stale
     
     def _get_or_create_candle(
         self,
@@ -343,12 +387,7 @@ class CandleBuilder:
     ) -> Candle:
         """Get current candle or create new one."""
         if timeframe not in self._current_candles:
-            candle_start = get_candle_start_time(tick_time, timeframe)
-            self._current_candles[timeframe] = Candle(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                timestamp=candle_start,
-            )
+            return self._open_candle(timeframe, get_candle_start_time(tick_time, timeframe))
         return self._current_candles[timeframe]
     
     def get_current_candle(self, timeframe: Timeframe) -> Optional[Candle]:
@@ -358,10 +397,24 @@ class CandleBuilder:
     def force_complete(self) -> List[Candle]:
         """Force complete all current candles (e.g., at market close)."""
         completed = []
-        for tf, candle in self._current_candles.items():
+        
+        # The open 1m candle has not been rolled into higher timeframes yet
+        current_1m = self._current_candles.get(Timeframe.M1)
+        if current_1m is not None and current_1m.tick_count > 0:
+            for tf in self._higher_timeframes:
+                stale = self._merge_1m(tf, current_1m)
+                if stale is not None:
+                    stale.is_complete = True
+                    completed.append(stale.copy())
+            self._current_candles.pop(Timeframe.M1)
+            current_1m.is_complete = True
+            completed.append(current_1m.copy())
+        
+        for tf, candle in list(self._current_candles.items()):
             if candle.tick_count > 0:
                 candle.is_complete = True
                 completed.append(candle.copy())
+            del self._current_candles[tf]
         return completed
     
     def get_stats(self) -> Dict[str, Any]:
@@ -377,6 +430,350 @@ class CandleBuilder:
         }
 
 
+# =============================================================================
+# Columnar Multi-Symbol Builder
+# =============================================================================
+
+# Timeframe lengths in seconds, for integer bucket arithmetic
+TIMEFRAME_SECONDS: Dict[Timeframe, int] = {
+    Timeframe.M1: 60,
+    Timeframe.M5: 300,
+    Timeframe.M15: 900,
+    Timeframe.M30: 1800,
+    Timeframe.H1: 3600,
+    Timeframe.D1: 86400,
+}
+
+# 09:15 IST expressed as seconds after UTC midnight (daily candles start here)
+SESSION_OPEN_UTC_SECONDS = 3 * 3600 + 45 * 60
+
+
+@dataclass
+class CandleBatch:
+    """Completed candles of one timeframe, one row per candle."""
+    timeframe: Timeframe
+    symbols: List[str]
+    start: np.ndarray       # int64 epoch seconds (candle open time)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray      # int64
+    oi: np.ndarray          # int64
+    tick_count: np.ndarray  # int64
+    
+    def __len__(self) -> int:
+        return len(self.symbols)
+    
+    def to_candles(self) -> List[Candle]:
+        """Materialize as Candle objects (for callbacks expecting Candle)."""
+        return [
+            Candle(
+                symbol=self.symbols[i],
+                timeframe=self.timeframe,
+                timestamp=datetime.fromtimestamp(int(self.start[i]), tz=timezone.utc),
+                open=float(self.open[i]),
+                high=float(self.high[i]),
+                low=float(self.low[i]),
+                close=float(self.close[i]),
+                volume=int(self.volume[i]),
+                oi=int(self.oi[i]),
+                tick_count=int(self.tick_count[i]),
+                is_complete=True,
+            )
+            for i in range(len(self.symbols))
+        ]
+
+
+class _ColumnarState:
+    """Open-candle state of every symbol slot for one timeframe."""
+    
+    __slots__ = ("timeframe", "period", "anchor", "start", "open", "high",
+                 "low", "close", "volume", "oi", "ticks")
+    
+    def __init__(self, timeframe: Timeframe, capacity: int):
+        self.timeframe = timeframe
+        self.period = TIMEFRAME_SECONDS[timeframe]
+        self.anchor = SESSION_OPEN_UTC_SECONDS if timeframe == Timeframe.D1 else 0
+        # start is also the floor for the next tick's bucket (-1: never used)
+        self.start = np.full(capacity, -1, dtype=np.int64)
+        self.open = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.low = np.zeros(capacity)
+        self.close = np.zeros(capacity)
+        self.volume = np.zeros(capacity, dtype=np.int64)
+        self.oi = np.zeros(capacity, dtype=np.int64)
+        self.ticks = np.zeros(capacity, dtype=np.int64)
+    
+    def grow(self, capacity: int) -> None:
+        for name in ("start", "open", "high", "low", "close", "volume", "oi", "ticks"):
+            old = getattr(self, name)
+            new = np.full(capacity, -1 if name == "start" else 0, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+
+class ColumnarCandleBuilder:
+    """
+    Builds candles for many symbols at once from NumPy state arrays.
+    
+    Each symbol gets a slot index; per timeframe the open candle of every
+    slot lives in flat arrays (start, OHLC, volume, OI, tick count). Bucket
+    boundaries are integer epoch arithmetic
+    (``start = ts - (ts - anchor) % period``) instead of ``datetime.replace``.
+    Ticks are ingested in batches with ``update_many``; all timeframes are
+    bucketed directly from ticks, which gives the same OHLCV as merging
+    1m candles. Completed candles come back as one ``CandleBatch`` per
+    timeframe.
+    
+    Intraday buckets are aligned to the epoch (same as
+    ``get_candle_start_time`` for UTC ticks); daily buckets start at
+    09:15 IST. A tick older than the open candle is folded into it.
+    """
+    
+    def __init__(
+        self,
+        timeframes: Optional[List[Timeframe]] = None,
+        capacity: int = 1024,
+    ):
+        self.timeframes = timeframes or list(Timeframe)
+        self._capacity = capacity
+        self._states = [_ColumnarState(tf, capacity) for tf in self.timeframes]
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        
+        # Stats
+        self._tick_count = 0
+        self._candle_count = 0
+    
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols in slot order."""
+        return self._symbols
+    
+    def slot(self, symbol: str) -> int:
+        """Get (or assign) the slot index of a symbol."""
+        idx = self._slots.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx >= self._capacity:
+                self._capacity *= 2
+                for state in self._states:
+                    state.grow(self._capacity)
+            self._slots[symbol] = idx
+            self._symbols.append(symbol)
+        return idx
+    
+    def update_many(
+        self,
+        slots: np.ndarray,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        ois: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> List[CandleBatch]:
+        """
+        Apply a batch of ticks.
+        
+        Args:
+            slots: Slot index per tick (from ``slot()``)
+            prices: Last traded price per tick
+            volumes: Volume to add per tick
+            ois: Open interest per tick
+            timestamps: Tick time as epoch seconds
+            
+        Returns:
+            Completed candles, one batch per timeframe that closed any.
+        """
+        n = len(slots)
+        if n == 0:
+            return []
+        self._tick_count += n
+        
+        slots = np.asarray(slots, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        # Group by slot, then time; equal times keep arrival order (stable)
+        order = np.lexsort((timestamps, slots))
+        s = slots[order]
+        p = np.asarray(prices, dtype=np.float64)[order]
+        v = np.asarray(volumes, dtype=np.int64)[order]
+        o = np.asarray(ois, dtype=np.int64)[order]
+        t = timestamps[order]
+        
+        slot_change = np.empty(n, dtype=bool)
+        slot_change[0] = True
+        np.not_equal(s[1:], s[:-1], out=slot_change[1:])
+        
+        completed = []
+        for state in self._states:
+            batch = self._apply(state, s, p, v, o, t, slot_change)
+            if batch is not None:
+                completed.append(batch)
+        return completed
+    
+    def _apply(
+        self,
+        st: _ColumnarState,
+        s: np.ndarray,
+        p: np.ndarray,
+        v: np.ndarray,
+        o: np.ndarray,
+        t: np.ndarray,
+        slot_change: np.ndarray,
+    ) -> Optional[CandleBatch]:
+        n = len(s)
+        bucket = t - (t - st.anchor) % st.period
+        # Ticks are sorted by time within a slot, so buckets never go
+        # backwards; late ticks are lifted into the open candle
+        np.maximum(bucket, st.start[s], out=bucket)
+        
+        # Segments: runs of ticks with the same (slot, bucket)
+        seg_start = slot_change.copy()
+        seg_start[1:] |= bucket[1:] != bucket[:-1]
+        idx = np.flatnonzero(seg_start)
+        last = np.empty_like(idx)
+        last[:-1] = idx[1:] - 1
+        last[-1] = n - 1
+        
+        seg_slot = s[idx]
+        seg_bucket = bucket[idx]
+        seg_open = p[idx]
+        seg_high = np.maximum.reduceat(p, idx)
+        seg_low = np.minimum.reduceat(p, idx)
+        seg_close = p[last]
+        seg_volume = np.add.reduceat(v, idx)
+        seg_oi = o[last]
+        seg_ticks = last - idx + 1
+        
+        first_seg = slot_change[idx]
+        last_seg = np.empty_like(first_seg)
+        last_seg[:-1] = first_seg[1:]
+        last_seg[-1] = True
+        
+        # First segment of each slot either continues the open candle or
+        # closes it
+        f = np.flatnonzero(first_seg)
+        f_slot = seg_slot[f]
+        has_open = st.ticks[f_slot] > 0
+        cont = has_open & (seg_bucket[f] == st.start[f_slot])
+        
+        c, c_slot = f[cont], f_slot[cont]
+        seg_open[c] = st.open[c_slot]
+        seg_high[c] = np.maximum(seg_high[c], st.high[c_slot])
+        seg_low[c] = np.minimum(seg_low[c], st.low[c_slot])
+        seg_volume[c] += st.volume[c_slot]
+        seg_ticks[c] += st.ticks[c_slot]
+        
+        closed_slots = f_slot[has_open & ~cont]
+        done = ~last_seg
+        
+        rows_slot = np.concatenate([closed_slots, seg_slot[done]])
+        batch = None
+        if len(rows_slot):
+            batch = CandleBatch(
+                timeframe=st.timeframe,
+                symbols=[self._symbols[i] for i in rows_slot],
+                start=np.concatenate([st.start[closed_slots], seg_bucket[done]]),
+                open=np.concatenate([st.open[closed_slots], seg_open[done]]),
+                high=np.concatenate([st.high[closed_slots], seg_high[done]]),
+                low=np.concatenate([st.low[closed_slots], seg_low[done]]),
+                close=np.concatenate([st.close[closed_slots], seg_close[done]]),
+                volume=np.concatenate([st.volume[closed_slots], seg_volume[done]]),
+                oi=np.concatenate([st.oi[closed_slots], seg_oi[done]]),
+                tick_count=np.concatenate([st.ticks[closed_slots], seg_ticks[done]]),
+            )
+            self._candle_count += len(rows_slot)
+        
+        # Last segment of each slot becomes the open candle
+        keep = last_seg
+        k_slot = seg_slot[keep]
+        st.start[k_slot] = seg_bucket[keep]
+        st.open[k_slot] = seg_open[keep]
+        st.high[k_slot] = seg_high[keep]
+        st.low[k_slot] = seg_low[keep]
+        st.close[k_slot] = seg_close[keep]
+        st.volume[k_slot] = seg_volume[keep]
+        st.oi[k_slot] = seg_oi[keep]
+        st.ticks[k_slot] = seg_ticks[keep]
+        
+        return batch
+    
+    def _take(self, st: _ColumnarState, rows: np.ndarray) -> CandleBatch:
+        """Emit the open candles of ``rows`` and reset them."""
+        batch = CandleBatch(
+            timeframe=st.timeframe,
+            symbols=[self._symbols[i] for i in rows],
+            start=st.start[rows].copy(),
+            open=st.open[rows].copy(),
+            high=st.high[rows].copy(),
+            low=st.low[rows].copy(),
+            close=st.close[rows].copy(),
+            volume=st.volume[rows].copy(),
+            oi=st.oi[rows].copy(),
+            tick_count=st.ticks[rows].copy(),
+        )
+        # Late ticks for a closed bucket roll into the next one
+        st.start[rows] += st.period
+        st.volume[rows] = 0
+        st.ticks[rows] = 0
+        self._candle_count += len(rows)
+        return batch
+    
+    def close_due(self, now: int) -> List[CandleBatch]:
+        """
+        Close every open candle whose period has ended by ``now``.
+        
+        Args:
+            now: Wall-clock time as epoch seconds
+        """
+        completed = []
+        for st in self._states:
+            n = len(self._symbols)
+            rows = np.flatnonzero((st.ticks[:n] > 0) & (st.start[:n] + st.period <= now))
+            if len(rows):
+                completed.append(self._take(st, rows))
+        return completed
+    
+    def force_complete(self) -> List[CandleBatch]:
+        """Close all open candles (e.g., at market close)."""
+        completed = []
+        for st in self._states:
+            rows = np.flatnonzero(st.ticks[:len(self._symbols)] > 0)
+            if len(rows):
+                completed.append(self._take(st, rows))
+        return completed
+    
+    def get_current_candle(self, symbol: str, timeframe: Timeframe) -> Optional[Candle]:
+        """Get the open candle of a symbol as a Candle object."""
+        idx = self._slots.get(symbol)
+        if idx is None or timeframe not in self.timeframes:
+            return None
+        st = self._states[self.timeframes.index(timeframe)]
+        if st.ticks[idx] == 0:
+            return None
+        return Candle(
+            symbol=symbol,
+            timeframe=timeframe,
+            timestamp=datetime.fromtimestamp(int(st.start[idx]), tz=timezone.utc),
+            open=float(st.open[idx]),
+            high=float(st.high[idx]),
+            low=float(st.low[idx]),
+            close=float(st.close[idx]),
+            volume=int(st.volume[idx]),
+            oi=int(st.oi[idx]),
+            tick_count=int(st.ticks[idx]),
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get builder statistics."""
+        return {
+            "symbol_count": len(self._symbols),
+            "capacity": self._capacity,
+            "tick_count": self._tick_count,
+            "candle_count": self._candle_count,
+        }
+
+
 class CandleBuilderService:
     """
     Service for managing multiple candle builders.
@@ -388,6 +785,10 @@ class CandleBuilderService:
         self,
         timeframes: List[Timeframe] = None,
         on_candle: Optional[Callable[[Candle], Coroutine[Any, Any, None]]] = None,
+        columnar: bool = False,
+        capacity: int = 1024,
+        close_on_timer: bool = True,
+        close_grace_ms: float = 250.0,
     ):
         """
         Initialize candle builder service.
@@ -395,6 +796,15 @@ class CandleBuilderService:
         Args:
             timeframes: Timeframes to build for all symbols
             on_candle: Optional callback for completed candles
+            columnar: Use one ColumnarCandleBuilder for all symbols instead
+                of a CandleBuilder per symbol. Ticks arriving in the same
+                event-loop burst are ingested together and completed candles
+                are published as one batch.
+            capacity: Initial symbol capacity of the columnar builder
+            close_on_timer: Close due candles of all symbols at every minute
+                boundary instead of waiting for each symbol's next tick
+            close_grace_ms: Delay after the boundary before the sweep, to
+                let ticks stamped just before it arrive
         """
         self.timeframes = timeframes or [
             Timeframe.M1,
@@ -407,6 +817,24 @@ class CandleBuilderService:
         # Builders by symbol
         self._builders: Dict[str, CandleBuilder] = {}
         
+        # Columnar mode: one builder for all symbols plus a tick buffer
+        self._columnar: Optional[ColumnarCandleBuilder] = None
+        if columnar:
+            self._columnar = ColumnarCandleBuilder(self.timeframes, capacity=capacity)
+        self._tick_buffer: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Wall-clock close scheduler
+        self._close_on_timer = close_on_timer
+        self._close_grace_ms = close_grace_ms
+        self._close_task: Optional[asyncio.Task] = None
+        self._sweep_stats = {
+            "sweeps": 0,
+            "candles_closed": 0,
+            "last_sweep_ms": 0.0,
+            "last_sweep_lag_ms": 0.0,
+        }
+        
         # Event bus
         self._event_bus: Optional[EventBus] = None
         
@@ -428,17 +856,31 @@ class CandleBuilderService:
         )
         
         self._running = True
+        if self._close_on_timer:
+            self._close_task = asyncio.create_task(self._close_loop())
         logger.info(f"✓ Candle builder service started (timeframes: {[tf.value for tf in self.timeframes]})")
     
     async def stop(self) -> None:
         """Stop the candle builder service."""
         self._running = False
         
+        if self._close_task:
+            self._close_task.cancel()
+            try:
+                await self._close_task
+            except asyncio.CancelledError:
+                pass
+            self._close_task = None
+        
         # Force complete all candles
+        if self._columnar:
+            await self._flush_ticks()
+            await self._publish_batches(self._columnar.force_complete())
+        
+        completed = []
         for builder in self._builders.values():
-            completed = builder.force_complete()
-            for candle in completed:
-                await self._publish_candle(candle)
+            completed.extend(builder.force_complete())
+        await self._publish_candles(completed)
         
         logger.info("Candle builder service stopped")
     
@@ -462,6 +904,10 @@ class CandleBuilderService:
         """Handle incoming tick event from event bus."""
         symbol = event.symbol
         
+        if self._columnar:
+            self._buffer_tick(symbol, event.ltp, event.volume or 0, event.oi or 0, event.timestamp)
+            return
+        
         # Auto-add builder if not exists
         if symbol not in self._builders:
             self.add_symbol(symbol)
@@ -495,6 +941,11 @@ class CandleBuilderService:
         Returns:
             List of completed candles.
         """
+        if self._columnar:
+            self._buffer_tick(symbol, tick.ltp, tick.volume, tick.oi, tick.timestamp)
+            batches = await self._flush_ticks()
+            return [candle for batch in batches for candle in batch.to_candles()]
+        
         if symbol not in self._builders:
             self.add_symbol(symbol)
         
@@ -505,27 +956,146 @@ class CandleBuilderService:
         
         return completed
     
+    def _buffer_tick(
+        self,
+        symbol: str,
+        ltp: float,
+        volume: int,
+        oi: int,
+        timestamp: datetime,
+    ) -> None:
+        """Queue a tick for the columnar builder and schedule a flush."""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        self._tick_buffer.append(
+            (self._columnar.slot(symbol), ltp, volume, oi, int(timestamp.timestamp()))
+        )
+        # Flush once the current burst of handler calls has been queued
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_ticks())
+    
+    async def _flush_ticks(self) -> List[CandleBatch]:
+        """Ingest buffered ticks into the columnar builder and publish closes."""
+        if not self._tick_buffer:
+            return []
+        buffer, self._tick_buffer = self._tick_buffer, []
+        slots, prices, volumes, ois, timestamps = zip(*buffer)
+        batches = self._columnar.update_many(
+            np.array(slots), np.array(prices), np.array(volumes),
+            np.array(ois), np.array(timestamps),
+        )
+        await self._publish_batches(batches)
+        return batches
+    
+    async def _publish_batches(self, batches: List[CandleBatch]) -> None:
+        """Publish completed columnar candles as one event burst."""
+        if not batches:
+            return
+        
+        if self._on_candle:
+            for batch in batches:
+                for candle in batch.to_candles():
+                    await self._on_candle(candle)
+        
+        if self._event_bus:
+            events = [
+                CandleEvent(
+                    event_type=EventType.CANDLE_FORMED,
+                    instrument_id=batch.symbols[i],
+                    symbol=batch.symbols[i],
+                    timeframe=batch.timeframe.value,
+                    open=float(batch.open[i]),
+                    high=float(batch.high[i]),
+                    low=float(batch.low[i]),
+                    close=float(batch.close[i]),
+                    volume=int(batch.volume[i]),
+                    is_complete=True,
+                )
+                for batch in batches
+                for i in range(len(batch))
+            ]
+            await self._event_bus.publish_many(events)
+    
+    async def _close_loop(self) -> None:
+        """Run a close sweep shortly after every minute boundary."""
+        grace = self._close_grace_ms / 1000
+        while self._running:
+            wall = datetime.now(timezone.utc).timestamp()
+            # Every supported timeframe (incl. 09:15 IST daily) ends on a minute
+            boundary = (int(wall - grace) // 60 + 1) * 60
+            await asyncio.sleep(max(0.0, boundary + grace - wall))
+            try:
+                await self.close_due(datetime.fromtimestamp(boundary, tz=timezone.utc))
+            except Exception as e:
+                logger.error(f"Candle close sweep failed: {e}")
+    
+    async def close_due(self, now: Optional[datetime] = None) -> List[Candle]:
+        """
+        Close every candle whose period has ended, across all symbols.
+        
+        Completed candles are published together as one CandleEvent burst.
+        
+        Args:
+            now: Sweep time (default: current time)
+            
+        Returns:
+            List of completed candles.
+        """
+        now = now or datetime.now(timezone.utc)
+        started = datetime.now(timezone.utc)
+        
+        if self._columnar:
+            await self._flush_ticks()
+            batches = self._columnar.close_due(int(now.timestamp()))
+            await self._publish_batches(batches)
+            completed = [candle for batch in batches for candle in batch.to_candles()]
+        else:
+            completed = []
+            for builder in self._builders.values():
+                completed.extend(await builder.close_due(now))
+            await self._publish_candles(completed)
+        
+        finished = datetime.now(timezone.utc)
+        self._sweep_stats["sweeps"] += 1
+        self._sweep_stats["candles_closed"] += len(completed)
+        self._sweep_stats["last_sweep_ms"] = (finished - started).total_seconds() * 1000
+        self._sweep_stats["last_sweep_lag_ms"] = (finished - now).total_seconds() * 1000
+        if completed:
+            logger.debug(f"Close sweep at {now:%H:%M:%S}: {len(completed)} candles")
+        
+        return completed
+    
     async def _on_candle_complete(self, candle: Candle) -> None:
         """Internal callback when candle completes."""
         if self._on_candle:
             await self._on_candle(candle)
     
+    @staticmethod
+    def _candle_event(candle: Candle) -> CandleEvent:
+        return CandleEvent(
+            event_type=EventType.CANDLE_FORMED,
+            instrument_id=candle.symbol,
+            symbol=candle.symbol,
+            timeframe=candle.timeframe.value,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume,
+            is_complete=candle.is_complete,
+        )
+    
     async def _publish_candle(self, candle: Candle) -> None:
         """Publish completed candle to event bus."""
         if self._event_bus:
-            event = CandleEvent(
-                event_type=EventType.CANDLE_FORMED,
-                instrument_id=candle.symbol,
-                symbol=candle.symbol,
-                timeframe=candle.timeframe.value,
-                open=candle.open,
-                high=candle.high,
-                low=candle.low,
-                close=candle.close,
-                volume=candle.volume,
-                is_complete=candle.is_complete,
+            await self._event_bus.publish(self._candle_event(candle))
+    
+    async def _publish_candles(self, candles: List[Candle]) -> None:
+        """Publish completed candles to event bus as one batch."""
+        if self._event_bus and candles:
+            await self._event_bus.publish_many(
+                [self._candle_event(candle) for candle in candles]
             )
-            await self._event_bus.publish(event)
     
     def get_current_candle(
         self,
@@ -533,6 +1103,8 @@ class CandleBuilderService:
         timeframe: Timeframe,
     ) -> Optional[Candle]:
         """Get current (incomplete) candle for a symbol and timeframe."""
+        if self._columnar:
+            return self._columnar.get_current_candle(symbol, timeframe)
         builder = self._builders.get(symbol)
         if builder:
             return builder.get_current_candle(timeframe)
@@ -540,10 +1112,19 @@ class CandleBuilderService:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get service statistics."""
+        if self._columnar:
+            return {
+                "running": self._running,
+                "mode": "columnar",
+                "timeframes": [tf.value for tf in self.timeframes],
+                "close_sweeps": dict(self._sweep_stats),
+                **self._columnar.get_stats(),
+            }
         return {
             "running": self._running,
             "symbol_count": len(self._builders),
             "timeframes": [tf.value for tf in self.timeframes],
+            "close_sweeps": dict(self._sweep_stats),
             "builders": {
                 symbol: builder.get_stats()
                 for symbol, builder in self._builders.items()
@@ -577,6 +1158,8 @@ __all__ = [
     "Candle",
     "CandleBuilder",
     "CandleBuilderService",
+    "CandleBatch",
+    "ColumnarCandleBuilder",
     "get_candle_start_time",
     "get_next_candle_time",
     "create_candle_builder_service",
@@ -1,15 +1,37 @@
 """
 Service for computing and storing indicators in database
 """
+import io
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Optional
-from sqlalchemy import select, and_
+from sqlalchemy import BigInteger, DateTime, Float, Integer, String, select, and_, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.candle_data import CandleData
+from app.utils import pg_copy
 from loguru import logger
 
+# Rows per COPY / INSERT in store_candles_with_indicators
+STORE_CHUNK_ROWS = 100_000
+# Timestamps per DELETE ... IN (...) when replacing rows without COPY (SQLite bind limit)
+DELETE_BATCH_ROWS = 500
+CANDLE_STAGING_TABLE = 'candle_staging'
+
+_COPY_KINDS = {String: 'text', DateTime: 'timestamptz', Float: 'float8', BigInteger: 'int8', Integer: 'int4'}
+_STAGING_SQL_TYPES = {
+    'text': 'TEXT', 'timestamptz': 'TIMESTAMPTZ', 'float8': 'DOUBLE PRECISION',
+    'int8': 'BIGINT', 'int4': 'INTEGER',
+}
+
+# candle_data columns written by store_candles_with_indicators, with their binary COPY types
+STORE_COLUMNS = [
+    (column.name, _COPY_KINDS[type(column.type)])
+    for column in CandleData.__table__.columns
+    if column.name not in ('id', 'created_at', 'updated_at')
+]
+
 
 class IndicatorComputationService:
     """Pre-compute and store all indicators for faster backtesting"""
@@ -330,96 +352,111 @@ class IndicatorComputationService:
         self,
         symbol: str,
         timeframe: str,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        chunk_size: int = STORE_CHUNK_ROWS
     ) -> int:
         """
         Compute indicators and store in database
         
+        Rows are written ``chunk_size`` at a time straight from the column
+        arrays. On PostgreSQL each chunk is binary-COPYed into a TEMP
+        staging table (one per connection, reused) and then replaces the
+        matching (symbol, timeframe, timestamp) rows of candle_data. The
+        table has no unique key on those columns, so this is a delete +
+        insert, not ON CONFLICT. Other databases (SQLite in development)
+        delete the chunk's matching rows and get one bulk INSERT per chunk.
+        
         Returns:
             Number of candles stored
         """
         # Compute all indicators
         df_with_indicators = self.compute_all_indicators(df.copy())
         
-        # Prepare records for bulk insert
-        records = []
-        for idx, row in df_with_indicators.iterrows():
-            record = CandleData(
-                symbol=symbol,
-                timeframe=timeframe,
-                timestamp=row.get('timestamp', idx),
-                open=row['open'],
-                high=row['high'],
-                low=row['low'],
-                close=row['close'],
-                volume=row['volume'],
-                # Moving averages
-                sma_9=row.get('sma_9'),
-                sma_20=row.get('sma_20'),
-                sma_50=row.get('sma_50'),
-                sma_200=row.get('sma_200'),
-                ema_9=row.get('ema_9'),
-                ema_21=row.get('ema_21'),
-                ema_50=row.get('ema_50'),
-                ema_200=row.get('ema_200'),
-                # Momentum
-                rsi_14=row.get('rsi_14'),
-                rsi_9=row.get('rsi_9'),
-                macd=row.get('macd'),
-                macd_signal=row.get('macd_signal'),
-                macd_histogram=row.get('macd_histogram'),
-                stoch_k=row.get('stoch_k'),
-                stoch_d=row.get('stoch_d'),
-                # Volatility
-                bb_upper=row.get('bb_upper'),
-                bb_middle=row.get('bb_middle'),
-                bb_lower=row.get('bb_lower'),
-                atr_14=row.get('atr_14'),
-                # Trend
-                supertrend=row.get('supertrend'),
-                supertrend_direction=int(row.get('supertrend_direction', 0)) if pd.notna(row.get('supertrend_direction')) else None,
-                adx=row.get('adx'),
-                # Standard Pivots
-                pivot_point=row.get('pivot_point'),
-                pivot_r1=row.get('pivot_r1'),
-                pivot_r2=row.get('pivot_r2'),
-                pivot_r3=row.get('pivot_r3'),
-                pivot_s1=row.get('pivot_s1'),
-                pivot_s2=row.get('pivot_s2'),
-                pivot_s3=row.get('pivot_s3'),
-                # Fibonacci Pivots
-                fib_pivot=row.get('fib_pivot'),
-                fib_r1=row.get('fib_r1'),
-                fib_r2=row.get('fib_r2'),
-                fib_r3=row.get('fib_r3'),
-                fib_s1=row.get('fib_s1'),
-                fib_s2=row.get('fib_s2'),
-                fib_s3=row.get('fib_s3'),
-                # Camarilla Pivots
-                cam_r4=row.get('cam_r4'),
-                cam_r3=row.get('cam_r3'),
-                cam_r2=row.get('cam_r2'),
-                cam_r1=row.get('cam_r1'),
-                cam_s1=row.get('cam_s1'),
-                cam_s2=row.get('cam_s2'),
-                cam_s3=row.get('cam_s3'),
-                cam_s4=row.get('cam_s4'),
-                # Volume
-                vwap=row.get('vwap'),
-                vwma_20=row.get('vwma_20'),
-                vwma_22=row.get('vwma_22'),
-                vwma_31=row.get('vwma_31'),
-                vwma_50=row.get('vwma_50'),
-                obv=int(row.get('obv', 0)) if pd.notna(row.get('obv')) else None,
-            )
-            records.append(record)
+        conn = await self.db.connection()
+        is_postgres = conn.dialect.name == 'postgresql'
+        
+        for start in range(0, len(df_with_indicators), chunk_size):
+            chunk = df_with_indicators.iloc[start:start + chunk_size]
+            if is_postgres:
+                await self._copy_upsert_chunk(conn, symbol, timeframe, chunk)
+            else:
+                await self._insert_chunk(symbol, timeframe, chunk)
         
-        # Bulk insert
-        self.db.add_all(records)
         await self.db.commit()
         
-        logger.info(f"Stored {len(records)} candles with indicators for {symbol} {timeframe}")
-        return len(records)
+        logger.info(f"Stored {len(df_with_indicators)} candles with indicators for {symbol} {timeframe}")
+        return len(df_with_indicators)
+    
+    @staticmethod
+    def _column_values(chunk: pd.DataFrame, name: str, kind: str) -> np.ndarray:
+        """A stored column as a NumPy array (NaN where missing)."""
+        if name not in chunk.columns:
+            return np.full(len(chunk), np.nan)
+        if kind != 'float8' and chunk[name].dtype.kind in 'iu':
+            return chunk[name].to_numpy()
+        return pd.to_numeric(chunk[name], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    @staticmethod
+    def _utc_timestamps(chunk: pd.DataFrame) -> np.ndarray:
+        """Candle timestamps as naive UTC datetime64 (naive input is taken as UTC)."""
+        return pd.DatetimeIndex(pd.to_datetime(chunk['timestamp'], utc=True)).tz_localize(None).to_numpy()
+    
+    @classmethod
+    def _copy_columns(cls, symbol: str, timeframe: str, chunk: pd.DataFrame) -> List[pg_copy.CopyColumn]:
+        """Binary COPY columns for a chunk, in STORE_COLUMNS order."""
+        n = len(chunk)
+        columns = []
+        for name, kind in STORE_COLUMNS:
+            if name == 'symbol':
+                columns.append(pg_copy.constant_column(symbol, n))
+            elif name == 'timeframe':
+                columns.append(pg_copy.constant_column(timeframe, n))
+            elif name == 'timestamp':
+                columns.append(pg_copy.timestamp_column(cls._utc_timestamps(chunk)))
+            else:
+                columns.append(pg_copy.fixed_column(kind, cls._column_values(chunk, name, kind)))
+        return columns
+    
+    async def _copy_upsert_chunk(self, conn, symbol: str, timeframe: str, chunk: pd.DataFrame):
+        """COPY a chunk into the staging table and replace its rows in candle_data."""
+        payload = pg_copy.encode_copy_binary(self._copy_columns(symbol, timeframe, chunk))
+        names = ', '.join(name for name, _ in STORE_COLUMNS)
+        column_sql = ', '.join(f"{name} {_STAGING_SQL_TYPES[kind]}" for name, kind in STORE_COLUMNS)
+        
+        raw = await conn.get_raw_connection()
+        pg = raw.driver_connection
+        await pg.execute(f"CREATE TEMP TABLE IF NOT EXISTS {CANDLE_STAGING_TABLE} ({column_sql})")
+        await pg.execute(f"TRUNCATE {CANDLE_STAGING_TABLE}")
+        await pg.copy_to_table(
+            CANDLE_STAGING_TABLE, source=io.BytesIO(payload),
+            columns=[name for name, _ in STORE_COLUMNS], format='binary'
+        )
+        await pg.execute(f"""
+            DELETE FROM candle_data c USING {CANDLE_STAGING_TABLE} s
+            WHERE c.symbol = s.symbol AND c.timeframe = s.timeframe AND c.timestamp = s.timestamp
+        """)
+        await pg.execute(f"INSERT INTO candle_data ({names}) SELECT {names} FROM {CANDLE_STAGING_TABLE}")
+    
+    async def _insert_chunk(self, symbol: str, timeframe: str, chunk: pd.DataFrame):
+        """Replace a chunk's rows with one bulk INSERT (databases without COPY)."""
+        data = {'symbol': symbol, 'timeframe': timeframe,
+                'timestamp': pd.to_datetime(chunk['timestamp'], utc=True).to_numpy(dtype=object)}
+        for name, kind in STORE_COLUMNS:
+            if name not in data:
+                data[name] = self._column_values(chunk, name, kind)
+        frame = pd.DataFrame(data)
+        frame = frame.astype(object).where(frame.notna(), None)
+        for name, kind in STORE_COLUMNS:
+            if kind in ('int4', 'int8'):
+                frame[name] = [None if v is None else int(v) for v in frame[name]]
+        timestamps = list(frame['timestamp'])
+        for start in range(0, len(timestamps), DELETE_BATCH_ROWS):
+            await self.db.execute(delete(CandleData).where(
+                CandleData.symbol == symbol,
+                CandleData.timeframe == timeframe,
+                CandleData.timestamp.in_(timestamps[start:start + DELETE_BATCH_ROWS]),
+            ))
+        await self.db.execute(insert(CandleData), frame.to_dict('records'))
     
     async def get_candles_with_indicators(
         self,
@@ -9,6 +9,9 @@ Features:
 - RSI - Relative Strength Index
 - EMA/SMA - Exponential/Simple Moving Averages
 - Supertrend
+- MACD
+- O(1) streaming updates matching the batch pipeline implementations
+- Batch mode: one vectorized update per timeframe for all symbols
 - Event bus integration
 """
 
@@ -18,6 +21,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Deque
 from enum import Enum
+from itertools import islice
 import math
 
 from loguru import logger
@@ -27,6 +31,7 @@ from app.core.events import (
     EventBus,
     EventType,
     CandleEvent,
+    IndicatorBatchEvent,
     IndicatorEvent,
     get_event_bus,
 )
@@ -83,13 +88,216 @@ class IndicatorResult:
         }
 
 
+# =============================================================================
+# Streaming Indicator State
+# =============================================================================
+#
+# Each class updates in O(1) per candle and reproduces the batch NumPy
+# functions in scripts/pipeline/stage1_compute.py exactly (same float
+# operations in the same order), so live and backfilled values agree.
+# Values are NaN until the indicator is warmed up.
+
+NAN = float("nan")
+
+
+class RunningSMA:
+    """Simple moving average as a difference of running totals (like cumsum)."""
+    
+    __slots__ = ("period", "value", "_total", "_totals")
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.value = NAN
+        self._total = 0.0
+        self._totals: Deque[float] = deque([0.0], maxlen=period + 1)
+    
+    def update(self, x: float) -> float:
+        self._total += x
+        self._totals.append(self._total)
+        if len(self._totals) > self.period:
+            self.value = (self._total - self._totals[0]) / self.period
+        return self.value
+
+
+class RunningVWMA:
+    """Volume weighted moving average from running price*volume and volume totals."""
+    
+    __slots__ = ("period", "value", "_pv", "_vol", "_sma")
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.value = NAN
+        self._pv = RunningSMA(period)
+        self._vol = RunningSMA(period)
+        self._sma = RunningSMA(period)
+    
+    def update(self, close: float, volume: float) -> float:
+        pv = self._pv.update(close * volume)
+        vol = self._vol.update(volume)
+        sma = self._sma.update(close)
+        if vol == vol:
+            # Zero volume over the window falls back to the SMA
+            self.value = pv / vol if vol > 0 else sma
+        return self.value
+
+
+class RunningEMA:
+    """Exponential moving average seeded with the mean of the first ``period`` values."""
+    
+    __slots__ = ("period", "value", "_multiplier", "_seed")
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.value = NAN
+        self._multiplier = 2 / (period + 1)
+        self._seed: Optional[List[float]] = []
+    
+    def update(self, x: float) -> float:
+        if self._seed is None:
+            self.value = (x - self.value) * self._multiplier + self.value
+        else:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = float(np.mean(self._seed))
+                self._seed = None
+        return self.value
+
+
+class WilderRSI:
+    """Relative Strength Index with Wilder smoothing of gains and losses."""
+    
+    __slots__ = ("period", "value", "_prev_close", "_avg_gain", "_avg_loss", "_seed")
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.value = NAN
+        self._prev_close: Optional[float] = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._seed: Optional[List[float]] = []
+    
+    def update(self, close: float) -> float:
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            return self.value
+        
+        delta = close - prev
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        if self._seed is None:
+            p = self.period
+            self._avg_gain = (self._avg_gain * (p - 1) + gain) / p
+            self._avg_loss = (self._avg_loss * (p - 1) + loss) / p
+        else:
+            self._seed.append(delta)
+            if len(self._seed) < self.period:
+                return self.value
+            deltas = np.array(self._seed)
+            self._avg_gain = float(np.mean(np.where(deltas > 0, deltas, 0)))
+            self._avg_loss = float(np.mean(np.where(deltas < 0, -deltas, 0)))
+            self._seed = None
+        
+        if self._avg_loss == 0:
+            self.value = 100.0
+        else:
+            self.value = 100 - (100 / (1 + self._avg_gain / self._avg_loss))
+        return self.value
+
+
+class WilderATR:
+    """Average True Range with Wilder smoothing."""
+    
+    __slots__ = ("period", "value", "_prev_close", "_seed")
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.value = NAN
+        self._prev_close: Optional[float] = None
+        self._seed: Optional[List[float]] = []
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev), abs(low - prev))
+        
+        if self._seed is None:
+            self.value = (self.value * (self.period - 1) + tr) / self.period
+        else:
+            self._seed.append(tr)
+            if len(self._seed) == self.period:
+                self.value = float(np.mean(self._seed))
+                self._seed = None
+        return self.value
+
+
+class SupertrendState:
+    """Supertrend line and direction (1 = up, -1 = down) on a Wilder ATR."""
+    
+    __slots__ = ("multiplier", "value", "direction", "_atr", "_prev_close")
+    
+    def __init__(self, period: int = 10, multiplier: float = 3.0):
+        self.multiplier = multiplier
+        self.value = NAN
+        self.direction = 0
+        self._atr = WilderATR(period)
+        self._prev_close: Optional[float] = None
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        prev_close, self._prev_close = self._prev_close, close
+        atr = self._atr.update(high, low, close)
+        if atr != atr:
+            return self.value
+        
+        hl2 = (high + low) / 2
+        upper = hl2 + (self.multiplier * atr)
+        lower = hl2 - (self.multiplier * atr)
+        
+        if self.direction == 0:
+            # First bar with an ATR starts in a downtrend on the upper band
+            self.value, self.direction = upper, -1
+        elif prev_close > self.value:
+            self.value = max(lower, self.value if self.direction == 1 else lower)
+            self.direction = 1
+        else:
+            self.value = min(upper, self.value if self.direction == -1 else upper)
+            self.direction = -1
+        return self.value
+
+
+class MACDState:
+    """MACD line, signal line (EMA of MACD) and histogram."""
+    
+    __slots__ = ("macd", "signal", "histogram", "_fast", "_slow", "_signal")
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.macd = self.signal = self.histogram = NAN
+        self._fast = RunningEMA(fast)
+        self._slow = RunningEMA(slow)
+        self._signal = RunningEMA(signal)
+    
+    def update(self, close: float) -> float:
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        if self.macd == self.macd:
+            self.signal = self._signal.update(self.macd)
+            self.histogram = self.macd - self.signal
+        return self.macd
+
+
 class IndicatorCalculator:
     """
     Calculates technical indicators from candle data.
     
-    Maintains rolling windows for efficient computation.
+    Keeps streaming state per indicator (running sums, EMA and Wilder
+    state), so each new candle updates every indicator in constant time.
     """
     
+    EMA_PERIODS = (9, 21, 50, 200)
+    SMA_PERIODS = (20, 50, 200)
+    VWMA_PERIODS = (22, 31)
+    
     def __init__(
         self,
         symbol: str,
@@ -108,16 +316,20 @@ class IndicatorCalculator:
         self._volumes: Deque[int] = deque(maxlen=max_history)
         self._timestamps: Deque[datetime] = deque(maxlen=max_history)
         
-        # Cached calculations
-        self._tr_cache: Deque[float] = deque(maxlen=max_history)  # True Range
-        self._ema_cache: Dict[int, float] = {}  # EMA by period
-        
-        # Supertrend state
-        self._supertrend_direction: int = 1  # 1 = up, -1 = down
-        self._supertrend_value: float = 0.0
+        # Streaming indicator state
+        self._vwma = {p: RunningVWMA(p) for p in self.VWMA_PERIODS}
+        self._ema = {p: RunningEMA(p) for p in self.EMA_PERIODS}
+        self._sma = {p: RunningSMA(p) for p in self.SMA_PERIODS}
+        self._atr = WilderATR(14)
+        self._rsi = WilderRSI(14)
+        self._supertrend = SupertrendState(10, 3.0)
+        self._macd = MACDState(12, 26, 9)
+        
+        # Latest values (NaN until warmed up)
+        self._values: Dict[str, float] = {}
     
     def add_candle(self, candle: Candle) -> None:
-        """Add a new candle to history."""
+        """Add a new candle to history and update every indicator."""
         self._opens.append(candle.open)
         self._highs.append(candle.high)
         self._lows.append(candle.low)
@@ -125,187 +337,40 @@ class IndicatorCalculator:
         self._volumes.append(candle.volume)
         self._timestamps.append(candle.timestamp)
         
-        # Calculate True Range
-        if len(self._closes) >= 2:
-            prev_close = self._closes[-2]
-            tr = max(
-                candle.high - candle.low,
-                abs(candle.high - prev_close),
-                abs(candle.low - prev_close)
-            )
-        else:
-            tr = candle.high - candle.low
-        self._tr_cache.append(tr)
-    
-    def compute_all(self) -> IndicatorResult:
-        """Compute all configured indicators."""
-        result = IndicatorResult(
-            symbol=self.symbol,
-            timeframe=self.timeframe,
-            timestamp=self._timestamps[-1] if self._timestamps else datetime.now(timezone.utc),
-        )
-        
-        closes = list(self._closes)
-        volumes = list(self._volumes)
-        
-        if len(closes) < 2:
-            return result
+        high, low, close = float(candle.high), float(candle.low), float(candle.close)
+        volume = float(candle.volume)
+        values = self._values
         
         # VWMA 22 and 31 (primary indicators per HLD)
-        if len(closes) >= 22:
-            result.values["vwma_22"] = self._compute_vwma(closes, volumes, 22)
-        if len(closes) >= 31:
-            result.values["vwma_31"] = self._compute_vwma(closes, volumes, 31)
-        
-        # ATR 14
-        if len(self._tr_cache) >= 14:
-            result.values["atr_14"] = self._compute_atr(14)
+        for period, state in self._vwma.items():
+            values[f"vwma_{period}"] = state.update(close, volume)
         
-        # RSI 14
-        if len(closes) >= 15:
-            result.values["rsi_14"] = self._compute_rsi(closes, 14)
+        values["atr_14"] = self._atr.update(high, low, close)
+        values["rsi_14"] = self._rsi.update(close)
         
-        # EMAs
-        for period in [9, 21, 50, 200]:
-            if len(closes) >= period:
-                result.values[f"ema_{period}"] = self._compute_ema(closes, period)
-        
-        # SMAs
-        for period in [20, 50, 200]:
-            if len(closes) >= period:
-                result.values[f"sma_{period}"] = self._compute_sma(closes, period)
+        for period, state in self._ema.items():
+            values[f"ema_{period}"] = state.update(close)
+        for period, state in self._sma.items():
+            values[f"sma_{period}"] = state.update(close)
         
         # Supertrend (10, 3)
-        if len(closes) >= 10:
-            st_value, st_direction = self._compute_supertrend(10, 3.0)
-            result.values["supertrend"] = st_value
-            result.values["supertrend_direction"] = float(st_direction)
-        
-        return result
-    
-    def _compute_sma(self, data: List[float], period: int) -> float:
-        """Compute Simple Moving Average."""
-        if len(data) < period:
-            return 0.0
-        return sum(data[-period:]) / period
+        values["supertrend"] = self._supertrend.update(high, low, close)
+        values["supertrend_direction"] = float(self._supertrend.direction) if self._supertrend.direction else NAN
+        
+        # MACD (12, 26, 9)
+        self._macd.update(close)
+        values["macd"] = self._macd.macd
+        values["macd_signal"] = self._macd.signal
+        values["macd_histogram"] = self._macd.histogram
     
-    def _compute_ema(self, data: List[float], period: int) -> float:
-        """Compute Exponential Moving Average."""
-        if len(data) < period:
-            return 0.0
-        
-        multiplier = 2 / (period + 1)
-        
-        # Use cached value if available
-        if period in self._ema_cache:
-            prev_ema = self._ema_cache[period]
-            ema = (data[-1] - prev_ema) * multiplier + prev_ema
-        else:
-            # Initialize with SMA
-            ema = sum(data[:period]) / period
-            for price in data[period:]:
-                ema = (price - ema) * multiplier + ema
-        
-        self._ema_cache[period] = ema
-        return round(ema, 4)
-    
-    def _compute_vwma(
-        self,
-        closes: List[float],
-        volumes: List[int],
-        period: int,
-    ) -> float:
-        """
-        Compute Volume Weighted Moving Average.
-        
-        VWMA = sum(close * volume) / sum(volume)
-        """
-        if len(closes) < period or len(volumes) < period:
-            return 0.0
-        
-        recent_closes = closes[-period:]
-        recent_volumes = volumes[-period:]
-        
-        total_volume = sum(recent_volumes)
-        if total_volume == 0:
-            return self._compute_sma(closes, period)
-        
-        weighted_sum = sum(c * v for c, v in zip(recent_closes, recent_volumes))
-        return round(weighted_sum / total_volume, 4)
-    
-    def _compute_rsi(self, data: List[float], period: int) -> float:
-        """Compute Relative Strength Index."""
-        if len(data) < period + 1:
-            return 50.0
-        
-        # Calculate price changes
-        changes = [data[i] - data[i-1] for i in range(1, len(data))]
-        recent_changes = changes[-(period):]
-        
-        gains = [c if c > 0 else 0 for c in recent_changes]
-        losses = [-c if c < 0 else 0 for c in recent_changes]
-        
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return round(rsi, 2)
-    
-    def _compute_atr(self, period: int) -> float:
-        """Compute Average True Range."""
-        if len(self._tr_cache) < period:
-            return 0.0
-        
-        tr_values = list(self._tr_cache)[-period:]
-        return round(sum(tr_values) / period, 4)
-    
-    def _compute_supertrend(
-        self,
-        period: int = 10,
-        multiplier: float = 3.0,
-    ) -> tuple[float, int]:
-        """
-        Compute Supertrend indicator.
-        
-        Returns:
-            Tuple of (supertrend value, direction: 1=up, -1=down)
-        """
-        if len(self._closes) < period or len(self._tr_cache) < period:
-            return 0.0, 1
-        
-        closes = list(self._closes)
-        highs = list(self._highs)
-        lows = list(self._lows)
-        
-        # Calculate ATR
-        atr = self._compute_atr(period)
-        
-        # Calculate basic bands
-        hl2 = (highs[-1] + lows[-1]) / 2
-        basic_upper = hl2 + (multiplier * atr)
-        basic_lower = hl2 - (multiplier * atr)
-        
-        # Get previous values (simplified - full implementation would track history)
-        prev_close = closes[-2] if len(closes) > 1 else closes[-1]
-        
-        # Determine trend direction
-        if closes[-1] > self._supertrend_value:
-            direction = 1  # Bullish
-            final_band = basic_lower
-        else:
-            direction = -1  # Bearish
-            final_band = basic_upper
-        
-        # Update state
-        self._supertrend_value = final_band
-        self._supertrend_direction = direction
-        
-        return round(final_band, 4), direction
+    def compute_all(self) -> IndicatorResult:
+        """Latest values of all indicators that are warmed up."""
+        return IndicatorResult(
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            timestamp=self._timestamps[-1] if self._timestamps else datetime.now(timezone.utc),
+            values={name: value for name, value in self._values.items() if value == value},
+        )
     
     def compute_macd(
         self,
@@ -314,26 +379,20 @@ class IndicatorCalculator:
         signal: int = 9,
     ) -> Dict[str, float]:
         """Compute MACD indicator."""
-        closes = list(self._closes)
-        
-        if len(closes) < slow + signal:
+        macd = self._macd
+        if (fast, slow, signal) != (12, 26, 9):
+            # Non-default parameters: replay the retained history
+            macd = MACDState(fast, slow, signal)
+            for close in self._closes:
+                macd.update(float(close))
+        
+        if macd.signal != macd.signal:
             return {"macd": 0.0, "signal": 0.0, "histogram": 0.0}
         
-        ema_fast = self._compute_ema(closes, fast)
-        ema_slow = self._compute_ema(closes, slow)
-        
-        macd_line = ema_fast - ema_slow
-        
-        # Signal line (EMA of MACD)
-        # Simplified - would need MACD history for proper signal line
-        signal_line = macd_line * 0.9  # Approximation
-        
-        histogram = macd_line - signal_line
-        
         return {
-            "macd": round(macd_line, 4),
-            "signal": round(signal_line, 4),
-            "histogram": round(histogram, 4),
+            "macd": round(macd.macd, 4),
+            "signal": round(macd.signal, 4),
+            "histogram": round(macd.histogram, 4),
         }
     
     def compute_bollinger(
@@ -342,15 +401,13 @@ class IndicatorCalculator:
         std_dev: float = 2.0,
     ) -> Dict[str, float]:
         """Compute Bollinger Bands."""
-        closes = list(self._closes)
-        
-        if len(closes) < period:
+        if len(self._closes) < period:
             return {"upper": 0.0, "middle": 0.0, "lower": 0.0}
         
-        middle = self._compute_sma(closes, period)
+        recent = list(islice(self._closes, len(self._closes) - period, None))
+        middle = sum(recent) / period
         
         # Calculate standard deviation
-        recent = closes[-period:]
         variance = sum((x - middle) ** 2 for x in recent) / period
         std = math.sqrt(variance)
         
@@ -368,6 +425,405 @@ class IndicatorCalculator:
         return len(self._closes)
 
 
+# =============================================================================
+# Vectorized Cross-Symbol State
+# =============================================================================
+#
+# The same indicators as the streaming classes above, but with the state of
+# every symbol of a timeframe in one array per quantity (one row per symbol
+# slot). update() takes the rows that have a new candle and advances all of
+# them with array operations, matching the per-symbol values exactly.
+
+
+def _grown(arr: np.ndarray, capacity: int, fill: float = 0) -> np.ndarray:
+    new = np.full((capacity,) + arr.shape[1:], fill, dtype=arr.dtype)
+    new[:len(arr)] = arr
+    return new
+
+
+class _BatchSMA:
+    __slots__ = ("period", "total", "totals", "count")
+    
+    def __init__(self, period: int, capacity: int):
+        self.period = period
+        self.total = np.zeros(capacity)
+        # Last period + 1 running totals, slot j holds total number j % (period + 1)
+        self.totals = np.zeros((capacity, period + 1))
+        self.count = np.zeros(capacity, dtype=np.int64)
+    
+    def grow(self, capacity: int) -> None:
+        self.total = _grown(self.total, capacity)
+        self.totals = _grown(self.totals, capacity)
+        self.count = _grown(self.count, capacity)
+    
+    def update(self, rows: np.ndarray, x: np.ndarray) -> np.ndarray:
+        total = self.total[rows] + x
+        count = self.count[rows] + 1
+        self.total[rows] = total
+        self.count[rows] = count
+        width = self.period + 1
+        self.totals[rows, count % width] = total
+        
+        out = np.full(len(rows), NAN)
+        ready = count >= self.period
+        out[ready] = (total[ready] - self.totals[rows[ready], (count[ready] + 1) % width]) / self.period
+        return out
+
+
+class _BatchVWMA:
+    __slots__ = ("pv", "vol", "sma")
+    
+    def __init__(self, period: int, capacity: int):
+        self.pv = _BatchSMA(period, capacity)
+        self.vol = _BatchSMA(period, capacity)
+        self.sma = _BatchSMA(period, capacity)
+    
+    def grow(self, capacity: int) -> None:
+        for state in (self.pv, self.vol, self.sma):
+            state.grow(capacity)
+    
+    def update(self, rows: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        pv = self.pv.update(rows, close * volume)
+        vol = self.vol.update(rows, volume)
+        sma = self.sma.update(rows, close)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(vol > 0, pv / vol, sma)
+
+
+class _BatchEMA:
+    __slots__ = ("period", "multiplier", "value", "seed", "count")
+    
+    def __init__(self, period: int, capacity: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.value = np.full(capacity, NAN)
+        self.seed = np.zeros((capacity, period))
+        self.count = np.zeros(capacity, dtype=np.int64)
+    
+    def grow(self, capacity: int) -> None:
+        self.value = _grown(self.value, capacity, NAN)
+        self.seed = _grown(self.seed, capacity)
+        self.count = _grown(self.count, capacity)
+    
+    def update(self, rows: np.ndarray, x: np.ndarray) -> np.ndarray:
+        value = self.value[rows]
+        count = self.count[rows]
+        
+        seeded = count >= self.period
+        value[seeded] = (x[seeded] - value[seeded]) * self.multiplier + value[seeded]
+        
+        seeding = np.flatnonzero(~seeded)
+        if len(seeding):
+            r, c = rows[seeding], count[seeding]
+            self.seed[r, c] = x[seeding]
+            done = c + 1 == self.period
+            value[seeding[done]] = self.seed[r[done]].mean(axis=1)
+            self.count[r] = c + 1
+        
+        self.value[rows] = value
+        return value
+
+
+class _BatchRSI:
+    __slots__ = ("period", "value", "prev_close", "seen", "avg_gain", "avg_loss", "seed", "count")
+    
+    def __init__(self, period: int, capacity: int):
+        self.period = period
+        self.value = np.full(capacity, NAN)
+        self.prev_close = np.zeros(capacity)
+        self.seen = np.zeros(capacity, dtype=bool)
+        self.avg_gain = np.zeros(capacity)
+        self.avg_loss = np.zeros(capacity)
+        self.seed = np.zeros((capacity, period))
+        self.count = np.zeros(capacity, dtype=np.int64)
+    
+    def grow(self, capacity: int) -> None:
+        for name in self.__slots__[1:]:
+            setattr(self, name, _grown(getattr(self, name), capacity, NAN if name == "value" else 0))
+    
+    def update(self, rows: np.ndarray, close: np.ndarray) -> np.ndarray:
+        p = self.period
+        delta = close - self.prev_close[rows]
+        has_prev = self.seen[rows]
+        self.prev_close[rows] = close
+        self.seen[rows] = True
+        count = self.count[rows]
+        
+        # Wilder smoothing once seeded
+        smooth = has_prev & (count >= p)
+        s_rows, d = rows[smooth], delta[smooth]
+        self.avg_gain[s_rows] = (self.avg_gain[s_rows] * (p - 1) + np.where(d > 0, d, 0.0)) / p
+        self.avg_loss[s_rows] = (self.avg_loss[s_rows] * (p - 1) + np.where(d < 0, -d, 0.0)) / p
+        
+        # Collect the first period deltas, seed averages with their mean
+        seeding = has_prev & (count < p)
+        r, c = rows[seeding], count[seeding]
+        self.seed[r, c] = delta[seeding]
+        self.count[r] = c + 1
+        done = r[c + 1 == p]
+        if len(done):
+            deltas = self.seed[done]
+            self.avg_gain[done] = np.where(deltas > 0, deltas, 0).mean(axis=1)
+            self.avg_loss[done] = np.where(deltas < 0, -deltas, 0).mean(axis=1)
+        
+        changed = rows[smooth | (seeding & (count + 1 == p))]
+        gain, loss = self.avg_gain[changed], self.avg_loss[changed]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.value[changed] = np.where(loss == 0, 100.0, 100 - (100 / (1 + gain / loss)))
+        return self.value[rows]
+
+
+class _BatchATR:
+    __slots__ = ("period", "value", "prev_close", "seen", "seed", "count")
+    
+    def __init__(self, period: int, capacity: int):
+        self.period = period
+        self.value = np.full(capacity, NAN)
+        self.prev_close = np.zeros(capacity)
+        self.seen = np.zeros(capacity, dtype=bool)
+        self.seed = np.zeros((capacity, period))
+        self.count = np.zeros(capacity, dtype=np.int64)
+    
+    def grow(self, capacity: int) -> None:
+        for name in self.__slots__[1:]:
+            setattr(self, name, _grown(getattr(self, name), capacity, NAN if name == "value" else 0))
+    
+    def update(
+        self,
+        rows: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+    ) -> np.ndarray:
+        p = self.period
+        prev = self.prev_close[rows]
+        tr = np.where(
+            self.seen[rows],
+            np.maximum(np.maximum(high - low, np.abs(high - prev)), np.abs(low - prev)),
+            high - low,
+        )
+        self.prev_close[rows] = close
+        self.seen[rows] = True
+        
+        value = self.value[rows]
+        count = self.count[rows]
+        
+        smooth = count >= p
+        value[smooth] = (value[smooth] * (p - 1) + tr[smooth]) / p
+        
+        seeding = np.flatnonzero(~smooth)
+        if len(seeding):
+            r, c = rows[seeding], count[seeding]
+            self.seed[r, c] = tr[seeding]
+            done = c + 1 == p
+            value[seeding[done]] = self.seed[r[done]].mean(axis=1)
+            self.count[r] = c + 1
+        
+        self.value[rows] = value
+        return value
+
+
+class _BatchSupertrend:
+    __slots__ = ("multiplier", "atr", "value", "direction", "prev_close")
+    
+    def __init__(self, period: int, multiplier: float, capacity: int):
+        self.multiplier = multiplier
+        self.atr = _BatchATR(period, capacity)
+        self.value = np.full(capacity, NAN)
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.prev_close = np.zeros(capacity)
+    
+    def grow(self, capacity: int) -> None:
+        self.atr.grow(capacity)
+        self.value = _grown(self.value, capacity, NAN)
+        self.direction = _grown(self.direction, capacity)
+        self.prev_close = _grown(self.prev_close, capacity)
+    
+    def update(
+        self,
+        rows: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+    ) -> np.ndarray:
+        prev_close = self.prev_close[rows]
+        self.prev_close[rows] = close
+        atr = self.atr.update(rows, high, low, close)
+        
+        hl2 = (high + low) / 2
+        upper = hl2 + (self.multiplier * atr)
+        lower = hl2 - (self.multiplier * atr)
+        
+        value = self.value[rows]
+        direction = self.direction[rows]
+        ready = ~np.isnan(atr)
+        first = ready & (direction == 0)
+        rising = ready & ~first & (prev_close > value)
+        falling = ready & ~first & ~(prev_close > value)
+        
+        new = value.copy()
+        new[first] = upper[first]
+        new[rising] = np.maximum(
+            lower[rising], np.where(direction[rising] == 1, value[rising], lower[rising])
+        )
+        new[falling] = np.minimum(
+            upper[falling], np.where(direction[falling] == -1, value[falling], upper[falling])
+        )
+        direction[first | falling] = -1
+        direction[rising] = 1
+        
+        self.value[rows] = new
+        self.direction[rows] = direction
+        return new
+
+
+class _BatchMACD:
+    __slots__ = ("fast", "slow", "signal")
+    
+    def __init__(self, fast: int, slow: int, signal: int, capacity: int):
+        self.fast = _BatchEMA(fast, capacity)
+        self.slow = _BatchEMA(slow, capacity)
+        self.signal = _BatchEMA(signal, capacity)
+    
+    def grow(self, capacity: int) -> None:
+        for state in (self.fast, self.slow, self.signal):
+            state.grow(capacity)
+    
+    def update(self, rows: np.ndarray, close: np.ndarray) -> tuple:
+        macd = self.fast.update(rows, close) - self.slow.update(rows, close)
+        valid = ~np.isnan(macd)
+        if valid.any():
+            self.signal.update(rows[valid], macd[valid])
+        signal = self.signal.value[rows]
+        return macd, signal, macd - signal
+
+
+class BatchIndicatorCalculator:
+    """
+    Computes the IndicatorCalculator indicators for many symbols of one
+    timeframe at once.
+    
+    Each symbol gets a slot; ``update`` takes the latest candle of a set of
+    slots as arrays and advances every indicator for all of them in one
+    vectorized step. A slot may appear at most once per call.
+    """
+    
+    def __init__(self, timeframe: str, capacity: int = 256):
+        self.timeframe = timeframe
+        self._capacity = capacity
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._timestamps: List[Optional[datetime]] = []
+        self._candle_counts = np.zeros(capacity, dtype=np.int64)
+        
+        self._vwma = {p: _BatchVWMA(p, capacity) for p in IndicatorCalculator.VWMA_PERIODS}
+        self._ema = {p: _BatchEMA(p, capacity) for p in IndicatorCalculator.EMA_PERIODS}
+        self._sma = {p: _BatchSMA(p, capacity) for p in IndicatorCalculator.SMA_PERIODS}
+        self._atr = _BatchATR(14, capacity)
+        self._rsi = _BatchRSI(14, capacity)
+        self._supertrend = _BatchSupertrend(10, 3.0, capacity)
+        self._macd = _BatchMACD(12, 26, 9, capacity)
+        
+        self.names = (
+            [f"vwma_{p}" for p in self._vwma]
+            + ["atr_14", "rsi_14"]
+            + [f"ema_{p}" for p in self._ema]
+            + [f"sma_{p}" for p in self._sma]
+            + ["supertrend", "supertrend_direction", "macd", "macd_signal", "macd_histogram"]
+        )
+        # Latest value of every indicator, one row per slot
+        self._latest = np.full((capacity, len(self.names)), NAN)
+    
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols in slot order."""
+        return self._symbols
+    
+    def slot(self, symbol: str) -> int:
+        """Get (or assign) the slot index of a symbol."""
+        idx = self._slots.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx >= self._capacity:
+                self._grow(self._capacity * 2)
+            self._slots[symbol] = idx
+            self._symbols.append(symbol)
+            self._timestamps.append(None)
+        return idx
+    
+    def _grow(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._candle_counts = _grown(self._candle_counts, capacity)
+        self._latest = _grown(self._latest, capacity, NAN)
+        for state in (
+            *self._vwma.values(), *self._ema.values(), *self._sma.values(),
+            self._atr, self._rsi, self._supertrend, self._macd,
+        ):
+            state.grow(capacity)
+    
+    def update(
+        self,
+        slots: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        timestamps: Optional[List[datetime]] = None,
+    ) -> np.ndarray:
+        """
+        Apply one new candle for each of ``slots``.
+        
+        Returns:
+            Matrix of indicator values (rows follow ``slots``, columns follow
+            ``names``; NaN = not warmed up).
+        """
+        rows = np.asarray(slots, dtype=np.int64)
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        volume = np.asarray(volume, dtype=np.float64)
+        
+        columns = [state.update(rows, close, volume) for state in self._vwma.values()]
+        columns.append(self._atr.update(rows, high, low, close))
+        columns.append(self._rsi.update(rows, close))
+        columns.extend(state.update(rows, close) for state in self._ema.values())
+        columns.extend(state.update(rows, close) for state in self._sma.values())
+        supertrend = self._supertrend.update(rows, high, low, close)
+        direction = self._supertrend.direction[rows].astype(np.float64)
+        direction[direction == 0] = NAN
+        columns.extend([supertrend, direction])
+        columns.extend(self._macd.update(rows, close))
+        
+        values = np.column_stack(columns)
+        self._latest[rows] = values
+        self._candle_counts[rows] += 1
+        if timestamps is not None:
+            for row, ts in zip(rows.tolist(), timestamps):
+                self._timestamps[row] = ts
+        return values
+    
+    def latest(self, symbol: str) -> Optional[IndicatorResult]:
+        """Latest warmed-up values of a symbol."""
+        idx = self._slots.get(symbol)
+        if idx is None or self._candle_counts[idx] == 0:
+            return None
+        return IndicatorResult(
+            symbol=symbol,
+            timeframe=self.timeframe,
+            timestamp=self._timestamps[idx] or datetime.now(timezone.utc),
+            values={
+                name: value
+                for name, value in zip(self.names, self._latest[idx].tolist())
+                if value == value
+            },
+        )
+    
+    def get_candle_count(self, symbol: str) -> int:
+        """Get number of candles seen for a symbol."""
+        idx = self._slots.get(symbol)
+        return 0 if idx is None else int(self._candle_counts[idx])
+
+
 class IndicatorService:
     """
     Service for computing indicators across multiple symbols and timeframes.
@@ -379,6 +835,8 @@ class IndicatorService:
         self,
         timeframes: Optional[List[str]] = None,
         on_indicator: Optional[Callable[[IndicatorResult], Coroutine[Any, Any, None]]] = None,
+        batch: bool = False,
+        batch_window_ms: float = 2.0,
     ):
         """
         Initialize indicator service.
@@ -386,6 +844,10 @@ class IndicatorService:
         Args:
             timeframes: List of timeframes to compute indicators for
             on_indicator: Callback for indicator updates
+            batch: Collect the candles that close together and update all
+                symbols of a timeframe in one vectorized step, publishing
+                one IndicatorBatchEvent instead of an IndicatorEvent per symbol
+            batch_window_ms: How long to collect candles before a batch update
         """
         self.timeframes = timeframes or ["1m", "5m", "15m", "1h"]
         self._on_indicator = on_indicator
@@ -393,6 +855,13 @@ class IndicatorService:
         # Calculators by (symbol, timeframe)
         self._calculators: Dict[tuple[str, str], IndicatorCalculator] = {}
         
+        # Batch mode: one calculator per timeframe plus a candle buffer
+        self._batch = batch
+        self._batch_window_ms = batch_window_ms
+        self._batch_calculators: Dict[str, BatchIndicatorCalculator] = {}
+        self._candle_buffer: Dict[str, List[Candle]] = defaultdict(list)
+        self._flush_task: Optional[asyncio.Task] = None
+        
         # Event bus
         self._event_bus: Optional[EventBus] = None
         
@@ -418,6 +887,9 @@ class IndicatorService:
     async def stop(self) -> None:
         """Stop the indicator service."""
         self._running = False
+        if self._flush_task and not self._flush_task.done():
+            await self._flush_task
+        await self._drain_candle_buffer()
         logger.info("Indicator service stopped")
     
     def add_symbol(self, symbol: str, timeframe: str) -> None:
@@ -438,13 +910,6 @@ class IndicatorService:
         if timeframe not in self.timeframes:
             return
         
-        # Get or create calculator
-        key = (symbol, timeframe)
-        if key not in self._calculators:
-            self.add_symbol(symbol, timeframe)
-        
-        calculator = self._calculators[key]
-        
         # Create candle object
         candle = Candle(
             symbol=symbol,
@@ -458,6 +923,19 @@ class IndicatorService:
             is_complete=True,
         )
         
+        if self._batch:
+            self._candle_buffer[timeframe].append(candle)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_candles())
+            return
+        
+        # Get or create calculator
+        key = (symbol, timeframe)
+        if key not in self._calculators:
+            self.add_symbol(symbol, timeframe)
+        
+        calculator = self._calculators[key]
+        
         # Add candle and compute indicators
         calculator.add_candle(candle)
         result = calculator.compute_all()
@@ -486,6 +964,10 @@ class IndicatorService:
         Returns:
             Computed indicator values.
         """
+        if self._batch:
+            results = await self.compute_indicators_batch(timeframe, [candle])
+            return results[0]
+        
         key = (symbol, timeframe)
         if key not in self._calculators:
             self.add_symbol(symbol, timeframe)
@@ -498,6 +980,108 @@ class IndicatorService:
         
         return result
     
+    async def _flush_candles(self) -> None:
+        """Batch-update the candles collected during the window."""
+        await asyncio.sleep(self._batch_window_ms / 1000)
+        await self._drain_candle_buffer()
+    
+    async def _drain_candle_buffer(self) -> None:
+        """Process buffered candles until none are left.
+        
+        Candles that arrive while a batch is being processed land in the
+        fresh buffer; looping picks them up instead of leaving them until
+        the next candle event schedules another flush.
+        """
+        while self._candle_buffer:
+            buffers, self._candle_buffer = self._candle_buffer, defaultdict(list)
+            for timeframe, candles in buffers.items():
+                try:
+                    await self._process_batch(timeframe, candles)
+                except Exception as e:
+                    logger.error(f"Batch indicator update failed for {timeframe}: {e}")
+    
+    async def compute_indicators_batch(
+        self,
+        timeframe: str,
+        candles: List[Candle],
+    ) -> List[IndicatorResult]:
+        """
+        Compute indicators for the latest candles of many symbols at once.
+        
+        Args:
+            timeframe: Candle timeframe
+            candles: Completed candles, at most one per symbol is typical;
+                repeats are applied in order
+            
+        Returns:
+            Computed indicator values, one per candle.
+        """
+        return await self._process_batch(timeframe, candles, collect=True)
+    
+    async def _process_batch(
+        self,
+        timeframe: str,
+        candles: List[Candle],
+        collect: bool = False,
+    ) -> List[IndicatorResult]:
+        calculator = self._batch_calculators.get(timeframe)
+        if calculator is None:
+            calculator = self._batch_calculators[timeframe] = BatchIndicatorCalculator(timeframe)
+        
+        # A symbol can only appear once per vectorized step; later candles
+        # of the same symbol go to the next round
+        rounds: List[List[Candle]] = []
+        seen: Dict[str, int] = defaultdict(int)
+        for candle in candles:
+            n = seen[candle.symbol]
+            seen[candle.symbol] += 1
+            if n == len(rounds):
+                rounds.append([])
+            rounds[n].append(candle)
+        
+        results: List[IndicatorResult] = []
+        for batch in rounds:
+            symbols = [c.symbol for c in batch]
+            values = calculator.update(
+                np.array([calculator.slot(s) for s in symbols]),
+                np.array([c.high for c in batch], dtype=np.float64),
+                np.array([c.low for c in batch], dtype=np.float64),
+                np.array([c.close for c in batch], dtype=np.float64),
+                np.array([c.volume for c in batch], dtype=np.float64),
+                timestamps=[c.timestamp for c in batch],
+            )
+            await self._publish_batch(timeframe, symbols, calculator.names, values)
+            
+            if collect or self._on_indicator:
+                for symbol in symbols:
+                    result = calculator.latest(symbol)
+                    results.append(result)
+                    if self._on_indicator:
+                        await self._on_indicator(result)
+        
+        return results
+    
+    async def _publish_batch(
+        self,
+        timeframe: str,
+        symbols: List[str],
+        names: List[str],
+        values: np.ndarray,
+    ) -> None:
+        """Publish a batch update as one IndicatorBatchEvent."""
+        if not self._event_bus:
+            return
+        
+        event = IndicatorBatchEvent(
+            timeframe=timeframe,
+            symbols=symbols,
+            indicators={
+                name: [None if v != v else v for v in column]
+                for name, column in zip(names, values.T.tolist())
+            },
+        )
+        await self._event_bus.publish(event)
+    
     async def _publish_indicators(self, result: IndicatorResult) -> None:
         """Publish indicator values to event bus."""
         if not self._event_bus or not result.values:
@@ -519,6 +1103,10 @@ class IndicatorService:
         timeframe: str,
     ) -> Optional[IndicatorResult]:
         """Get latest computed indicators for a symbol/timeframe."""
+        if self._batch:
+            calculator = self._batch_calculators.get(timeframe)
+            return calculator.latest(symbol) if calculator else None
+        
         key = (symbol, timeframe)
         calculator = self._calculators.get(key)
         
@@ -541,6 +1129,17 @@ class IndicatorService:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get service statistics."""
+        if self._batch:
+            return {
+                "running": self._running,
+                "mode": "batch",
+                "timeframes": self.timeframes,
+                "calculators": {
+                    f"{s}_{tf}": calc.get_candle_count(s)
+                    for tf, calc in self._batch_calculators.items()
+                    for s in calc.symbols
+                },
+            }
         return {
             "running": self._running,
             "calculator_count": len(self._calculators),
@@ -578,6 +1177,14 @@ __all__ = [
     "IndicatorValue",
     "IndicatorResult",
     "IndicatorCalculator",
+    "BatchIndicatorCalculator",
     "IndicatorService",
+    "RunningSMA",
+    "RunningVWMA",
+    "RunningEMA",
+    "WilderRSI",
+    "WilderATR",
+    "SupertrendState",
+    "MACDState",
     "create_indicator_service",
 ]
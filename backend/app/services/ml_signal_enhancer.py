@@ -29,6 +29,8 @@ from sklearn.model_selection import TimeSeriesSplit, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import classification_report, confusion_matrix
 
+from app.utils.indicator_kernels import true_range
+
 logger = logging.getLogger(__name__)
 
 
@@ -346,11 +348,7 @@ class MLSignalEnhancer:
         plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0)
         minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0)
         
-        tr = pd.concat([
-            high - low,
-            (high - close.shift()).abs(),
-            (low - close.shift()).abs()
-        ], axis=1).max(axis=1)
+        tr = pd.Series(true_range(high.to_numpy(), low.to_numpy(), close.to_numpy()), index=df.index)
         
         atr = tr.rolling(window=period).mean()
         plus_di = 100 * plus_dm.rolling(window=period).mean() / (atr + 1e-10)
@@ -367,11 +365,7 @@ class MLSignalEnhancer:
         low = df['low']
         close = df['close']
         
-        tr = pd.concat([
-            high - low,
-            (high - close.shift()).abs(),
-            (low - close.shift()).abs()
-        ], axis=1).max(axis=1)
+        tr = pd.Series(true_range(high.to_numpy(), low.to_numpy(), close.to_numpy()), index=df.index)
         
         return tr.rolling(window=period).mean()
     
@@ -22,7 +22,14 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set, Type
 from zoneinfo import ZoneInfo
 
-from app.core.events import EventBus, EventType, IndicatorEvent, SignalEvent, get_event_bus
+from app.core.events import (
+    EventBus,
+    EventType,
+    IndicatorBatchEvent,
+    IndicatorEvent,
+    SignalEvent,
+    get_event_bus,
+)
 
 
 class SignalType(str, Enum):
@@ -886,6 +893,10 @@ class StrategyEngine:
             EventType.INDICATOR_UPDATED,
             self._on_indicator_event,
         )
+        await self.event_bus.subscribe(
+            EventType.INDICATORS_BATCH_UPDATED,
+            self._on_indicator_batch_event,
+        )
         
         self.logger.info("Strategy engine started")
     
@@ -907,46 +918,63 @@ class StrategyEngine:
     async def _on_indicator_event(self, event: IndicatorEvent) -> None:
         """Handle incoming indicator events."""
         try:
-            symbol = event.symbol
-            timeframe = event.timeframe
-            indicators = event.indicators
-            candle = event.metadata.get("candle", {})
-            
-            if not all([symbol, timeframe, indicators]):
-                return
-            
-            self._evaluation_count += 1
-            
-            # Evaluate all enabled strategies
-            for strategy in self.registry.get_enabled_strategies():
-                try:
-                    signal = await strategy.evaluate(
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        indicators=indicators,
-                        candle=candle
-                    )
+            await self._evaluate_strategies(
+                event.symbol,
+                event.timeframe,
+                event.indicators,
+                event.metadata.get("candle", {}),
+            )
+        except Exception as e:
+            self.logger.error(f"Error processing indicator event: {e}")
+    
+    async def _on_indicator_batch_event(self, event: IndicatorBatchEvent) -> None:
+        """Handle a batched indicator update (one evaluation per symbol)."""
+        try:
+            for symbol, indicators in event.rows():
+                await self._evaluate_strategies(symbol, event.timeframe, indicators, {})
+        except Exception as e:
+            self.logger.error(f"Error processing indicator batch event: {e}")
+    
+    async def _evaluate_strategies(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicators: Dict[str, float],
+        candle: Dict[str, Any],
+    ) -> None:
+        """Evaluate all enabled strategies for one symbol's indicators."""
+        if not all([symbol, timeframe, indicators]):
+            return
+        
+        self._evaluation_count += 1
+        
+        # Evaluate all enabled strategies
+        for strategy in self.registry.get_enabled_strategies():
+            try:
+                signal = await strategy.evaluate(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    indicators=indicators,
+                    candle=candle
+                )
+                
+                if signal:
+                    await self._publish_signal(signal)
+                    
+                    # Track signal count
+                    self._signal_count[strategy.strategy_id] = \
+                        self._signal_count.get(strategy.strategy_id, 0) + 1
                     
-                    if signal:
-                        await self._publish_signal(signal)
-                        
-                        # Track signal count
-                        self._signal_count[strategy.strategy_id] = \
-                            self._signal_count.get(strategy.strategy_id, 0) + 1
-                        
-                        self.logger.info(
-                            f"Signal generated: {signal.signal_type.value} "
-                            f"for {signal.symbol} by {signal.strategy_name}"
-                        )
-                        
-                except Exception as e:
-                    self.logger.error(
-                        f"Error evaluating strategy {strategy.name} "
-                        f"for {symbol}: {e}"
+                    self.logger.info(
+                        f"Signal generated: {signal.signal_type.value} "
+                        f"for {signal.symbol} by {signal.strategy_name}"
                     )
                     
-        except Exception as e:
-            self.logger.error(f"Error processing indicator event: {e}")
+            except Exception as e:
+                self.logger.error(
+                    f"Error evaluating strategy {strategy.name} "
+                    f"for {symbol}: {e}"
+                )
     
     async def _publish_signal(self, signal: Signal) -> None:
         """Publish signal to event bus."""
@@ -10,6 +10,9 @@ Available Strategies:
 2. RSIMomentumStrategy - RSI oversold/overbought with trend filter
 3. SupertrendStrategy - Supertrend direction changes
 4. VWAPBounceStrategy - Price bouncing off VWAP with volume confirmation
+
+Each strategy also states its entry rules as column masks (signal_masks) for
+the VectorizedBacktestEngine; keep them in step with evaluate().
 """
 
 import logging
@@ -18,9 +21,11 @@ from abc import ABC
 from dataclasses import field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 from app.services.strategy_engine import (
     BaseStrategy,
     Signal,
@@ -29,6 +34,9 @@ from app.services.strategy_engine import (
     StrategyState,
 )
 
+if TYPE_CHECKING:
+    from app.backtest.vectorized_engine import CandleArrays
+
 logger = logging.getLogger(__name__)
 IST = ZoneInfo("Asia/Kolkata")
 
@@ -87,6 +95,15 @@ class SimpleIndicatorStrategy(BaseStrategy):
         else:
             return entry_price - (risk * rr_ratio)
     
+    def signal_masks(self, data: "CandleArrays") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized evaluate(): (long entry, short entry) masks over all rows.
+        
+        A row is set where evaluate() would return that signal, given the
+        per-symbol state it keeps (``data.previous``).
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no vectorized entry rules")
+    
     def _create_signal(
         self,
         symbol: str,
@@ -236,6 +253,22 @@ class EMACrossoverStrategy(SimpleIndicatorStrategy):
                 )
         
         return None
+    
+    def signal_masks(self, data: "CandleArrays") -> Tuple[np.ndarray, np.ndarray]:
+        """EMA crossover masks (see evaluate)."""
+        fast_ema = data.column(f"ema_{self.config['fast_ema']}")
+        slow_ema = data.column(f"ema_{self.config['slow_ema']}")
+        trend_ema = data.column(f"ema_{self.config['trend_ema']}")
+        adx = data.column("adx", default=25)
+        
+        valid = ~(np.isnan(fast_ema) | np.isnan(slow_ema) | np.isnan(trend_ema))
+        prev_fast = data.previous(fast_ema, valid)
+        prev_slow = data.previous(slow_ema, valid)
+        trending = valid & (adx >= self.config["adx_threshold"])
+        
+        long_entry = trending & (prev_fast <= prev_slow) & (fast_ema > slow_ema) & (data.close > trend_ema)
+        short_entry = trending & (prev_fast >= prev_slow) & (fast_ema < slow_ema) & (data.close < trend_ema)
+        return long_entry, short_entry
 
 
 class RSIMomentumStrategy(SimpleIndicatorStrategy):
@@ -341,6 +374,21 @@ class RSIMomentumStrategy(SimpleIndicatorStrategy):
                 )
         
         return None
+    
+    def signal_masks(self, data: "CandleArrays") -> Tuple[np.ndarray, np.ndarray]:
+        """RSI momentum masks (see evaluate)."""
+        rsi = data.column(f"rsi_{self.config['rsi_period']}")
+        ema_fast = data.column(f"ema_{self.config['ema_fast']}")
+        ema_slow = data.column(f"ema_{self.config['ema_slow']}")
+        
+        valid = ~(np.isnan(rsi) | np.isnan(ema_fast) | np.isnan(ema_slow))
+        prev_rsi = data.previous(rsi, valid)
+        active = valid & (rsi >= self.config["extreme_oversold"]) & (rsi <= self.config["extreme_overbought"])
+        oversold, overbought = self.config["oversold"], self.config["overbought"]
+        
+        long_entry = active & (prev_rsi <= oversold) & (rsi > oversold) & (ema_fast > ema_slow)
+        short_entry = active & (prev_rsi >= overbought) & (rsi < overbought) & (ema_fast < ema_slow)
+        return long_entry, short_entry
 
 
 class SupertrendStrategy(SimpleIndicatorStrategy):
@@ -434,6 +482,20 @@ class SupertrendStrategy(SimpleIndicatorStrategy):
                 )
         
         return None
+    
+    def signal_masks(self, data: "CandleArrays") -> Tuple[np.ndarray, np.ndarray]:
+        """Supertrend direction change masks (see evaluate)."""
+        supertrend = data.column("supertrend")
+        direction = np.trunc(data.column("supertrend_direction"))
+        adx = data.column("adx", default=30)
+        
+        valid = ~(np.isnan(supertrend) | np.isnan(direction))
+        prev_direction = data.previous(direction, valid)
+        trending = valid & (adx >= self.config["adx_threshold"])
+        
+        long_entry = trending & (prev_direction == -1) & (direction == 1) & (data.close > supertrend)
+        short_entry = trending & (prev_direction == 1) & (direction == -1) & (data.close < supertrend)
+        return long_entry, short_entry
 
 
 class VWAPBounceStrategy(SimpleIndicatorStrategy):
@@ -533,6 +595,25 @@ class VWAPBounceStrategy(SimpleIndicatorStrategy):
                 )
         
         return None
+    
+    def signal_masks(self, data: "CandleArrays") -> Tuple[np.ndarray, np.ndarray]:
+        """VWAP bounce masks (see evaluate)."""
+        vwap = data.column("vwap")
+        rsi = data.column("rsi_14", default=50)
+        close = data.close
+        
+        valid = ~np.isnan(vwap)
+        prev_close = data.previous(close, valid)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance_pct = np.abs(close - vwap) / vwap * 100
+        # A zero VWAP raises ZeroDivisionError in evaluate(): no signal
+        near = valid & (vwap != 0) & ~(distance_pct > self.config["vwap_tolerance_pct"])
+        
+        long_entry = (near & (data.low <= vwap) & (vwap <= close) & (prev_close > vwap)
+                      & (rsi < self.config["rsi_overbought"]))
+        short_entry = (near & (data.high >= vwap) & (vwap >= close) & (prev_close < vwap)
+                       & (rsi > self.config["rsi_oversold"]))
+        return long_entry, short_entry
 
 
 # Strategy registry for easy access
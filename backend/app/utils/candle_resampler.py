@@ -1,10 +1,16 @@
 """
 Utility to resample 1-minute candles to higher timeframes
 """
+import numpy as np
 import pandas as pd
-from typing import Literal
+from typing import Dict, Iterable, Literal
+
+TimeframeType = Literal["1m", "5m", "15m", "30m", "1h", "2h", "4h", "1d"]
+
+# NSE session open, 09:15 IST, in minutes after midnight (IST is UTC+05:30)
+SESSION_OPEN_MINUTE = 9 * 60 + 15
+IST_OFFSET_MINUTES = 5 * 60 + 30
 
-TimeframeType = Literal["1m", "5m", "15m", "30m", "1h", "4h", "1d"]
 
 class CandleResampler:
     """Resample 1-minute candles to any timeframe"""
@@ -20,6 +26,26 @@ class CandleResampler:
         "1d": "1D",
     }
     
+    TIMEFRAME_MINUTES = {
+        "1m": 1,
+        "5m": 5,
+        "15m": 15,
+        "30m": 30,
+        "1h": 60,
+        "2h": 120,
+        "4h": 240,
+        "1d": 1440,
+    }
+    
+    # How each column is aggregated into a higher-timeframe bar
+    OHLCV_REDUCERS = {
+        "open": "first",
+        "high": np.maximum,
+        "low": np.minimum,
+        "close": "last",
+        "volume": np.add,
+    }
+    
     @staticmethod
     def resample(df: pd.DataFrame, target_timeframe: TimeframeType) -> pd.DataFrame:
         """
@@ -61,6 +87,72 @@ class CandleResampler:
         
         return resampled
     
+    @staticmethod
+    def session_buckets(minutes: np.ndarray, target_timeframe: TimeframeType) -> np.ndarray:
+        """
+        Start of each candle's bar, aligned to the 09:15 IST session open
+        
+        Args:
+            minutes: Candle times as integer minutes since the Unix epoch (UTC)
+            target_timeframe: Target timeframe; 1d bars start at 09:15 IST of the IST date
+            
+        Returns:
+            Bar start times in the same units
+        """
+        step = CandleResampler.TIMEFRAME_MINUTES.get(target_timeframe)
+        if not step:
+            raise ValueError(f"Unsupported timeframe: {target_timeframe}")
+        ist = minutes + IST_OFFSET_MINUTES
+        day = ist - ist % 1440
+        if step >= 1440:
+            bar = day + SESSION_OPEN_MINUTE
+        else:
+            bar = day + SESSION_OPEN_MINUTE + (ist - day - SESSION_OPEN_MINUTE) // step * step
+        return bar - IST_OFFSET_MINUTES
+    
+    @staticmethod
+    def resample_arrays(
+        timestamps: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        target_timeframes: Iterable[TimeframeType]
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Resample sorted 1-minute OHLCV arrays to several timeframes in one pass
+        
+        Each timeframe is a bucket key per candle and one ``reduceat`` per
+        column over the bucket boundaries; there is no per-bar Python loop.
+        Empty buckets produce no bar (as ``resample(...).dropna()``).
+        
+        Args:
+            timestamps: Naive UTC datetime64 candle times, ascending
+            columns: Any of open/high/low/close/volume as equal-length arrays
+            target_timeframes: Timeframes to build
+            
+        Returns:
+            {timeframe: {'timestamp': datetime64[m] bar starts, column: values}}
+        """
+        minutes = np.asarray(timestamps, dtype='datetime64[m]').astype(np.int64)
+        result = {}
+        for timeframe in target_timeframes:
+            buckets = CandleResampler.session_buckets(minutes, timeframe)
+            if len(buckets) == 0:
+                starts = np.zeros(0, dtype=np.intp)
+            else:
+                starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+            ends = np.append(starts[1:], len(buckets)) - 1
+            bars = {'timestamp': buckets[starts].astype('datetime64[m]')}
+            for name, values in columns.items():
+                reducer = CandleResampler.OHLCV_REDUCERS[name]
+                values = np.asarray(values)
+                if reducer == "first":
+                    bars[name] = values[starts]
+                elif reducer == "last":
+                    bars[name] = values[ends]
+                else:
+                    bars[name] = reducer.reduceat(values, starts) if len(starts) else values[:0]
+            result[timeframe] = bars
+        return result
+    
     @staticmethod
     def resample_with_indicators(
         df: pd.DataFrame, 
@@ -0,0 +1,255 @@
+"""
+Loop-free kernels for the recursive indicators.
+
+EMA, Wilder smoothing (RSI, ATR) and MACD are first-order linear filters
+
+    y[i] = decay * y[i-1] + gain * x[i]
+
+which ``linear_recurrence`` evaluates without a per-element Python loop:
+the series is cut into blocks, each block is solved in closed form with a
+scaled cumulative sum, and the block-to-block carries (themselves a linear
+recurrence with decay ``decay ** block``) are solved recursively. The block
+size is capped so ``decay ** -block`` stays far from overflow, which keeps
+the result within ~1e-12 (relative) of the sequential loop.
+
+Supertrend's band/direction switch is path dependent; its ATR and bands
+are vectorized and only the search for the next trend flip is sequential.
+
+Seeding follows scripts/pipeline/stage1_compute.py: a simple mean of the
+first ``period`` values, NaN before that. The pipeline (stage 1, refresh)
+and the live engine (via scripts/indicators_optimized.py) take their
+recursive indicators from here; MLSignalEnhancer shares ``true_range``.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Largest block-scaled weight, decay ** -block; far below float64 overflow
+# even after multiplying by price * volume sized inputs.
+_MAX_SCALE_LOG = math.log(1e100)
+_MAX_BLOCK = 256
+
+# Supertrend scans for the next trend flip in growing windows
+_RUN_WINDOW = 64
+_MAX_RUN_WINDOW = 8192
+
+
+def _block_size(decay: float) -> int:
+    return max(1, min(_MAX_BLOCK, int(_MAX_SCALE_LOG / -math.log(decay))))
+
+
+def linear_recurrence(x: np.ndarray, decay: float, gain: float = 1.0, initial: float = 0.0) -> np.ndarray:
+    """Evaluate y[i] = decay * y[i-1] + gain * x[i] with y[-1] = initial.
+
+    ``decay`` must be in [0, 1). NaN in ``x`` or ``initial`` propagates
+    forward exactly like the sequential loop.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if decay == 0.0:
+        return gain * x
+    y = _solve_blocked(x, decay, gain, initial)
+    if math.isnan(initial):
+        y[:] = np.nan
+    else:
+        nans = np.flatnonzero(np.isnan(x))
+        if len(nans):
+            y[nans[0]:] = np.nan
+    return y
+
+
+def _solve_blocked(x: np.ndarray, decay: float, gain: float, initial: float) -> np.ndarray:
+    n = len(x)
+    block = _block_size(decay)
+    if block == 1:
+        # decay < 1e-100: anything beyond one step back is below float64 resolution
+        y = gain * x
+        if n:
+            y[1:] += decay * y[:-1]
+            y[0] += decay * initial
+        return y
+
+    powers = decay ** np.arange(1, block + 1, dtype=np.float64)  # decay^(j+1)
+    scale = gain / powers
+    if n <= block:
+        return powers[:n] * (initial + np.cumsum(x * scale[:n]))
+
+    blocks = -(-n // block)
+    padded = np.zeros(blocks * block)
+    padded[:n] = x
+    padded = padded.reshape(blocks, block)
+
+    # Each block solved from a zero start, then shifted by its carry-in
+    padded *= scale
+    local = powers * np.cumsum(padded, axis=1)
+    ends = _solve_blocked(local[:, -1], decay ** block, 1.0, initial)
+    starts = np.concatenate(([initial], ends[:-1]))
+    return (local + powers * starts[:, None]).ravel()[:n]
+
+
+def ema(data: np.ndarray, period: int, initial: Optional[float] = None) -> np.ndarray:
+    """EMA with multiplier 2 / (period + 1), seeded with the first-period mean.
+
+    With ``initial`` (the EMA of the bar before ``data[0]``) the series is
+    continued instead of seeded, so every value is defined.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    multiplier = 2 / (period + 1)
+    if initial is not None:
+        return linear_recurrence(data, 1 - multiplier, multiplier, initial)
+    result = np.full(len(data), np.nan)
+    if len(data) < period:
+        return result
+    result[period - 1] = np.mean(data[:period])
+    result[period:] = linear_recurrence(data[period:], 1 - multiplier, multiplier, result[period - 1])
+    return result
+
+
+def wilder(data: np.ndarray, period: int, initial: Optional[float] = None) -> np.ndarray:
+    """Wilder smoothing, avg = (avg * (period - 1) + x) / period, seeded with the first-period mean.
+
+    ``initial`` continues from a previous average, as for ``ema``.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if initial is not None:
+        return linear_recurrence(data, (period - 1) / period, 1 / period, initial)
+    result = np.full(len(data), np.nan)
+    if len(data) < period:
+        return result
+    result[period - 1] = np.mean(data[:period])
+    result[period:] = linear_recurrence(data[period:], (period - 1) / period, 1 / period, result[period - 1])
+    return result
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               prev_close: Optional[float] = None) -> np.ndarray:
+    """True range; without ``prev_close`` the first bar uses high - low."""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    tr = high - low
+    if prev_close is not None:
+        prev = np.concatenate(([prev_close], close[:-1]))
+        np.maximum(tr, np.abs(high - prev), out=tr)
+        np.maximum(tr, np.abs(low - prev), out=tr)
+    elif len(tr) > 1:
+        prev = close[:-1]
+        np.maximum(tr[1:], np.abs(high[1:] - prev), out=tr[1:])
+        np.maximum(tr[1:], np.abs(low[1:] - prev), out=tr[1:])
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14,
+        initial: Optional[float] = None, prev_close: Optional[float] = None) -> np.ndarray:
+    """Wilder ATR; ``initial`` and ``prev_close`` continue from the bar before ``close[0]``."""
+    if initial is not None:
+        return wilder(true_range(high, low, close, prev_close), period, initial)
+    if len(close) < 2:
+        return np.full(len(close), np.nan)
+    return wilder(true_range(high, low, close), period)
+
+
+def rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI from Wilder average gain / loss; 100 while the average loss is zero."""
+    # 100 - 100 / (1 + gain / loss), written as one division
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.divide(avg_gain, avg_gain + avg_loss)
+    result *= 100
+    result[avg_loss == 0] = 100
+    return result
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder RSI; 100 while the average loss is zero."""
+    close = np.asarray(close, dtype=np.float64)
+    result = np.full(len(close), np.nan)
+    if len(close) < period + 1:
+        return result
+    deltas = np.diff(close)
+    avg_gain = wilder(np.where(deltas > 0, deltas, 0), period)[period - 1:]
+    avg_loss = wilder(np.where(deltas < 0, -deltas, 0), period)[period - 1:]
+    result[period:] = rsi_from_averages(avg_gain, avg_loss)
+    return result
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line (EMA of the valid MACD values) and histogram."""
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = np.full(len(macd_line), np.nan)
+    valid = np.flatnonzero(~np.isnan(macd_line))
+    if len(valid) >= signal:
+        signal_line[valid[0]:valid[0] + len(valid)] = ema(macd_line[valid], signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def supertrend(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               period: int = 10, multiplier: float = 3.0,
+               initial: Optional[Tuple[float, float, float, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Supertrend line and direction (1 up, -1 down, 0 before warm-up).
+
+    Within a trend the line is the running max of the lower band (up) or
+    running min of the upper band (down), so each run is one cumulative
+    max/min; only the search for the next flip is sequential, one step
+    per trend change rather than per bar.
+
+    ``initial`` continues a series from the bar before ``close[0]``:
+    (close, ATR, supertrend, direction) of that bar.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    line = np.full(n, np.nan)
+    direction = np.zeros(n, dtype=np.int16)
+
+    if initial is not None:
+        prev_close, prev_atr, prev_line, prev_direction = initial
+        band = multiplier * atr(high, low, close, period, prev_atr, prev_close)
+        # The first bar switches on the previous close, like every other bar
+        sign = 1 if prev_close > prev_line else -1
+        carry = prev_line if sign == prev_direction else None
+        start = 0
+    elif n < period:
+        return line, direction
+    else:
+        band = multiplier * atr(high, low, close, period)
+        # Seeded as a down trend starting at the upper band
+        start, sign, carry = period - 1, -1, None
+
+    hl2 = (high + low) / 2
+    upper = hl2 + band
+    lower = hl2 - band
+
+    while start < n:
+        bands, extreme = (lower, np.maximum) if sign == 1 else (upper, np.minimum)
+        pos, width = start, _RUN_WINDOW
+        while True:
+            run = extreme.accumulate(bands[pos:pos + width])
+            if carry is not None:
+                extreme(run, carry, out=run)
+            above = close[pos:pos + len(run)] > run
+            flips = ~above if sign == 1 else above
+            hit = int(flips.argmax()) if flips.any() else -1
+            end = pos + (hit + 1 if hit >= 0 else len(run))
+            line[pos:end] = run[:end - pos]
+            direction[pos:end] = sign
+            if hit >= 0 or end >= n:
+                break
+            pos, width, carry = end, min(width * 2, _MAX_RUN_WINDOW), run[-1]
+        start, sign, carry = end, -sign, None
+
+    return line, direction
+
+
+__all__ = [
+    "linear_recurrence",
+    "ema",
+    "wilder",
+    "true_range",
+    "atr",
+    "rsi",
+    "rsi_from_averages",
+    "macd",
+    "supertrend",
+]
@@ -0,0 +1,154 @@
+"""
+PostgreSQL binary COPY encoding from NumPy column buffers.
+
+Binary COPY rows are variable length (a NULL has no value bytes), so rows
+are grouped by their NULL pattern (and text values) and each group is
+filled column by column into a NumPy structured array over one output
+buffer. Row order inside the payload follows those groups, which is fine
+for a staging table that is merged with INSERT ... SELECT.
+
+Used by IndicatorComputationService.store_candles_with_indicators and the
+indicator pipeline (scripts/pipeline/columnar.py).
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + b'\x00\x00\x00\x00' + b'\x00\x00\x00\x00'
+COPY_TRAILER = b'\xff\xff'
+PG_EPOCH_US = 946_684_800_000_000  # 2000-01-01 in Unix microseconds
+
+# Big-endian wire format of the fixed-width types
+BINARY_DTYPES = {'int2': '>i2', 'int4': '>i4', 'int8': '>i8', 'float8': '>f8', 'timestamptz': '>i8'}
+
+_ENCODE_BLOCK_BYTES = 1 << 20
+
+
+@dataclass
+class CopyColumn:
+    """One column to encode.
+
+    Fixed-width kinds (BINARY_DTYPES) hold ``values`` in wire units
+    (timestamptz: microseconds since 2000-01-01). ``text`` / ``uuid``
+    columns are dictionary coded: ``values`` are int codes into
+    ``dictionary`` (already encoded bytes).
+    """
+    kind: str
+    values: np.ndarray
+    nulls: np.ndarray
+    dictionary: Optional[List[bytes]] = None
+
+
+def fixed_column(kind: str, values, nulls=None) -> CopyColumn:
+    """Fixed-width column; float NaN counts as NULL."""
+    values = np.asarray(values)
+    if nulls is None:
+        nulls = np.zeros(len(values), dtype=bool)
+    if values.dtype.kind == 'f':
+        nulls = nulls | np.isnan(values)
+        if kind != 'float8':
+            values = np.where(nulls, 0, values)
+    return CopyColumn(kind, values, nulls)
+
+
+def timestamp_column(values) -> CopyColumn:
+    """timestamptz column from naive UTC datetime64 values; NaT is NULL."""
+    stamps = np.asarray(values, dtype='datetime64[us]')
+    nulls = np.isnat(stamps)
+    micros = stamps.view(np.int64) - PG_EPOCH_US
+    return CopyColumn('timestamptz', np.where(nulls, 0, micros), nulls)
+
+
+def constant_column(value: str, n: int, kind: str = 'text') -> CopyColumn:
+    """The same text / uuid value on every row."""
+    if kind == 'uuid':
+        encoded = uuid.UUID(str(value)).bytes
+    else:
+        encoded = str(value).encode('utf-8')
+    return CopyColumn(kind, np.zeros(n, dtype=np.int32), np.zeros(n, dtype=bool), [encoded])
+
+
+def encode_copy_binary(columns: List[CopyColumn]) -> bytearray:
+    """Encode equal-length columns as one PostgreSQL binary COPY payload."""
+    n = len(columns[0].values) if columns else 0
+    masks, keys = [], []
+    for column in columns:
+        if column.dictionary is not None:
+            keys.append(np.ascontiguousarray(column.values, dtype=np.int32).view(np.uint8).reshape(n, 4))
+        masks.append(column.nulls)
+
+    # One group per distinct (NULL pattern, text values) combination
+    keys.append(np.packbits(np.column_stack(masks), axis=1))
+    key = np.ascontiguousarray(np.hstack(keys))
+    _, first, inverse = np.unique(key.view(f'V{key.shape[1]}').ravel(),
+                                  return_index=True, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    counts = np.bincount(inverse)
+
+    groups = []
+    for sample in first:
+        fields, present = [('count', '>i2')], []
+        for i, column in enumerate(columns):
+            fields.append((f'len{i}', '>i4'))
+            if column.nulls[sample]:
+                continue
+            if column.dictionary is not None:
+                value = column.dictionary[column.values[sample]]
+                if value:
+                    fields.append((f'val{i}', f'V{len(value)}'))
+                present.append((i, len(value), value))
+            else:
+                width = np.dtype(BINARY_DTYPES[column.kind]).itemsize
+                fields.append((f'val{i}', f'V{width}'))
+                present.append((i, width, None))
+        groups.append((np.dtype(fields), present))
+
+    # Fill every group in place in one output buffer, a cache-sized block
+    # of rows at a time; counts and lengths are constant within a group.
+    sizes = [dtype.itemsize * int(count) for (dtype, _), count in zip(groups, counts)]
+    payload = bytearray(len(COPY_HEADER) + sum(sizes) + len(COPY_TRAILER))
+    payload[:len(COPY_HEADER)] = COPY_HEADER
+    payload[len(payload) - len(COPY_TRAILER):] = COPY_TRAILER
+    offset, start = len(COPY_HEADER), 0
+    for (dtype, present), count, size in zip(groups, counts, sizes):
+        template = np.zeros((), dtype=dtype)
+        template['count'] = len(columns)
+        for i in range(len(columns)):
+            template[f'len{i}'] = -1
+        for i, width, value in present:
+            template[f'len{i}'] = width
+            if value is not None and width:
+                template[f'val{i}'] = np.frombuffer(value, dtype=f'V{width}')[0]
+        fills = [(f'val{i}', columns[i].values, BINARY_DTYPES[columns[i].kind], f'V{width}')
+                 for i, width, value in present if value is None]
+
+        out = np.ndarray(count, dtype=dtype, buffer=payload, offset=offset)
+        out_bytes = out.view(np.uint8).reshape(count, dtype.itemsize)
+        template_bytes = np.frombuffer(template.tobytes(), dtype=np.uint8)
+        rows = order[start:start + count]
+        offset += size
+        start += count
+        block = max(1, _ENCODE_BLOCK_BYTES // dtype.itemsize)
+        for lo in range(0, count, block):
+            chunk = out[lo:lo + block]
+            chunk_rows = rows[lo:lo + block]
+            out_bytes[lo:lo + block] = template_bytes
+            for field, values, big_endian, raw in fills:
+                chunk[field] = values[chunk_rows].astype(big_endian).view(raw)
+    return payload
+
+
+__all__ = [
+    "COPY_HEADER",
+    "COPY_TRAILER",
+    "PG_EPOCH_US",
+    "BINARY_DTYPES",
+    "CopyColumn",
+    "fixed_column",
+    "timestamp_column",
+    "constant_column",
+    "encode_copy_binary",
+]
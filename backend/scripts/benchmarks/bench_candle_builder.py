@@ -0,0 +1,119 @@
+"""
+Candle Builder Replay Benchmark
+Replays one synthetic trading day (09:15-15:30 IST) of ticks for a universe
+of symbols and reports ns/tick for each way of building candles:
+
+  object   : one CandleBuilder per symbol, process_tick per tick
+  columnar : ColumnarCandleBuilder.update_many on arrival-order micro-batches
+
+Both run the minute close sweep (close_due) the service schedules, and
+build the service's default timeframes (1m, 5m, 15m, 1h). Tick generation
+is not timed.
+
+Usage:
+    python scripts/benchmarks/bench_candle_builder.py
+    python scripts/benchmarks/bench_candle_builder.py --symbols 200 --ticks-per-symbol 5000
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from app.brokers.fyers_websocket import TickData  # noqa: E402
+from app.services.candle_builder import (  # noqa: E402
+    CandleBuilder,
+    ColumnarCandleBuilder,
+    Timeframe,
+)
+
+SESSION_START = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)  # 09:15 IST
+SESSION_SECONDS = 375 * 60
+TIMEFRAMES = [Timeframe.M1, Timeframe.M5, Timeframe.M15, Timeframe.H1]
+
+
+def synth_day(n_symbols: int, ticks_per_symbol: int, seed: int = 11):
+    """Time-ordered ticks; liquidity is skewed so some symbols trade rarely."""
+    rng = np.random.default_rng(seed)
+    weights = rng.pareto(1.2, n_symbols) + 0.05
+    counts = np.maximum(1, (weights / weights.sum() * n_symbols * ticks_per_symbol).astype(int))
+    symbols = np.repeat(np.arange(n_symbols), counts)
+    offsets = rng.uniform(0, SESSION_SECONDS, len(symbols))
+    order = np.argsort(offsets, kind="stable")
+    symbols, offsets = symbols[order], offsets[order]
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 2e-4, len(symbols))))
+    volumes = rng.integers(1, 50, len(symbols)) * 25
+    return symbols, np.round(prices, 2), volumes, offsets
+
+
+async def run_object(ticks: list, names: list) -> int:
+    builders = {name: CandleBuilder(name, timeframes=TIMEFRAMES) for name in names}
+    next_sweep = SESSION_START + timedelta(minutes=1)
+    candles = 0
+    for tick in ticks:
+        while tick.timestamp >= next_sweep:
+            for builder in builders.values():
+                candles += len(await builder.close_due(next_sweep))
+            next_sweep += timedelta(minutes=1)
+        candles += len(await builders[tick.symbol].process_tick(tick))
+    for builder in builders.values():
+        candles += len(builder.force_complete())
+    return candles
+
+
+def run_columnar(symbols, prices, volumes, epoch, batch: int) -> int:
+    builder = ColumnarCandleBuilder(TIMEFRAMES)
+    slots = np.array([builder.slot(f"SYM{i}") for i in range(symbols.max() + 1)])[symbols]
+    ois = np.zeros(len(symbols), dtype=np.int64)
+    next_sweep = int(SESSION_START.timestamp()) + 60
+    candles = 0
+    for lo in range(0, len(symbols), batch):
+        hi = min(lo + batch, len(symbols))
+        while epoch[lo] >= next_sweep:
+            candles += sum(len(b) for b in builder.close_due(next_sweep))
+            next_sweep += 60
+        batches = builder.update_many(slots[lo:hi], prices[lo:hi], volumes[lo:hi], ois[lo:hi], epoch[lo:hi])
+        candles += sum(len(b) for b in batches)
+    candles += sum(len(b) for b in builder.force_complete())
+    return candles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Candle builder replay benchmark')
+    parser.add_argument('--symbols', type=int, default=200, help='Universe size')
+    parser.add_argument('--ticks-per-symbol', type=int, default=2000, help='Average ticks per symbol per day')
+    parser.add_argument('--batch', type=int, default=500, help='Columnar micro-batch size')
+    parser.add_argument('--skip-object', action='store_true', help='Only run the columnar builder')
+    args = parser.parse_args()
+
+    symbols, prices, volumes, offsets = synth_day(args.symbols, args.ticks_per_symbol)
+    n = len(symbols)
+    epoch = int(SESSION_START.timestamp()) + offsets.astype(np.int64)
+    print(f"Replaying {n:,} ticks for {args.symbols} symbols over one session")
+
+    if not args.skip_object:
+        names = [f"SYM{i}" for i in range(args.symbols)]
+        ticks = [
+            TickData(symbol=names[s], ltp=float(p), volume=int(v),
+                     timestamp=SESSION_START + timedelta(seconds=float(o)))
+            for s, p, v, o in zip(symbols, prices, volumes, offsets)
+        ]
+        start = time.perf_counter()
+        candles = asyncio.run(run_object(ticks, names))
+        elapsed = time.perf_counter() - start
+        print(f"  object   {elapsed * 1e9 / n:>10,.0f} ns/tick  {candles:>8,} candles  {elapsed:6.2f}s")
+
+    start = time.perf_counter()
+    candles = run_columnar(symbols, prices, volumes, epoch, args.batch)
+    elapsed = time.perf_counter() - start
+    print(f"  columnar {elapsed * 1e9 / n:>10,.0f} ns/tick  {candles:>8,} candles  {elapsed:6.2f}s"
+          f"  (batch {args.batch})")
+
+
+if __name__ == '__main__':
+    main()
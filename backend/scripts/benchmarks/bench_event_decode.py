@@ -0,0 +1,140 @@
+"""
+Event Bus Consumer Decode Benchmark
+Measures events/sec through the EventBus stream consumer (_consume_stream:
+batched XREADGROUP, decode, dispatch, batched XACK) for the ways a stream
+message can be turned back into an event:
+
+  generic   : json.loads + BaseEvent.model_validate (previous behaviour,
+              subclass fields lost)
+  construct : registry lookup + json.loads + model_construct (no validation)
+  typed     : registry lookup + <ConcreteEvent>.model_validate_json (current)
+
+Redis is replaced by an in-memory stream with a no-op XACK so only the
+consumer's decode + dispatch + ack bookkeeping is timed.
+
+Usage:
+    python scripts/benchmarks/bench_event_decode.py
+    python scripts/benchmarks/bench_event_decode.py --events 50000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+logger.remove()  # the consumer logs at INFO each time it starts
+logger.add(sys.stderr, level='WARNING')
+
+from app.core.events import (  # noqa: E402
+    EVENT_MODEL_REGISTRY,
+    BaseEvent,
+    CandleEvent,
+    EventBus,
+    EventType,
+    IndicatorEvent,
+    Subscription,
+    TickEvent,
+)
+
+
+class _StreamRedis:
+    """Serves encoded messages to XREADGROUP, then stops the consumer."""
+
+    def __init__(self, bus: EventBus, messages: list):
+        self.bus = bus
+        self.pending = [(str(i), msg) for i, msg in enumerate(messages)]
+
+    async def xgroup_create(self, *args, **kwargs):
+        return True
+
+    async def xreadgroup(self, groupname, consumername, streams, count, block):
+        if not self.pending:
+            self.bus._running = False
+            return []
+        batch, self.pending = self.pending[:count], self.pending[count:]
+        return [(next(iter(streams)), batch)]
+
+    async def xack(self, *args):
+        return len(args) - 2
+
+
+class _GenericBus(EventBus):
+    """EventBus with the pre-registry decode (always BaseEvent)."""
+
+    def _decode_event(self, message_data):
+        return BaseEvent.model_validate(json.loads(message_data["data"]))
+
+
+class _ConstructBus(EventBus):
+    """Trusted-producer variant that skips validation via model_construct."""
+
+    def _decode_event(self, message_data):
+        data = json.loads(message_data["data"])
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
+        return EVENT_MODEL_REGISTRY[message_data["model"]].model_construct(**data)
+
+
+def build_messages(bus: EventBus, n: int) -> dict:
+    """Encoded stream messages per event kind."""
+    samples = {
+        "tick": lambda i: TickEvent(
+            instrument_id=f"NSE_FO|{i % 500}", symbol=f"OPT{i % 500}",
+            ltp=100 + i * 0.05, bid=99.9, ask=100.1, volume=1000 + i, oi=50000,
+        ),
+        "candle": lambda i: CandleEvent(
+            instrument_id=f"NSE_EQ|{i % 200}", symbol=f"EQ{i % 200}", timeframe="1m",
+            open=100.0, high=101.0, low=99.5, close=100.5, volume=12000,
+        ),
+        "indicator": lambda i: IndicatorEvent(
+            instrument_id=f"NSE_EQ|{i % 200}", symbol=f"EQ{i % 200}", timeframe="1m",
+            indicators={f"ind_{k}": float(k) for k in range(30)},
+        ),
+    }
+    return {kind: [bus._encode_event(make(i))[1] for i in range(n)] for kind, make in samples.items()}
+
+
+async def run(bus: EventBus, messages: list) -> float:
+    received = 0
+
+    async def handler(event):
+        nonlocal received
+        received += 1
+
+    stream = EventType.TICK_RECEIVED  # any stream: subscriptions are not filtered by type
+    bus._subscriptions = {stream: [Subscription(event_type=stream, handler=handler)]}
+    bus._redis = _StreamRedis(bus, messages)
+    bus._running = True
+    start = time.perf_counter()
+    await bus._consume_stream(stream)
+    elapsed = time.perf_counter() - start
+    assert received == len(messages)
+    return len(messages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus decode benchmark')
+    parser.add_argument('--events', type=int, default=20000, help='Messages per event kind')
+    args = parser.parse_args()
+
+    buses = {
+        "generic": _GenericBus(redis_url="redis://unused"),
+        "construct": _ConstructBus(redis_url="redis://unused"),
+        "typed": EventBus(redis_url="redis://unused"),
+    }
+    messages = build_messages(buses["typed"], args.events)
+
+    print(f"{'kind':<10}" + "".join(f"{name:>14}" for name in buses) + f"{'typed/generic':>15}")
+    for kind, msgs in messages.items():
+        rates = {name: asyncio.run(run(bus, msgs)) for name, bus in buses.items()}
+        print(f"{kind:<10}" + "".join(f"{r:>14,.0f}" for r in rates.values())
+              + f"{rates['typed'] / rates['generic']:>14.1f}x")
+    print("(events/sec per consumer)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Indicator Service Post-Close Latency Benchmark
+Times one candle-close burst (every symbol of a timeframe closes at the same
+boundary) through IndicatorService in both modes:
+
+  per-symbol : IndicatorCalculator.add_candle + compute_all per symbol
+  batch      : one BatchIndicatorCalculator.update for the whole universe
+
+Publishing is disabled so only indicator work is timed. Each universe size
+is warmed up past the longest lookback before the timed bursts.
+
+Usage:
+    python scripts/benchmarks/bench_indicator_batch.py
+    python scripts/benchmarks/bench_indicator_batch.py --symbols 100 500 2000
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from app.services.candle_builder import Candle, Timeframe  # noqa: E402
+from app.services.indicator_service import IndicatorService  # noqa: E402
+
+START = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+
+
+def bursts(n_symbols: int, n_bursts: int, seed: int = 2) -> list:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, (n_bursts, n_symbols)), axis=0))
+    spread = rng.uniform(0, 0.002, (n_bursts, n_symbols)) * close
+    volume = rng.integers(1, 10_000, (n_bursts, n_symbols))
+    return [
+        [
+            Candle(symbol=f"SYM{i}", timeframe=Timeframe.M1, timestamp=START + timedelta(minutes=b),
+                   open=close[b, i], high=close[b, i] + spread[b, i], low=close[b, i] - spread[b, i],
+                   close=close[b, i], volume=int(volume[b, i]), is_complete=True)
+            for i in range(n_symbols)
+        ]
+        for b in range(n_bursts)
+    ]
+
+
+async def run(batch: bool, data: list, warmup: int) -> float:
+    service = IndicatorService(timeframes=["1m"], batch=batch)
+    timings = []
+    for b, candles in enumerate(data):
+        start = time.perf_counter()
+        if batch:
+            await service._process_batch("1m", candles)
+        else:
+            for candle in candles:
+                await service.compute_indicators(candle.symbol, "1m", candle)
+        if b >= warmup:
+            timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IndicatorService post-close latency benchmark')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[50, 200, 1000], help='Universe sizes')
+    parser.add_argument('--bursts', type=int, default=40, help='Timed bursts per size')
+    args = parser.parse_args()
+
+    warmup = 210  # longest lookback is EMA/SMA 200
+    print(f"{'symbols':>8} {'per-symbol ms':>15} {'batch ms':>10} {'speedup':>8}")
+    for n in args.symbols:
+        data = bursts(n, warmup + args.bursts)
+        single = asyncio.run(run(False, data, warmup))
+        batch = asyncio.run(run(True, data, warmup))
+        print(f"{n:>8} {single * 1e3:>15.2f} {batch * 1e3:>10.2f} {single / batch:>7.1f}x")
+    print("(median latency of one candle-close burst)")
+
+
+if __name__ == '__main__':
+    main()
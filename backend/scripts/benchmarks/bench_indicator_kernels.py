@@ -0,0 +1,170 @@
+"""
+Recursive Indicator Kernel Benchmark
+Times the loop-free kernels in app/utils/indicator_kernels.py against the
+per-element Python loops they replaced in stage1_compute.py (kept below as
+the baseline), on one long synthetic 1m series, and reports the largest
+relative difference between the two.
+
+Usage:
+    python scripts/benchmarks/bench_indicator_kernels.py
+    python scripts/benchmarks/bench_indicator_kernels.py --bars 2000000 --target 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from app.utils import indicator_kernels  # noqa: E402
+
+
+# ============================================================================
+# BASELINE: the sequential loops previously in stage1_compute.py
+# ============================================================================
+
+def loop_ema(data, period):
+    result = np.full(len(data), np.nan)
+    if len(data) < period:
+        return result
+    multiplier = 2 / (period + 1)
+    result[period - 1] = np.mean(data[:period])
+    for i in range(period, len(data)):
+        result[i] = (data[i] - result[i - 1]) * multiplier + result[i - 1]
+    return result
+
+
+def loop_rsi(close, period=14):
+    result = np.full(len(close), np.nan)
+    if len(close) < period + 1:
+        return result
+    deltas = np.diff(close)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    result[period] = 100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    for i in range(period + 1, len(close)):
+        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        result[i] = 100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    return result
+
+
+def loop_atr(high, low, close, period=14):
+    n = len(close)
+    result = np.full(n, np.nan)
+    tr = np.zeros(n)
+    tr[0] = high[0] - low[0]
+    tr[1:] = np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])])
+    if n >= period:
+        result[period - 1] = np.mean(tr[:period])
+        for i in range(period, n):
+            result[i] = (result[i - 1] * (period - 1) + tr[i]) / period
+    return result
+
+
+def loop_macd(close, fast=12, slow=26, signal=9):
+    macd_line = loop_ema(close, fast) - loop_ema(close, slow)
+    signal_line = np.full(len(close), np.nan)
+    valid_macd = ~np.isnan(macd_line)
+    if np.sum(valid_macd) >= signal:
+        signal_calc = loop_ema(macd_line[valid_macd], signal)
+        start_idx = np.where(valid_macd)[0][0]
+        signal_line[start_idx:start_idx + len(signal_calc)] = signal_calc
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def loop_supertrend(high, low, close, period=10, multiplier=3.0):
+    atr = loop_atr(high, low, close, period)
+    hl2 = (high + low) / 2
+    upper_band = hl2 + (multiplier * atr)
+    lower_band = hl2 - (multiplier * atr)
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.zeros(n, dtype=np.int16)
+    if n >= period:
+        supertrend[period - 1] = upper_band[period - 1]
+        direction[period - 1] = -1
+        for i in range(period, n):
+            if close[i - 1] > supertrend[i - 1]:
+                supertrend[i] = max(lower_band[i], supertrend[i - 1] if direction[i - 1] == 1 else lower_band[i])
+                direction[i] = 1
+            else:
+                supertrend[i] = min(upper_band[i], supertrend[i - 1] if direction[i - 1] == -1 else upper_band[i])
+                direction[i] = -1
+    return supertrend, direction
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def synth_bars(n: int, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    close = np.round(20000 * np.exp(np.cumsum(rng.normal(0, 4e-4, n))), 2)
+    high = np.round(close * (1 + rng.uniform(0, 2e-3, n)), 2)
+    low = np.round(close * (1 - rng.uniform(0, 2e-3, n)), 2)
+    return high, low, close
+
+
+def best_of(fn, args, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def max_relative_diff(a, b) -> float:
+    a, b = np.atleast_2d(np.asarray(a, dtype=float)), np.atleast_2d(np.asarray(b, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        diff = np.abs(a - b) / np.maximum(np.abs(a), 1.0)
+    return float(np.nanmax(diff)) if np.isfinite(diff).any() else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recursive indicator kernel benchmark')
+    parser.add_argument('--bars', type=int, default=500_000, help='Series length (1m bars)')
+    parser.add_argument('--repeat', type=int, default=3, help='Best-of repeats per timing')
+    parser.add_argument('--target', type=float, default=10.0, help='Required speedup')
+    args = parser.parse_args()
+
+    high, low, close = synth_bars(args.bars)
+    cases = [
+        ('ema_9', loop_ema, indicator_kernels.ema, (close, 9)),
+        ('ema_200', loop_ema, indicator_kernels.ema, (close, 200)),
+        ('rsi_14', loop_rsi, indicator_kernels.rsi, (close, 14)),
+        ('atr_14', loop_atr, indicator_kernels.atr, (high, low, close, 14)),
+        ('macd', loop_macd, indicator_kernels.macd, (close, 12, 26, 9)),
+        ('supertrend', loop_supertrend, indicator_kernels.supertrend, (high, low, close, 10, 3)),
+    ]
+
+    print(f"{args.bars:,} bars, best of {args.repeat}")
+    print(f"  {'indicator':<12}{'loop ms':>10}{'kernel ms':>11}{'speedup':>9}{'max rel diff':>14}")
+    total_loop = total_kernel = 0.0
+    slow = []
+    for name, baseline, kernel, call_args in cases:
+        loop_time, expected = best_of(baseline, call_args, 1)
+        kernel_time, actual = best_of(kernel, call_args, args.repeat)
+        total_loop += loop_time
+        total_kernel += kernel_time
+        speedup = loop_time / kernel_time
+        if speedup < args.target:
+            slow.append(name)
+        print(f"  {name:<12}{loop_time * 1e3:>10,.1f}{kernel_time * 1e3:>11,.1f}{speedup:>8.1f}x"
+              f"{max_relative_diff(expected, actual):>14.1e}")
+
+    print(f"  {'total':<12}{total_loop * 1e3:>10,.1f}{total_kernel * 1e3:>11,.1f}"
+          f"{total_loop / total_kernel:>8.1f}x")
+    if slow:
+        print(f"Below {args.target:g}x target: {', '.join(slow)}")
+        sys.exit(1)
+    print(f"All kernels at or above {args.target:g}x")
+
+
+if __name__ == '__main__':
+    main()
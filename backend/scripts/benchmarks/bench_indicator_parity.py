@@ -0,0 +1,312 @@
+"""
+Indicator Parity and Throughput Benchmark
+Runs every implementation of the indicator math on the same OHLCV data and
+reports, per indicator, throughput (candles/sec) and the largest absolute
+deviation from the pipeline (stage1_compute.py, the indicator_kernels
+based reference):
+
+  stage1      : scripts/pipeline/stage1_compute.py (reference)
+  optimized   : scripts/indicators_optimized.py
+  computation : IndicatorComputationService._compute_* (pandas)
+  ml_enhancer : MLSignalEnhancer._calculate_* (pandas)
+  live        : IndicatorService's IndicatorCalculator, one candle at a time
+  raw_candle  : raw_candle_strategies.IndicatorComputer, one candle at a time
+
+Deviation is reported over all bars where both series are defined and again
+after the warm-up (seeding conventions differ, so early bars disagree most);
+n/a means the two never overlap.
+``live`` updates every indicator in one add_candle call, so its throughput
+is that of the whole update. The summary names the fastest implementation
+within --tolerance of the reference after warm-up.
+
+Datasets are a synthetic 1m series plus any recorded candles given with
+--data (CSV or Parquet with timestamp, open, high, low, close, volume).
+
+Usage:
+    python scripts/benchmarks/bench_indicator_parity.py
+    python scripts/benchmarks/bench_indicator_parity.py --bars 50000 --data nifty_1m.parquet
+"""
+import argparse
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(BACKEND_DIR / 'scripts'))
+sys.path.insert(0, str(BACKEND_DIR / 'scripts' / 'pipeline'))
+logger.remove()  # app imports log handler registration at DEBUG
+logger.add(sys.stderr, level='WARNING')
+
+import indicators_optimized  # noqa: E402
+import stage1_compute  # noqa: E402
+from app.services.candle_builder import Candle, Timeframe  # noqa: E402
+from app.services.indicator_service import IndicatorCalculator  # noqa: E402
+from app.strategies.raw_candle_strategies import IndicatorComputer  # noqa: E402
+
+INDICATORS = ['sma_20', 'ema_9', 'ema_200', 'rsi_14', 'atr_14', 'macd', 'macd_signal',
+              'bb_upper', 'vwap', 'obv', 'supertrend', 'adx']
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def synth_candles(n: int, seed: int = 7) -> pd.DataFrame:
+    """1m candles over 09:15-15:30 IST sessions (UTC timestamps)."""
+    days = pd.bdate_range('2024-01-01', periods=n // 375 + 1).to_numpy() + np.timedelta64(225, 'm')
+    minutes = np.arange(375).astype('timedelta64[m]')
+    timestamps = pd.to_datetime((days[:, None] + minutes[None, :]).ravel()[:n], utc=True)
+    rng = np.random.default_rng(seed)
+    close = np.round(20000 * np.exp(np.cumsum(rng.normal(0, 4e-4, n))), 2)
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': np.round(close * (1 + rng.normal(0, 5e-4, n)), 2),
+        'high': np.round(close * (1 + rng.uniform(0, 2e-3, n)), 2),
+        'low': np.round(close * (1 - rng.uniform(0, 2e-3, n)), 2),
+        'close': close,
+        'volume': rng.integers(1, 500, n) * 25,
+    })
+
+
+def load_candles(path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(path) if path.suffix == '.parquet' else pd.read_csv(path)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+    return df.sort_values('timestamp').reset_index(drop=True)
+
+
+# ============================================================================
+# IMPLEMENTATIONS
+# Vectorized ones return {indicator: callable}; streaming ones return
+# (seconds, {indicator: values}).
+# ============================================================================
+
+def stage1_impl(df: pd.DataFrame) -> dict:
+    h, l, c = (df[k].to_numpy(float) for k in ('high', 'low', 'close'))
+    v = df['volume'].to_numpy(float)
+    ts = df['timestamp'].dt.to_pydatetime().tolist()
+    return {
+        'sma_20': lambda: stage1_compute.compute_sma(c, 20),
+        'ema_9': lambda: stage1_compute.compute_ema(c, 9),
+        'ema_200': lambda: stage1_compute.compute_ema(c, 200),
+        'rsi_14': lambda: stage1_compute.compute_rsi(c, 14),
+        'atr_14': lambda: stage1_compute.compute_atr(h, l, c, 14),
+        'macd': lambda: stage1_compute.compute_macd(c)[0],
+        'macd_signal': lambda: stage1_compute.compute_macd(c)[1],
+        'bb_upper': lambda: stage1_compute.compute_bollinger(c, 20, 2)[0],
+        'vwap': lambda: stage1_compute.compute_vwap(h, l, c, v, ts),
+        'obv': lambda: stage1_compute.compute_obv(c, v),
+        'supertrend': lambda: stage1_compute.compute_supertrend(h, l, c, 10, 3)[0],
+        'adx': lambda: stage1_compute.compute_adx(h, l, c, 14)[0],
+    }
+
+
+def optimized_impl(df: pd.DataFrame) -> dict:
+    opt = indicators_optimized
+    h, l, c = (df[k].to_numpy(float) for k in ('high', 'low', 'close'))
+    v = df['volume'].to_numpy(float)
+    return {
+        'sma_20': lambda: opt.compute_sma(c, 20),
+        'ema_9': lambda: opt.compute_ema(c, 9),
+        'ema_200': lambda: opt.compute_ema(c, 200),
+        'rsi_14': lambda: opt.compute_rsi(c, 14),
+        'atr_14': lambda: opt.compute_atr(h, l, c, 14),
+        'macd': lambda: opt.compute_macd(c)[0],
+        'macd_signal': lambda: opt.compute_macd(c)[1],
+        'bb_upper': lambda: opt.compute_bollinger(c, 20, 2)[0],
+        'vwap': lambda: opt.compute_vwap(h, l, c, v),
+        'obv': lambda: opt.compute_obv(c, v),
+        'supertrend': lambda: opt.compute_supertrend(h, l, c, 10, 3)[0],
+        'adx': lambda: opt.compute_adx(h, l, c, 14)[0],
+    }
+
+
+def computation_impl(df: pd.DataFrame) -> dict:
+    # Imported here: the service module pulls in the ORM models
+    from app.services.indicator_computation import IndicatorComputationService as svc
+    h, l, c, v, ts = df['high'], df['low'], df['close'], df['volume'].astype(float), df['timestamp']
+    return {
+        'sma_20': lambda: c.rolling(window=20).mean(),  # inline in compute_all_indicators
+        'ema_9': lambda: c.ewm(span=9, adjust=False).mean(),
+        'ema_200': lambda: c.ewm(span=200, adjust=False).mean(),
+        'rsi_14': lambda: svc._compute_rsi(c, 14),
+        'atr_14': lambda: svc._compute_atr(h, l, c, 14),
+        'macd': lambda: svc._compute_macd(c)['macd'],
+        'macd_signal': lambda: svc._compute_macd(c)['signal'],
+        'bb_upper': lambda: svc._compute_bollinger_bands(c)['upper'],
+        'vwap': lambda: svc._compute_vwap(h, l, c, v, ts),
+        'obv': lambda: svc._compute_obv(c, v),
+        'supertrend': lambda: svc._compute_supertrend(h, l, c)['supertrend'],
+        'adx': lambda: svc._compute_adx(h, l, c),
+    }
+
+
+def ml_enhancer_impl(df: pd.DataFrame) -> dict:
+    from app.services.ml_signal_enhancer import MLSignalEnhancer
+    ml = MLSignalEnhancer(model_dir=tempfile.mkdtemp())
+    c = df['close']
+    return {
+        'sma_20': lambda: c.rolling(20).mean(),  # inline in extract_features
+        'ema_9': lambda: c.ewm(span=9).mean(),
+        'ema_200': lambda: c.ewm(span=200).mean(),
+        'rsi_14': lambda: ml._calculate_rsi(c, 14),
+        'atr_14': lambda: ml._calculate_atr(df, 14),
+        'macd': lambda: ml._calculate_macd(c)[0],
+        'macd_signal': lambda: ml._calculate_macd(c)[1],
+        'bb_upper': lambda: ml._calculate_bollinger(c, 20, 2)[0],
+        'vwap': lambda: ml._calculate_vwap(df),
+        'obv': lambda: ml._calculate_obv(df),
+        'adx': lambda: ml._calculate_adx(df, 14)[0],
+    }
+
+
+def live_impl(df: pd.DataFrame) -> tuple:
+    names = [n for n in INDICATORS if n not in ('bb_upper', 'vwap', 'obv', 'adx')]
+    candles = [
+        Candle(symbol='BENCH', timeframe=Timeframe.M1, timestamp=row.timestamp, open=row.open,
+               high=row.high, low=row.low, close=row.close, volume=int(row.volume))
+        for row in df.itertuples()
+    ]
+    calc = IndicatorCalculator('BENCH', '1m')
+    out = {name: np.full(len(df), np.nan) for name in names}
+    elapsed = 0.0
+    for i, candle in enumerate(candles):
+        start = time.perf_counter()
+        calc.add_candle(candle)
+        elapsed += time.perf_counter() - start
+        for name in names:
+            out[name][i] = calc._values[name]
+    return elapsed, out
+
+
+def raw_candle_impl(df: pd.DataFrame) -> tuple:
+    getters = {
+        'sma_20': lambda ic: ic.get_sma('X', 20),
+        'ema_9': lambda ic: ic.get_ema('X', 9),
+        'ema_200': lambda ic: ic.get_ema('X', 200),
+        'rsi_14': lambda ic: ic.get_rsi('X', 14),
+        'atr_14': lambda ic: ic.get_atr('X', 14),
+        'macd': lambda ic: (ic.get_macd('X') or {}).get('macd'),
+        'macd_signal': lambda ic: (ic.get_macd('X') or {}).get('signal'),
+        'bb_upper': lambda ic: (ic.get_bollinger_bands('X') or {}).get('upper'),
+    }
+    candles = df[['high', 'low', 'close', 'volume']].to_dict('records')
+    out, elapsed = {}, defaultdict(float)
+    for name, get in getters.items():
+        # A fresh computer per indicator: get_ema / get_macd advance cached EMAs
+        ic = IndicatorComputer()
+        values = np.full(len(df), np.nan)
+        start = time.perf_counter()
+        for i, candle in enumerate(candles):
+            ic.update('X', candle)
+            value = get(ic)
+            if value is not None:
+                values[i] = value
+        elapsed[name] = time.perf_counter() - start
+        out[name] = values
+    return elapsed, out
+
+
+VECTORIZED = {
+    'stage1': stage1_impl,
+    'optimized': optimized_impl,
+    'computation': computation_impl,
+    'ml_enhancer': ml_enhancer_impl,
+}
+STREAMING = {
+    'live': live_impl,
+    'raw_candle': raw_candle_impl,
+}
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def best_of(fn, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), np.asarray(result, dtype=float)
+
+
+def max_abs_diff(reference: np.ndarray, values: np.ndarray, start: int = 0) -> float:
+    both = np.isfinite(reference[start:]) & np.isfinite(values[start:])
+    if not both.any():
+        return np.nan
+    return float(np.max(np.abs(reference[start:][both] - values[start:][both])))
+
+
+def format_dev(dev: float) -> str:
+    return 'n/a' if np.isnan(dev) else f"{dev:.3g}"
+
+
+def run_dataset(df: pd.DataFrame, repeat: int, warmup: int, only: list) -> dict:
+    """{indicator: [(implementation, candles/s, max dev, max dev after warm-up)]}"""
+    n = len(df)
+    timings, series = {}, {}
+    for name, impl in {**VECTORIZED, **STREAMING}.items():
+        if only and name not in only and name != 'stage1':
+            continue
+        try:
+            if name in VECTORIZED:
+                calls = impl(df)
+                for indicator, fn in calls.items():
+                    timings[name, indicator], series[name, indicator] = best_of(fn, 1 if name == 'computation' else repeat)
+            else:
+                elapsed, values = impl(df)
+                for indicator, array in values.items():
+                    timings[name, indicator] = elapsed[indicator] if isinstance(elapsed, dict) else elapsed
+                    series[name, indicator] = array
+        except Exception as e:
+            print(f"  {name}: unavailable ({type(e).__name__}: {e})")
+
+    results = defaultdict(list)
+    for (name, indicator), values in series.items():
+        reference = series['stage1', indicator]
+        results[indicator].append((
+            name, n / timings[name, indicator],
+            max_abs_diff(reference, values), max_abs_diff(reference, values, warmup),
+        ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Indicator parity and throughput benchmark')
+    parser.add_argument('--bars', type=int, default=20_000, help='Synthetic series length (1m bars)')
+    parser.add_argument('--data', type=Path, action='append', default=[],
+                        help='Recorded candles (CSV / Parquet); repeatable')
+    parser.add_argument('--repeat', type=int, default=3, help='Best-of repeats for vectorized implementations')
+    parser.add_argument('--warmup', type=int, default=1000, help='Bars skipped for the after-warm-up deviation')
+    parser.add_argument('--tolerance', type=float, default=1e-6, help='Max abs deviation that counts as matching')
+    parser.add_argument('--only', nargs='+', help='Implementations to run besides stage1')
+    args = parser.parse_args()
+
+    datasets = [('synthetic', synth_candles(args.bars))]
+    datasets += [(path.name, load_candles(path)) for path in args.data]
+
+    for label, df in datasets:
+        print(f"\n{label}: {len(df):,} bars, warm-up {args.warmup:,}")
+        results = run_dataset(df, args.repeat, args.warmup, args.only)
+        print(f"  {'indicator':<12}{'implementation':<14}{'candles/s':>14}{'max abs dev':>14}{'after warm-up':>15}")
+        best = {}
+        for indicator in INDICATORS:
+            for name, rate, dev, dev_warm in sorted(results[indicator], key=lambda r: -r[1]):
+                print(f"  {indicator:<12}{name:<14}{rate:>14,.0f}{format_dev(dev):>14}{format_dev(dev_warm):>15}")
+                if dev_warm <= args.tolerance and indicator not in best:
+                    best[indicator] = name
+        print(f"  fastest within {args.tolerance:g} of stage1 after warm-up:")
+        for indicator in INDICATORS:
+            print(f"    {indicator:<12}{best.get(indicator, '-')}")
+
+
+if __name__ == '__main__':
+    main()
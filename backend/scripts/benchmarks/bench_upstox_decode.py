@@ -0,0 +1,206 @@
+"""
+Upstox Feed Decode Microbenchmark
+Replays binary FeedResponse frames through both decode paths of
+UpstoxWebSocketAdapter and reports ticks/sec.
+
+  dict   : ParseFromString -> MessageToDict -> _process_feed (legacy)
+  direct : ParseFromString -> decode_feed_into (no intermediate dict)
+
+Frames are read from a recording (--frames) or synthesized for N full-mode
+F&O instruments. Recording format: 4-byte big-endian length + raw frame,
+repeated. Use --write-frames to save the synthetic set in that format.
+
+Usage:
+    python scripts/benchmarks/bench_upstox_decode.py
+    python scripts/benchmarks/bench_upstox_decode.py --instruments 500 --frames-count 200
+    python scripts/benchmarks/bench_upstox_decode.py --frames data/upstox_frames.bin
+"""
+import argparse
+import asyncio
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(
+    BACKEND_DIR / 'archive' / 'upstox-python-master' / 'examples' / 'websocket' / 'market_data' / 'v3'
+))
+
+import MarketDataFeedV3_pb2 as pb  # noqa: E402
+
+import app.brokers.upstox_websocket as uws  # noqa: E402
+from app.brokers.upstox_websocket import (  # noqa: E402
+    DecodeMode,
+    UpstoxTickData,
+    UpstoxWebSocketAdapter,
+)
+
+
+# ============================================================================
+# FRAME SOURCES
+# ============================================================================
+
+def synth_frames(n_instruments: int, n_frames: int, seed: int = 7) -> list:
+    """Build full-mode frames: mostly option marketFF feeds plus a few indices."""
+    rng = random.Random(seed)
+    keys = [f"NSE_FO|{40000 + i}" for i in range(n_instruments)]
+    index_keys = ["NSE_INDEX|Nifty 50", "NSE_INDEX|Nifty Bank"]
+    prices = {k: rng.uniform(5, 500) for k in keys + index_keys}
+    base_ts = 1_733_000_000_000
+
+    frames = []
+    for f in range(n_frames):
+        resp = pb.FeedResponse()
+        resp.type = pb.live_feed
+        resp.currentTs = base_ts + f * 1000
+
+        for key in keys:
+            p = prices[key] = max(0.05, prices[key] * (1 + rng.gauss(0, 0.002)))
+            feed = resp.feeds[key]
+            mff = feed.fullFeed.marketFF
+            mff.ltpc.ltp = round(p, 2)
+            mff.ltpc.ltt = resp.currentTs
+            mff.ltpc.ltq = rng.randint(1, 20) * 25
+            mff.ltpc.cp = round(p * 0.98, 2)
+            for lvl in range(5):
+                q = mff.marketLevel.bidAskQuote.add()
+                q.bidP = round(p - 0.05 * (lvl + 1), 2)
+                q.bidQ = rng.randint(1, 100) * 25
+                q.askP = round(p + 0.05 * (lvl + 1), 2)
+                q.askQ = rng.randint(1, 100) * 25
+            mff.optionGreeks.delta = rng.uniform(-1, 1)
+            mff.optionGreeks.theta = -rng.uniform(0, 10)
+            mff.optionGreeks.gamma = rng.uniform(0, 0.01)
+            mff.optionGreeks.vega = rng.uniform(0, 20)
+            mff.optionGreeks.rho = rng.uniform(-1, 1)
+            for interval in ("1d", "I1"):
+                bar = mff.marketOHLC.ohlc.add()
+                bar.interval = interval
+                bar.open, bar.high, bar.low, bar.close = p * 0.97, p * 1.03, p * 0.95, p
+                bar.vol = rng.randint(1000, 500000)
+                bar.ts = resp.currentTs
+            mff.atp = round(p * 0.99, 2)
+            mff.vtt = rng.randint(1000, 5_000_000)
+            mff.oi = float(rng.randint(1000, 2_000_000))
+            mff.iv = rng.uniform(0.1, 0.6)
+            mff.tbq = float(rng.randint(1000, 100000))
+            mff.tsq = float(rng.randint(1000, 100000))
+
+        for key in index_keys:
+            p = prices[key] = prices[key] * (1 + rng.gauss(0, 0.0005))
+            iff = resp.feeds[key].fullFeed.indexFF
+            iff.ltpc.ltp = round(p, 2)
+            iff.ltpc.ltt = resp.currentTs
+            iff.ltpc.cp = round(p * 0.99, 2)
+            bar = iff.marketOHLC.ohlc.add()
+            bar.interval = "1d"
+            bar.open, bar.high, bar.low, bar.close = p * 0.99, p * 1.01, p * 0.98, p
+
+        frames.append(resp.SerializeToString())
+    return frames
+
+
+def read_frames(path: Path) -> list:
+    """Read length-prefixed frames."""
+    data = path.read_bytes()
+    frames, pos = [], 0
+    while pos + 4 <= len(data):
+        (size,) = struct.unpack_from(">I", data, pos)
+        pos += 4
+        frames.append(data[pos:pos + size])
+        pos += size
+    return frames
+
+
+def write_frames(path: Path, frames: list) -> None:
+    """Write length-prefixed frames."""
+    with open(path, "wb") as fh:
+        for frame in frames:
+            fh.write(struct.pack(">I", len(frame)))
+            fh.write(frame)
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def make_adapter(mode: DecodeMode, sink: list = None) -> UpstoxWebSocketAdapter:
+    """Adapter wired for offline decoding (no socket, no event bus)."""
+    async def record(tick: UpstoxTickData) -> None:
+        sink.append(tick.to_dict())
+
+    return UpstoxWebSocketAdapter(
+        access_token="bench",
+        on_tick=record if sink is not None else None,
+        publish_to_event_bus=False,
+        decode_mode=mode,
+    )
+
+
+async def replay(adapter: UpstoxWebSocketAdapter, frames: list) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        await adapter._process_message(frame)
+    return time.perf_counter() - start
+
+
+def check_parity(frames: list) -> None:
+    """Both paths must produce identical ticks (timestamps aside)."""
+    out = {}
+    for mode in (DecodeMode.DICT, DecodeMode.DIRECT):
+        sink = []
+        asyncio.run(replay(make_adapter(mode, sink), frames[:3]))
+        for d in sink:
+            d.pop("timestamp")
+        out[mode] = sink
+
+    if out[DecodeMode.DICT] != out[DecodeMode.DIRECT]:
+        for a, b in zip(out[DecodeMode.DICT], out[DecodeMode.DIRECT]):
+            if a != b:
+                diff = {k: (a[k], b[k]) for k in a if a[k] != b[k]}
+                raise SystemExit(f"Decode mismatch for {a['instrument_key']}: {diff}")
+    print(f"Parity OK ({len(out[DecodeMode.DIRECT])} ticks compared)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upstox feed decode benchmark')
+    parser.add_argument('--frames', type=Path, help='Recorded frames file (length-prefixed)')
+    parser.add_argument('--write-frames', type=Path, help='Save synthetic frames to this file')
+    parser.add_argument('--instruments', type=int, default=500, help='Synthetic instruments per frame')
+    parser.add_argument('--frames-count', type=int, default=100, help='Synthetic frames')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per mode (best is reported)')
+    args = parser.parse_args()
+
+    # Frames come from the archive proto module; point the adapter at it
+    uws.pb = pb
+    uws.UPSTOX_PROTO_AVAILABLE = True
+
+    if args.frames:
+        frames = read_frames(args.frames)
+        source = str(args.frames)
+    else:
+        frames = synth_frames(args.instruments, args.frames_count)
+        source = f"synthetic ({args.instruments} instruments x {args.frames_count} frames)"
+        if args.write_frames:
+            write_frames(args.write_frames, frames)
+
+    n_ticks = sum(len(pb.FeedResponse.FromString(f).feeds) for f in frames)
+    print(f"Frames: {len(frames)} from {source}, {n_ticks:,} ticks, "
+          f"{sum(map(len, frames)) / 1e6:.1f} MB")
+
+    check_parity(frames)
+
+    results = {}
+    for mode in (DecodeMode.DICT, DecodeMode.DIRECT):
+        best = min(asyncio.run(replay(make_adapter(mode), frames)) for _ in range(args.repeat))
+        results[mode] = n_ticks / best
+        print(f"  {mode.value:<7} {results[mode]:>12,.0f} ticks/sec  ({best * 1e9 / n_ticks:,.0f} ns/tick)")
+
+    print(f"Speedup: {results[DecodeMode.DIRECT] / results[DecodeMode.DICT]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
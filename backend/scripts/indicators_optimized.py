@@ -1,9 +1,15 @@
 """
 Optimized indicator functions using vectorized rolling operations.
 """
+import sys
+from pathlib import Path
+
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from app.utils import indicator_kernels  # noqa: E402
+
 
 def compute_sma(data: np.ndarray, period: int) -> np.ndarray:
     """SMA using cumsum (fast)."""
@@ -15,68 +21,18 @@ def compute_sma(data: np.ndarray, period: int) -> np.ndarray:
 
 
 def compute_ema(data: np.ndarray, period: int) -> np.ndarray:
-    """EMA - optimized with numba if available, else loop."""
-    result = np.full(len(data), np.nan)
-    if len(data) < period:
-        return result
-    
-    multiplier = 2 / (period + 1)
-    result[period - 1] = np.mean(data[:period])
-    
-    # Loop is actually efficient for EMA due to data dependency
-    for i in range(period, len(data)):
-        result[i] = (data[i] - result[i - 1]) * multiplier + result[i - 1]
-    return result
+    """EMA - loop-free recurrence from indicator_kernels."""
+    return indicator_kernels.ema(data, period)
 
 
 def compute_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
-    """RSI - loop needed due to Wilder smoothing."""
-    result = np.full(len(close), np.nan)
-    if len(close) < period + 1:
-        return result
-    
-    deltas = np.diff(close)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-    
-    avg_gain = np.mean(gains[:period])
-    avg_loss = np.mean(losses[:period])
-    
-    if avg_loss == 0:
-        result[period] = 100
-    else:
-        result[period] = 100 - (100 / (1 + avg_gain / avg_loss))
-    
-    for i in range(period + 1, len(close)):
-        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
-        if avg_loss == 0:
-            result[i] = 100
-        else:
-            result[i] = 100 - (100 / (1 + avg_gain / avg_loss))
-    return result
+    """RSI - Wilder smoothing via indicator_kernels."""
+    return indicator_kernels.rsi(close, period)
 
 
 def compute_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
-    """ATR - vectorized TR, loop for smoothing."""
-    n = len(close)
-    result = np.full(n, np.nan)
-    if n < 2:
-        return result
-    
-    # Vectorized True Range
-    tr = np.maximum.reduce([
-        high[1:] - low[1:],
-        np.abs(high[1:] - close[:-1]),
-        np.abs(low[1:] - close[:-1])
-    ])
-    tr = np.insert(tr, 0, high[0] - low[0])
-    
-    if n >= period:
-        result[period - 1] = np.mean(tr[:period])
-        for i in range(period, n):
-            result[i] = (result[i - 1] * (period - 1) + tr[i]) / period
-    return result
+    """ATR - vectorized TR and Wilder smoothing."""
+    return indicator_kernels.atr(high, low, close, period)
 
 
 def compute_vwap(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
@@ -190,29 +146,8 @@ def compute_williams_r(high: np.ndarray, low: np.ndarray, close: np.ndarray, per
 
 def compute_supertrend(high: np.ndarray, low: np.ndarray, close: np.ndarray,
                        period: int = 10, multiplier: float = 3.0) -> tuple:
-    """SuperTrend - ATR vectorized, trend loop needed."""
-    atr = compute_atr(high, low, close, period)
-    hl2 = (high + low) / 2
-    upper_band = hl2 + (multiplier * atr)
-    lower_band = hl2 - (multiplier * atr)
-    
-    n = len(close)
-    supertrend = np.full(n, np.nan)
-    direction = np.zeros(n, dtype=np.int16)
-    
-    if n >= period:
-        supertrend[period - 1] = upper_band[period - 1]
-        direction[period - 1] = -1
-        
-        for i in range(period, n):
-            if close[i - 1] > supertrend[i - 1]:
-                supertrend[i] = max(lower_band[i], supertrend[i - 1] if direction[i - 1] == 1 else lower_band[i])
-                direction[i] = 1
-            else:
-                supertrend[i] = min(upper_band[i], supertrend[i - 1] if direction[i - 1] == -1 else upper_band[i])
-                direction[i] = -1
-    
-    return supertrend, direction
+    """SuperTrend - ATR vectorized, one sequential step per trend flip."""
+    return indicator_kernels.supertrend(high, low, close, period, multiplier)
 
 
 def compute_adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> tuple:
@@ -227,13 +162,7 @@ def compute_adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: in
     minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
     
     # Vectorized TR
-    tr = np.zeros(n)
-    tr[0] = high[0] - low[0]
-    tr[1:] = np.maximum.reduce([
-        high[1:] - low[1:],
-        np.abs(high[1:] - close[:-1]),
-        np.abs(low[1:] - close[:-1])
-    ])
+    tr = indicator_kernels.true_range(high, low, close)
     
     atr = compute_ema(tr, period)
     smooth_plus_dm = compute_ema(plus_dm, period)
@@ -257,19 +186,7 @@ def compute_adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: in
 
 def compute_macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
     """MACD."""
-    ema_fast = compute_ema(close, fast)
-    ema_slow = compute_ema(close, slow)
-    macd_line = ema_fast - ema_slow
-    
-    signal_line = np.full(len(close), np.nan)
-    valid_macd = ~np.isnan(macd_line)
-    if np.sum(valid_macd) >= signal:
-        macd_valid = macd_line[valid_macd]
-        signal_calc = compute_ema(macd_valid, signal)
-        start_idx = np.where(valid_macd)[0][0]
-        signal_line[start_idx:start_idx + len(signal_calc)] = signal_calc
-    
-    return macd_line, signal_line, macd_line - signal_line
+    return indicator_kernels.macd(close, fast, slow, signal)
 
 
 def compute_obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
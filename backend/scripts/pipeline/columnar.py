@@ -0,0 +1,156 @@
+"""
+Columnar Indicator Output
+Keeps computed indicators as Arrow record batches from compute to load:
+the batch is written to Parquet as-is and encoded straight into a
+PostgreSQL binary COPY payload, without a pickle file or per-row tuples.
+
+The binary COPY encoding itself lives in app/utils/pg_copy.py; this
+module maps Arrow columns onto it.
+"""
+import io
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from incremental_state import compute_incremental
+from stage1_compute import compute_all_indicators
+from app.utils import pg_copy  # noqa: E402  (backend on sys.path via stage1_compute)
+
+PARQUET_DIR = Path(__file__).parent.parent / 'data' / 'indicators'
+
+# Columns loaded into indicator_data (same set as stage 3)
+DB_COLUMNS = [
+    'instrument_id', 'timeframe', 'timestamp',
+    'sma_9', 'sma_20', 'sma_50', 'sma_200',
+    'ema_9', 'ema_21', 'ema_50', 'ema_200',
+    'vwap', 'rsi_14',
+    'macd', 'macd_signal', 'macd_histogram',
+    'atr_14', 'bb_upper', 'bb_middle', 'bb_lower',
+    'adx', 'plus_di', 'minus_di',
+    'supertrend', 'supertrend_direction',
+    'obv', 'volume_sma_20',
+    'pivot_point', 'pivot_r1', 'pivot_r2', 'pivot_s1', 'pivot_s2',
+    'fib_r1', 'fib_r2', 'fib_s1', 'fib_s2'
+]
+
+# Staging table column types (binary COPY needs exact types; the INSERT
+# from staging casts to indicator_data's NUMERIC / BIGINT columns)
+STAGING_TYPES = {
+    'instrument_id': 'uuid',
+    'timeframe': 'text',
+    'timestamp': 'timestamptz',
+    'supertrend_direction': 'int4',
+}
+STAGING_TABLE = 'indicator_staging'
+
+_SQL_TYPES = {
+    'uuid': 'UUID', 'text': 'VARCHAR(10)', 'timestamptz': 'TIMESTAMPTZ',
+    'int4': 'INTEGER', 'float8': 'DOUBLE PRECISION',
+}
+COPY_HEADER = pg_copy.COPY_HEADER
+COPY_TRAILER = pg_copy.COPY_TRAILER
+PG_EPOCH_US = pg_copy.PG_EPOCH_US
+
+
+def staging_type(column: str) -> str:
+    return STAGING_TYPES.get(column, 'float8')
+
+
+def to_record_batch(indicators: dict, instrument_id: str, timeframe: str) -> pa.RecordBatch:
+    """Arrow batch from compute_all_indicators output, laid out like the stage 2 Parquet files."""
+    n = len(indicators['close'])
+    arrays = {
+        'timestamp': pa.array(indicators['timestamp'], type=pa.timestamp('us', tz='UTC')),
+        'instrument_id': pa.array(np.full(n, str(instrument_id), dtype=object), type=pa.string()),
+        'timeframe': pa.array(np.full(n, timeframe, dtype=object), type=pa.string()),
+    }
+    for name, values in indicators.items():
+        if name not in arrays:
+            arrays[name] = pa.array(values, from_pandas=True)  # NaN -> null, as stage 2 wrote it
+    return pa.RecordBatch.from_pydict(arrays)
+
+
+def parquet_path(symbol: str, timeframe: str, suffix: str = None) -> Path:
+    """Stage 2 file naming: symbol cleaned of characters that cause issues.
+    
+    ``suffix`` tells incremental files apart from the full history file.
+    """
+    safe_symbol = symbol.replace('&', '_').replace(' ', '_').replace('-', '_')
+    name = f"{safe_symbol}_indicators_{timeframe}" + (f"_{suffix}" if suffix else '')
+    return PARQUET_DIR / f"{name}.parquet"
+
+
+def write_parquet(batch: pa.RecordBatch, path: Path) -> Path:
+    pq.write_table(pa.Table.from_batches([batch]), path, compression='snappy')
+    return path
+
+
+def _copy_column(column: pa.Array, kind: str) -> pg_copy.CopyColumn:
+    """Arrow column as a pg_copy column, in binary COPY units."""
+    nulls = column.is_null().to_numpy(zero_copy_only=False)
+    if kind in ('uuid', 'text'):
+        encoded = column.dictionary_encode()
+        codes = encoded.indices.fill_null(0).to_numpy(zero_copy_only=False).astype(np.int32)
+        if kind == 'uuid':
+            values = [uuid.UUID(v).bytes for v in encoded.dictionary.to_pylist()]
+        else:
+            values = [v.encode('utf-8') for v in encoded.dictionary.to_pylist()]
+        return pg_copy.CopyColumn(kind, codes, nulls, values or [b''])
+    if kind == 'timestamptz':
+        micros = column.cast(pa.timestamp('us', tz='UTC')).cast(pa.int64())
+        return pg_copy.CopyColumn(kind, micros.fill_null(0).to_numpy() - PG_EPOCH_US, nulls)
+    if kind == 'float8':
+        return pg_copy.fixed_column(kind, column.cast(pa.float64()).to_numpy(zero_copy_only=False), nulls)
+    return pg_copy.CopyColumn(kind, column.fill_null(0).to_numpy(zero_copy_only=False), nulls)
+
+
+def encode_copy_binary(batch: pa.RecordBatch, columns: list) -> bytearray:
+    """Encode ``columns`` of ``batch`` as a PostgreSQL binary COPY payload (staging types)."""
+    return pg_copy.encode_copy_binary([_copy_column(batch.column(name), staging_type(name)) for name in columns])
+
+
+def compute_columnar(instrument_id: str, symbol: str, timeframe: str,
+                     timestamps, high, low, close, volume,
+                     parquet: bool = True, incremental: bool = False, state=None) -> tuple:
+    """Compute indicators, write Parquet and encode the COPY payload (runs in a worker process).
+
+    With ``incremental`` the candles are those after ``state`` and only
+    their rows are written, to a Parquet file suffixed with the first new
+    candle's time. Returns (parquet path or None, binary COPY payload,
+    row count, state after these candles or None); the caller saves the
+    state once the payload is loaded.
+    """
+    new_state, suffix = None, None
+    if incremental:
+        indicators, new_state = compute_incremental(state, timestamps, high, low, close, volume)
+        if state is not None and state.is_warm:
+            suffix = timestamps[0].strftime('%Y%m%d%H%M')
+    else:
+        indicators = compute_all_indicators(timestamps, high, low, close, volume)
+    batch = to_record_batch(indicators, instrument_id, timeframe)
+    path = write_parquet(batch, parquet_path(symbol, timeframe, suffix)) if parquet else None
+    return path, encode_copy_binary(batch, DB_COLUMNS), batch.num_rows, new_state
+
+
+async def copy_payload(conn, payload: bytes, columns: list = DB_COLUMNS,
+                       on_conflict: str = 'DO NOTHING') -> int:
+    """COPY a binary payload into this connection's staging table, then into indicator_data.
+
+    The staging table always has every DB column, since it lives as long
+    as the pooled connection and later batches may carry columns this
+    one lacks; only ``columns`` are copied and merged.
+    """
+    column_sql = ', '.join(f"{c} {_SQL_TYPES[staging_type(c)]}" for c in DB_COLUMNS)
+    await conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ({column_sql})")
+    await conn.execute(f"TRUNCATE {STAGING_TABLE}")
+    await conn.copy_to_table(STAGING_TABLE, source=io.BytesIO(payload), columns=columns, format='binary')
+    names = ', '.join(columns)
+    result = await conn.execute(f"""
+        INSERT INTO indicator_data ({names})
+        SELECT {names} FROM {STAGING_TABLE}
+        ON CONFLICT (instrument_id, timeframe, timestamp) {on_conflict}
+    """)
+    return int(result.split()[-1]) if result else 0
@@ -0,0 +1,257 @@
+"""
+Incremental Indicator State
+Persists, per instrument and timeframe, what the recursive indicators need
+to continue from the last computed candle (EMA values, Wilder averages,
+Supertrend line/direction, OBV total, the current VWAP session sums) plus
+a short tail of candles for the windowed indicators (SMA-200 is the
+longest). A daily refresh then fetches and computes only the new candles:
+
+    state = load_state(instrument_id, '1m')
+    candles = await fetch_candles(conn, instrument_id, '1m', since=resume_after(state))
+    indicators, state = compute_incremental(state, *candles)
+    ...store indicators...
+    save_state(instrument_id, '1m', state)
+
+Continued values match a full recompute up to float rounding (the
+recurrences are the same; only the summation order differs). Without a
+warm state (missing, or fewer than WARMUP_CANDLES candles so far) the
+caller fetches everything and compute_incremental does a full compute.
+"""
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from stage1_compute import compute_all_indicators, directional_index, directional_movement, trading_dates
+from app.utils import indicator_kernels  # noqa: E402  (backend on sys.path via stage1_compute)
+
+STATE_DIR = Path(__file__).parent.parent / 'data' / 'indicator_state'
+
+# Candles kept for the windowed indicators (SMA-200 window minus one)
+TAIL_CANDLES = 199
+# Candles before every recursive indicator is seeded (EMA-200)
+WARMUP_CANDLES = 200
+
+EMA_PERIODS = (9, 21, 50, 200)
+MACD_PERIODS = (12, 26, 9)
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+ADX_PERIOD = 14
+SUPERTREND_PERIOD, SUPERTREND_MULTIPLIER = 10, 3
+
+
+@dataclass
+class IndicatorState:
+    """Warm-up state at ``last_timestamp`` (JSON-serializable)."""
+    last_timestamp: str
+    candle_count: int
+    values: Dict[str, float]
+    vwap_date: str
+    tail: Dict[str, List] = field(default_factory=dict)
+
+    @property
+    def is_warm(self) -> bool:
+        return self.candle_count >= WARMUP_CANDLES
+
+    def tail_arrays(self) -> tuple:
+        """(timestamps, high, low, close, volume) of the last TAIL_CANDLES candles."""
+        timestamps = [datetime.fromisoformat(ts) for ts in self.tail['timestamp']]
+        return (timestamps, *(np.array(self.tail[k], dtype=np.float64) for k in ('high', 'low', 'close', 'volume')))
+
+
+def state_path(instrument_id: str, timeframe: str) -> Path:
+    return STATE_DIR / timeframe / f"{instrument_id}.json"
+
+
+def load_state(instrument_id: str, timeframe: str = '1m') -> Optional[IndicatorState]:
+    path = state_path(instrument_id, timeframe)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return IndicatorState(**json.load(f))
+
+
+def save_state(instrument_id: str, timeframe: str, state: IndicatorState):
+    path = state_path(instrument_id, timeframe)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(asdict(state), f)
+    tmp.replace(path)
+
+
+def resume_after(state: Optional[IndicatorState]) -> Optional[datetime]:
+    """Timestamp to fetch candles after, or None when a full fetch is needed."""
+    if state is None or not state.is_warm:
+        return None
+    return datetime.fromisoformat(state.last_timestamp)
+
+
+def _last(values: np.ndarray) -> float:
+    return float(values[-1])
+
+
+def _vwap_session(timestamps, high, low, close, volume) -> Tuple[str, float, float]:
+    """(date, cumulative TP*V, cumulative volume) of the last VWAP session."""
+    dates = trading_dates(timestamps)
+    earlier = np.flatnonzero(dates != dates[-1])
+    start = earlier[-1] + 1 if len(earlier) else 0
+    typical_price = (high[start:] + low[start:] + close[start:]) / 3
+    return str(dates[-1]), _last(np.cumsum(typical_price * volume[start:])), _last(np.cumsum(volume[start:]))
+
+
+def _tail(timestamps, high, low, close, volume) -> Dict[str, List]:
+    return {
+        'timestamp': [ts.isoformat() for ts in timestamps[-TAIL_CANDLES:]],
+        'high': high[-TAIL_CANDLES:].tolist(),
+        'low': low[-TAIL_CANDLES:].tolist(),
+        'close': close[-TAIL_CANDLES:].tolist(),
+        'volume': volume[-TAIL_CANDLES:].tolist(),
+    }
+
+
+def capture_state(indicators: dict) -> IndicatorState:
+    """State at the last row of a full compute_all_indicators result."""
+    timestamps = indicators['timestamp']
+    high, low, close, volume = (indicators[k] for k in ('high', 'low', 'close', 'volume'))
+    fast, slow, _ = MACD_PERIODS
+    deltas = np.diff(close)
+    plus_dm, minus_dm = directional_movement(high, low)
+    tr = indicator_kernels.true_range(high, low, close)
+
+    values = {name: _last(indicators[name]) for name in
+              (*(f'ema_{p}' for p in EMA_PERIODS), 'macd_signal', 'atr_14', 'supertrend', 'adx')}
+    values.update({
+        f'ema_{fast}': _last(indicator_kernels.ema(close, fast)),
+        f'ema_{slow}': _last(indicator_kernels.ema(close, slow)),
+        'rsi_avg_gain': _last(indicator_kernels.wilder(np.where(deltas > 0, deltas, 0), RSI_PERIOD)),
+        'rsi_avg_loss': _last(indicator_kernels.wilder(np.where(deltas < 0, -deltas, 0), RSI_PERIOD)),
+        'supertrend_atr': _last(indicator_kernels.atr(high, low, close, SUPERTREND_PERIOD)),
+        'supertrend_direction': int(indicators['supertrend_direction'][-1]),
+        'adx_tr': _last(indicator_kernels.ema(tr, ADX_PERIOD)),
+        'adx_plus_dm': _last(indicator_kernels.ema(plus_dm, ADX_PERIOD)),
+        'adx_minus_dm': _last(indicator_kernels.ema(minus_dm, ADX_PERIOD)),
+        'obv': int(indicators['obv'][-1]),
+    })
+    vwap_date, values['vwap_tpv'], values['vwap_volume'] = _vwap_session(timestamps, high, low, close, volume)
+
+    return IndicatorState(
+        last_timestamp=timestamps[-1].isoformat(),
+        candle_count=len(close),
+        values=values,
+        vwap_date=vwap_date,
+        tail=_tail(timestamps, high, low, close, volume),
+    )
+
+
+def _continue_vwap(state: IndicatorState, timestamps, high, low, close, volume) -> Tuple[np.ndarray, str, float, float]:
+    """VWAP for the new candles, carrying the open session's sums over."""
+    n = len(close)
+    dates = trading_dates(timestamps)
+    typical_price = (high + low + close) / 3
+    day_starts = np.flatnonzero(np.concatenate([[True], dates[1:] != dates[:-1]]))
+    tpv, vol = np.empty(n), np.empty(n)
+    for i, start in enumerate(day_starts):
+        end = day_starts[i + 1] if i + 1 < len(day_starts) else n
+        tpv[start:end] = np.cumsum(typical_price[start:end] * volume[start:end])
+        vol[start:end] = np.cumsum(volume[start:end])
+    first_end = day_starts[1] if len(day_starts) > 1 else n
+    if str(dates[0]) == state.vwap_date:
+        tpv[:first_end] += state.values['vwap_tpv']
+        vol[:first_end] += state.values['vwap_volume']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = np.where(vol > 0, tpv / vol, np.nan)
+    return vwap, str(dates[-1]), _last(tpv), _last(vol)
+
+
+def extend_indicators(state: IndicatorState, timestamps, high, low, close, volume) -> Tuple[dict, IndicatorState]:
+    """Indicators for candles after ``state.last_timestamp`` and the state after them.
+
+    Returns the same keys as compute_all_indicators, for the new candles only.
+    """
+    high, low, close, volume = (np.asarray(a, dtype=np.float64) for a in (high, low, close, volume))
+    tail_ts, tail_high, tail_low, tail_close, tail_volume = state.tail_arrays()
+    k = len(tail_close)
+
+    # Windowed and per-bar indicators: recompute over tail + new, keep the new rows
+    window = compute_all_indicators(
+        tail_ts + list(timestamps),
+        np.concatenate([tail_high, high]), np.concatenate([tail_low, low]),
+        np.concatenate([tail_close, close]), np.concatenate([tail_volume, volume]),
+    )
+    indicators = {name: values[k:] for name, values in window.items()}
+
+    # Recursive indicators: continue from the saved values
+    prev = state.values
+    prev_high, prev_low, prev_close = tail_high[-1], tail_low[-1], tail_close[-1]
+    fast, slow, signal = MACD_PERIODS
+    ema = indicator_kernels.ema
+    for p in EMA_PERIODS:
+        indicators[f'ema_{p}'] = ema(close, p, prev[f'ema_{p}'])
+    ema_fast, ema_slow = ema(close, fast, prev[f'ema_{fast}']), ema(close, slow, prev[f'ema_{slow}'])
+    macd = ema_fast - ema_slow
+    macd_signal = ema(macd, signal, prev['macd_signal'])
+    indicators.update(macd=macd, macd_signal=macd_signal, macd_histogram=macd - macd_signal)
+
+    deltas = np.diff(close, prepend=prev_close)
+    avg_gain = indicator_kernels.wilder(np.where(deltas > 0, deltas, 0), RSI_PERIOD, prev['rsi_avg_gain'])
+    avg_loss = indicator_kernels.wilder(np.where(deltas < 0, -deltas, 0), RSI_PERIOD, prev['rsi_avg_loss'])
+    indicators['rsi_14'] = indicator_kernels.rsi_from_averages(avg_gain, avg_loss)
+    indicators['atr_14'] = indicator_kernels.atr(high, low, close, ATR_PERIOD, prev['atr_14'], prev_close)
+
+    supertrend_atr = indicator_kernels.atr(high, low, close, SUPERTREND_PERIOD, prev['supertrend_atr'], prev_close)
+    indicators['supertrend'], indicators['supertrend_direction'] = indicator_kernels.supertrend(
+        high, low, close, SUPERTREND_PERIOD, SUPERTREND_MULTIPLIER,
+        initial=(prev_close, prev['supertrend_atr'], prev['supertrend'], prev['supertrend_direction']),
+    )
+
+    plus_dm, minus_dm = directional_movement(high, low, prev_high, prev_low)
+    adx_tr = ema(indicator_kernels.true_range(high, low, close, prev_close), ADX_PERIOD, prev['adx_tr'])
+    adx_plus_dm = ema(plus_dm, ADX_PERIOD, prev['adx_plus_dm'])
+    adx_minus_dm = ema(minus_dm, ADX_PERIOD, prev['adx_minus_dm'])
+    indicators['plus_di'], indicators['minus_di'], dx = directional_index(adx_tr, adx_plus_dm, adx_minus_dm)
+    indicators['adx'] = ema(dx, ADX_PERIOD, prev['adx'])
+
+    obv_flow = np.cumsum(np.sign(deltas) * volume)
+    indicators['obv'] = (prev['obv'] + obv_flow).astype(np.int64)
+
+    indicators['vwap'], vwap_date, vwap_tpv, vwap_volume = _continue_vwap(state, timestamps, high, low, close, volume)
+
+    values = {name: _last(indicators[name]) for name in
+              (*(f'ema_{p}' for p in EMA_PERIODS), 'macd_signal', 'atr_14', 'supertrend', 'adx')}
+    values.update({
+        f'ema_{fast}': _last(ema_fast),
+        f'ema_{slow}': _last(ema_slow),
+        'rsi_avg_gain': _last(avg_gain),
+        'rsi_avg_loss': _last(avg_loss),
+        'supertrend_atr': _last(supertrend_atr),
+        'supertrend_direction': int(indicators['supertrend_direction'][-1]),
+        'adx_tr': _last(adx_tr),
+        'adx_plus_dm': _last(adx_plus_dm),
+        'adx_minus_dm': _last(adx_minus_dm),
+        'obv': int(indicators['obv'][-1]),
+        'vwap_tpv': vwap_tpv,
+        'vwap_volume': vwap_volume,
+    })
+    new_state = IndicatorState(
+        last_timestamp=timestamps[-1].isoformat(),
+        candle_count=state.candle_count + len(close),
+        values=values,
+        vwap_date=vwap_date,
+        tail=_tail(window['timestamp'], window['high'], window['low'], window['close'], window['volume']),
+    )
+    return indicators, new_state
+
+
+def compute_incremental(state: Optional[IndicatorState], timestamps, high, low, close, volume) -> Tuple[dict, IndicatorState]:
+    """Extend from a warm ``state``, otherwise compute everything and capture the state.
+
+    Without a warm state the candles must be the full history (see resume_after).
+    """
+    if state is not None and state.is_warm:
+        return extend_indicators(state, timestamps, high, low, close, volume)
+    indicators = compute_all_indicators(timestamps, high, low, close, volume)
+    return indicators, capture_state(indicators)
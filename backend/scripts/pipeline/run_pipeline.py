@@ -1,13 +1,19 @@
 """
 Pipeline Runner: Orchestrates all 3 stages
-Can run stages independently or together.
+Can run stages independently or together, or as one streaming pass
+(--stream) that keeps computed indicators as Arrow record batches: each
+batch is written to Parquet and binary-COPYed into indicator_data
+directly, skipping the pickle files and per-row tuples of stages 2 and 3.
+--timeframes additionally precomputes higher timeframes resampled from 1m.
 """
+import asyncio
 import subprocess
 import sys
 import argparse
 from pathlib import Path
 
 SCRIPTS_DIR = Path(__file__).parent
+STREAM_PROGRESS_FILE = SCRIPTS_DIR.parent / 'data' / 'stream_progress.jsonl'
 
 
 def run_stage(stage_num: int, args: list = None):
@@ -30,14 +36,55 @@ def run_stage(stage_num: int, args: list = None):
     return result.returncode == 0
 
 
+def run_stream(args) -> bool:
+    """Run stage 1 with columnar output: Parquet + binary COPY, no pickle hop.
+    
+    With --incremental only candles after each instrument's saved warm-up
+    state are computed and loaded; the state advances after the COPY.
+    """
+    import columnar
+    import incremental_state
+    import stage1_compute
+    
+    async def load(pool, instrument_id, symbol, result):
+        path, payload, rows, state = result
+        async with pool.acquire() as conn:
+            inserted = await columnar.copy_payload(conn, payload)
+        if state is not None:
+            incremental_state.save_state(instrument_id, '1m', state)
+        return f"{path.name}, {inserted:,}/{rows:,} rows loaded"
+    
+    print(f"\n{'='*60}")
+    print("RUNNING STREAMING PIPELINE: compute -> Parquet + COPY")
+    print(f"{'='*60}\n")
+    
+    columnar.PARQUET_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        asyncio.run(stage1_compute.main(
+            args.workers, args.type, args.limit, True, args.compute_workers,
+            compute_fn=columnar.compute_columnar, on_result=load,
+            progress_file=STREAM_PROGRESS_FILE, incremental=args.incremental,
+            timeframes=args.timeframes.split(',') if args.timeframes else None,
+        ))
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        return False
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(description='Indicator Pipeline Runner')
     parser.add_argument('--stage', type=int, choices=[1, 2, 3], help='Run specific stage only')
     parser.add_argument('--all', action='store_true', help='Run all stages sequentially')
-    parser.add_argument('--workers', type=int, default=8, help='Workers for Stage 1 (default: 8)')
+    parser.add_argument('--stream', action='store_true', help='Compute straight to Parquet + DB (no pickle / stage 2 / stage 3)')
+    parser.add_argument('--workers', type=int, default=8, help='DB fetch workers for Stage 1 (default: 8)')
+    parser.add_argument('--compute-workers', type=int, help='Compute processes for Stage 1 (default: CPU count)')
     parser.add_argument('--type', choices=['EQUITY', 'INDEX', 'FUTURES', 'CE', 'PE'], help='Instrument type filter')
     parser.add_argument('--limit', type=int, help='Limit number of instruments')
     parser.add_argument('--watch', action='store_true', help='Stage 2 watch mode')
+    parser.add_argument('--incremental', action='store_true', help='Stage 1 / --stream: only candles after the saved warm-up state')
+    parser.add_argument('--timeframes', help='Stage 1 / --stream: comma-separated timeframes resampled from 1m (e.g. 1m,5m,15m,1h,1d)')
+    parser.add_argument('--memory-limit-mb', type=int, help='Stage 1: per-worker memory budget for one chunk (estimated, not an RSS cap); longer histories are computed in chunks')
     
     args = parser.parse_args()
     
@@ -46,10 +93,18 @@ def main():
         stage_args = []
         if args.stage == 1:
             stage_args = ['--workers', str(args.workers)]
+            if args.compute_workers:
+                stage_args += ['--compute-workers', str(args.compute_workers)]
             if args.type:
                 stage_args += ['--type', args.type]
             if args.limit:
                 stage_args += ['--limit', str(args.limit)]
+            if args.incremental:
+                stage_args += ['--incremental']
+            if args.timeframes:
+                stage_args += ['--timeframes', args.timeframes]
+            if args.memory_limit_mb:
+                stage_args += ['--memory-limit-mb', str(args.memory_limit_mb)]
         elif args.stage == 2 and args.watch:
             stage_args = ['--watch']
         
@@ -59,10 +114,16 @@ def main():
     elif args.all:
         # Run all stages sequentially
         stage1_args = ['--workers', str(args.workers)]
+        if args.compute_workers:
+            stage1_args += ['--compute-workers', str(args.compute_workers)]
         if args.type:
             stage1_args += ['--type', args.type]
         if args.limit:
             stage1_args += ['--limit', str(args.limit)]
+        if args.timeframes:
+            stage1_args += ['--timeframes', args.timeframes]
+        if args.memory_limit_mb:
+            stage1_args += ['--memory-limit-mb', str(args.memory_limit_mb)]
         
         print("\n" + "="*60)
         print("RUNNING FULL PIPELINE")
@@ -84,6 +145,9 @@ def main():
         print("PIPELINE COMPLETE!")
         print("="*60)
     
+    elif args.stream:
+        sys.exit(0 if run_stream(args) else 1)
+    
     else:
         parser.print_help()
         print("\n\nExamples:")
@@ -91,6 +155,10 @@ def main():
         print("  python run_pipeline.py --stage 2 --watch")
         print("  python run_pipeline.py --stage 3")
         print("  python run_pipeline.py --all --workers 8")
+        print("  python run_pipeline.py --all --type INDEX --memory-limit-mb 512")
+        print("  python run_pipeline.py --stream --workers 8 --type EQUITY")
+        print("  python run_pipeline.py --stream --incremental --type EQUITY")
+        print("  python run_pipeline.py --stream --timeframes 1m,5m,15m,1h,1d --type EQUITY")
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ Stage 2: Convert Computed Indicators to Parquet
 Watches the computed/ directory for new .pkl files and converts them to Parquet.
 """
 import pickle
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -50,6 +51,7 @@ def convert_to_parquet(pkl_file: Path) -> bool:
         timeframe = data.pop('timeframe')
         computed_at = data.pop('computed_at')
         candle_count = data.pop('candle_count')
+        suffix = data.pop('suffix', None)  # chunked / incremental stage 1 output: one file per piece
         
         # Convert timestamps to proper datetime
         timestamps = data.pop('timestamp')
@@ -71,7 +73,8 @@ def convert_to_parquet(pkl_file: Path) -> bool:
         # Write to Parquet with compression - use symbol name for readability
         # Clean the symbol name (remove special chars that could cause issues)
         safe_symbol = trading_symbol.replace('&', '_').replace(' ', '_').replace('-', '_')
-        output_file = PARQUET_DIR / f"{safe_symbol}_indicators_{timeframe}.parquet"
+        name = f"{safe_symbol}_indicators_{timeframe}" + (f"_{suffix}" if suffix else '')
+        output_file = PARQUET_DIR / f"{name}.parquet"
         df.to_parquet(output_file, engine='pyarrow', compression='snappy', index=False)
         
         logger.info(f"  {trading_symbol}: {len(df)} rows -> {output_file.name}")
@@ -145,8 +148,6 @@ def process_batch(watch: bool = False, interval: int = 5):
 
 
 if __name__ == '__main__':
-    import numpy as np  # Import here for pickle loading
-    
     parser = argparse.ArgumentParser(description='Stage 2: Convert to Parquet')
     parser.add_argument('--watch', action='store_true', help='Watch mode - continuously monitor for new files')
     parser.add_argument('--interval', type=int, default=5, help='Watch interval in seconds (default: 5)')
@@ -1,19 +1,28 @@
 """
 Stage 3: Optimized Parallel Load of Parquet Files to Database
 Uses connection pool + parallel workers + COPY protocol for max throughput.
+
+Files are merged into multi-file batches of about --batch-rows rows. Each
+batch is read with Arrow, encoded straight to PostgreSQL binary COPY from
+the column buffers (columnar.encode_copy_binary) and COPYed into a TEMP
+staging table that each pooled connection creates once and reuses, then
+merged into indicator_data with ON CONFLICT DO NOTHING.
 """
 import asyncio
 import asyncpg
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 import logging
 import argparse
 import json
-import numpy as np
+import time
 from concurrent.futures import ThreadPoolExecutor
 import os
 
+import columnar
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -28,20 +37,11 @@ PROGRESS_FILE = Path(__file__).parent.parent / 'data' / 'db_load_progress.json'
 # Number of parallel workers
 NUM_WORKERS = 16
 
+# Rows merged into one COPY + INSERT per batch
+BATCH_ROWS = 1_000_000
+
 # Columns to load into database
-DB_COLUMNS = [
-    'instrument_id', 'timeframe', 'timestamp',
-    'sma_9', 'sma_20', 'sma_50', 'sma_200',
-    'ema_9', 'ema_21', 'ema_50', 'ema_200',
-    'vwap', 'rsi_14',
-    'macd', 'macd_signal', 'macd_histogram',
-    'atr_14', 'bb_upper', 'bb_middle', 'bb_lower',
-    'adx', 'plus_di', 'minus_di',
-    'supertrend', 'supertrend_direction',
-    'obv', 'volume_sma_20',
-    'pivot_point', 'pivot_r1', 'pivot_r2', 'pivot_s1', 'pivot_s2',
-    'fib_r1', 'fib_r2', 'fib_s1', 'fib_s2'
-]
+DB_COLUMNS = columnar.DB_COLUMNS
 
 
 def load_progress() -> set:
@@ -58,92 +58,53 @@ def save_progress(loaded: set):
         json.dump({'loaded': list(loaded), 'updated_at': datetime.now().isoformat()}, f)
 
 
-def read_parquet_file(parquet_file: Path):
-    """Read parquet file in thread pool (I/O bound)."""
-    try:
-        df = pd.read_parquet(parquet_file)
-        return parquet_file, df
-    except Exception as e:
-        logger.error(f"Error reading {parquet_file.name}: {e}")
-        return parquet_file, None
+def plan_batches(parquet_files: list, batch_rows: int) -> list:
+    """Group files into batches of about ``batch_rows`` rows (from Parquet metadata)."""
+    batches, current, rows = [], [], 0
+    for parquet_file in parquet_files:
+        current.append(parquet_file)
+        rows += pq.ParquetFile(parquet_file).metadata.num_rows
+        if rows >= batch_rows:
+            batches.append(current)
+            current, rows = [], 0
+    if current:
+        batches.append(current)
+    return batches
 
 
-async def load_df_to_db(pool: asyncpg.Pool, parquet_file: Path, df: pd.DataFrame) -> int:
-    """Load a DataFrame into the database using COPY protocol."""
-    if df is None or len(df) == 0:
-        return 0
-    
-    instrument_id = df['instrument_id'].iloc[0]
-    
-    # Prepare columns
-    available_cols = [c for c in DB_COLUMNS if c in df.columns]
-    df_insert = df[available_cols].copy()
-    
-    # Handle NaN -> None
-    df_insert = df_insert.replace({np.nan: None})
-    
-    # Convert supertrend_direction to int
-    if 'supertrend_direction' in df_insert.columns:
-        df_insert['supertrend_direction'] = df_insert['supertrend_direction'].apply(
-            lambda x: int(x) if x is not None else None
-        )
-    
-    if len(df_insert) == 0:
-        return 0
-    
-    # Convert to records
-    records = [tuple(r) for r in df_insert.to_records(index=False)]
-    
-    async with pool.acquire() as conn:
+def read_parquet_batch(parquet_files: list) -> tuple:
+    """Read a batch of Parquet files and encode it as one binary COPY payload (runs in a thread).
+
+    Returns (payload, columns, row count, files read); files that fail to
+    read or hold no rows are logged or skipped and left out of the batch,
+    so only the files read are marked as loaded.
+    """
+    tables, read_files = [], []
+    for parquet_file in parquet_files:
         try:
-            # Use COPY for bulk insert (much faster than executemany)
-            # First create temp table - handle both UUID and string instrument_id
-            inst_id_str = str(instrument_id).replace('-', '')[:8]
-            temp_table = f"temp_ind_{inst_id_str}"
-            
-            await conn.execute(f"""
-                CREATE TEMP TABLE IF NOT EXISTS {temp_table} (
-                    instrument_id UUID,
-                    timeframe VARCHAR(10),
-                    timestamp TIMESTAMPTZ,
-                    sma_9 DOUBLE PRECISION, sma_20 DOUBLE PRECISION, sma_50 DOUBLE PRECISION, sma_200 DOUBLE PRECISION,
-                    ema_9 DOUBLE PRECISION, ema_21 DOUBLE PRECISION, ema_50 DOUBLE PRECISION, ema_200 DOUBLE PRECISION,
-                    vwap DOUBLE PRECISION, rsi_14 DOUBLE PRECISION,
-                    macd DOUBLE PRECISION, macd_signal DOUBLE PRECISION, macd_histogram DOUBLE PRECISION,
-                    atr_14 DOUBLE PRECISION, bb_upper DOUBLE PRECISION, bb_middle DOUBLE PRECISION, bb_lower DOUBLE PRECISION,
-                    adx DOUBLE PRECISION, plus_di DOUBLE PRECISION, minus_di DOUBLE PRECISION,
-                    supertrend DOUBLE PRECISION, supertrend_direction INTEGER,
-                    obv DOUBLE PRECISION, volume_sma_20 DOUBLE PRECISION,
-                    pivot_point DOUBLE PRECISION, pivot_r1 DOUBLE PRECISION, pivot_r2 DOUBLE PRECISION, 
-                    pivot_s1 DOUBLE PRECISION, pivot_s2 DOUBLE PRECISION,
-                    fib_r1 DOUBLE PRECISION, fib_r2 DOUBLE PRECISION, fib_s1 DOUBLE PRECISION, fib_s2 DOUBLE PRECISION
-                )
-            """)
-            
-            await conn.execute(f"TRUNCATE {temp_table}")
-            
-            # COPY records to temp table
-            await conn.copy_records_to_table(
-                temp_table,
-                records=records,
-                columns=available_cols
-            )
-            
-            # Insert from temp table with ON CONFLICT
-            result = await conn.execute(f"""
-                INSERT INTO indicator_data ({', '.join(available_cols)})
-                SELECT {', '.join(available_cols)} FROM {temp_table}
-                ON CONFLICT (instrument_id, timeframe, timestamp) DO NOTHING
-            """)
-            
-            await conn.execute(f"DROP TABLE {temp_table}")
-            
-            count = int(result.split()[-1]) if result else len(records)
-            return count
-            
+            table = pq.read_table(parquet_file)
         except Exception as e:
-            logger.error(f"Error inserting {parquet_file.stem}: {e}")
-            return 0
+            logger.error(f"Error reading {parquet_file.name}: {e}")
+            continue
+        if table.num_rows > 0:
+            tables.append(table)
+            read_files.append(parquet_file)
+    if not tables:
+        return None, [], 0, []
+    table = pa.concat_tables(tables, promote_options='default')
+    columns = [c for c in DB_COLUMNS if c in table.column_names]
+    batch = table.select(columns).combine_chunks().to_batches()[0]
+    return columnar.encode_copy_binary(batch, columns), columns, batch.num_rows, read_files
+
+
+async def load_batch_to_db(pool: asyncpg.Pool, payload, columns: list) -> int:
+    """COPY a payload through the connection's staging table into indicator_data.
+    
+    The TEMP staging table is created once per pooled connection and
+    truncated between batches (see columnar.copy_payload).
+    """
+    async with pool.acquire() as conn:
+        return await columnar.copy_payload(conn, payload, columns)
 
 
 async def worker(
@@ -154,44 +115,55 @@ async def worker(
     stats: dict,
     executor: ThreadPoolExecutor
 ):
-    """Worker that processes parquet files from queue."""
+    """Worker that loads batches of parquet files from queue."""
     loop = asyncio.get_event_loop()
+    worker_stats = stats['workers'][worker_id]
     
     while True:
-        parquet_file = await queue.get()
-        if parquet_file is None:  # Poison pill
+        batch_files = await queue.get()
+        if batch_files is None:  # Poison pill
             queue.task_done()
             break
         
+        start = time.perf_counter()
         try:
-            # Read file in thread pool (I/O bound)
-            _, df = await loop.run_in_executor(executor, read_parquet_file, parquet_file)
+            # Read + encode in thread pool (Arrow / NumPy release the GIL)
+            payload, columns, rows, read_files = await loop.run_in_executor(
+                executor, read_parquet_batch, batch_files
+            )
             
-            if df is not None and len(df) > 0:
-                # Load to DB
-                rows = await load_df_to_db(pool, parquet_file, df)
-                
-                if rows > 0:
-                    stats['rows'] += rows
-                    stats['files'] += 1
+            if rows > 0:
+                inserted = await load_batch_to_db(pool, payload, columns)
+                stats['rows'] += inserted
+                stats['files'] += len(read_files)
+                worker_stats['rows'] += rows
+                for parquet_file in read_files:
                     loaded.add(parquet_file.stem)
-                    
                     # Move file
                     try:
                         parquet_file.rename(LOADED_DIR / parquet_file.name)
-                    except:
+                    except OSError:
                         pass
             
-            stats['processed'] += 1
-            
         except Exception as e:
-            logger.error(f"Worker {worker_id} error on {parquet_file.name}: {e}")
+            logger.error(f"Worker {worker_id} error on batch of {len(batch_files)} files "
+                         f"({batch_files[0].name}...): {e}")
             stats['errors'] += 1
         
+        worker_stats['seconds'] += time.perf_counter() - start
+        stats['processed'] += len(batch_files)
         queue.task_done()
 
 
-async def main(num_workers: int = NUM_WORKERS):
+def worker_rates(stats: dict) -> str:
+    """Rows/sec of each worker over its busy time."""
+    return ', '.join(
+        f"w{i}: {w['rows'] / w['seconds']:,.0f}" if w['seconds'] > 0 else f"w{i}: -"
+        for i, w in enumerate(stats['workers'])
+    )
+
+
+async def main(num_workers: int = NUM_WORKERS, batch_rows: int = BATCH_ROWS):
     """Load all Parquet files to database with parallel workers."""
     
     LOADED_DIR.mkdir(parents=True, exist_ok=True)
@@ -211,6 +183,9 @@ async def main(num_workers: int = NUM_WORKERS):
         logger.info("Nothing to load!")
         return
     
+    batches = plan_batches(parquet_files, batch_rows)
+    logger.info(f"Merged into {len(batches)} batches of ~{batch_rows:,} rows")
+    
     # Create connection pool
     pool = await asyncpg.create_pool(
         DB_URL, 
@@ -221,7 +196,8 @@ async def main(num_workers: int = NUM_WORKERS):
     
     # Create queue and stats
     queue = asyncio.Queue(maxsize=num_workers * 2)
-    stats = {'rows': 0, 'files': 0, 'processed': 0, 'errors': 0}
+    stats = {'rows': 0, 'files': 0, 'processed': 0, 'errors': 0,
+             'workers': [{'rows': 0, 'seconds': 0.0} for _ in range(num_workers)]}
     start_time = datetime.now()
     
     # Thread pool for reading parquet files
@@ -249,6 +225,7 @@ async def main(num_workers: int = NUM_WORKERS):
                 f"Rate: {rate:.1f}/s | "
                 f"ETA: {eta_min:.0f}min"
             )
+            logger.info(f"Rows/s per worker: {worker_rates(stats)}")
             
             # Save progress every 30 seconds
             if stats['files'] - last_files >= 100:
@@ -257,9 +234,9 @@ async def main(num_workers: int = NUM_WORKERS):
     
     progress_task = asyncio.create_task(report_progress())
     
-    # Feed files to queue
-    for pf in parquet_files:
-        await queue.put(pf)
+    # Feed batches to queue
+    for batch_files in batches:
+        await queue.put(batch_files)
     
     # Send poison pills to stop workers
     for _ in range(num_workers):
@@ -284,12 +261,14 @@ async def main(num_workers: int = NUM_WORKERS):
     logger.info(f"Total rows: {stats['rows']:,}")
     logger.info(f"Errors: {stats['errors']}")
     logger.info(f"Time: {elapsed/60:.1f} minutes")
-    logger.info(f"Average rate: {final_rate:.1f} files/s")
+    logger.info(f"Average rate: {final_rate:.1f} files/s, {stats['rows'] / elapsed if elapsed > 0 else 0:,.0f} rows/s")
+    logger.info(f"Rows/s per worker: {worker_rates(stats)}")
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Stage 3: Optimized Parallel DB Load')
     parser.add_argument('--workers', type=int, default=NUM_WORKERS, help=f'Number of parallel workers (default: {NUM_WORKERS})')
+    parser.add_argument('--batch-rows', type=int, default=BATCH_ROWS, help=f'Rows per COPY batch (default: {BATCH_ROWS:,})')
     
     args = parser.parse_args()
     
@@ -297,6 +276,6 @@ if __name__ == '__main__':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     
     try:
-        asyncio.run(main(args.workers))
+        asyncio.run(main(args.workers, args.batch_rows))
     except KeyboardInterrupt:
         logger.info("\nInterrupted by user")
@@ -0,0 +1,144 @@
+"""
+Tests for the core BacktestEngine
+
+Runs the row-by-row engine, the columnar fast mode and the vectorized
+engine on the same SQLite candles and checks they produce identical trades
+and equity curves.
+"""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.backtest_engine import BacktestConfig, BacktestEngine
+from app.backtest.vectorized_engine import VectorizedBacktestEngine
+from app.strategies.indicator_strategies import (
+    EMACrossoverStrategy,
+    RSIMomentumStrategy,
+    SupertrendStrategy,
+    VWAPBounceStrategy,
+)
+from app.services.strategy_engine import BaseStrategy, Signal, SignalStrength, SignalType
+
+
+class RSIReversalStrategy(BaseStrategy):
+    """Long below RSI 35, short above RSI 65, 0.4% stop and 0.6% target."""
+
+    def __init__(self):
+        super().__init__("rsi-reversal", "RSI Reversal", "test strategy", {})
+
+    async def evaluate(self, symbol, timeframe, indicators, candle):
+        rsi = indicators.get("rsi_14")
+        if rsi is None or 35 <= rsi <= 65:
+            return None
+        signal_type = SignalType.LONG_ENTRY if rsi < 35 else SignalType.SHORT_ENTRY
+        entry = Decimal(str(candle["close"]))
+        stop = self.get_stop_loss(entry, signal_type, indicators, candle)
+        return Signal(
+            signal_id=self.generate_signal_id(), strategy_id=self.strategy_id, strategy_name=self.name,
+            symbol=symbol, exchange="NSE", signal_type=signal_type, strength=SignalStrength.MODERATE,
+            entry_price=entry, stop_loss=stop, target_price=self.get_target(entry, stop, signal_type, indicators),
+            quantity_pct=7.5, timeframe=timeframe, indicators=dict(indicators), reason="rsi",
+            generated_at=candle["timestamp"], valid_until=candle["timestamp"],
+        )
+
+    def get_stop_loss(self, entry_price, signal_type, indicators, candle):
+        factor = Decimal("0.996") if signal_type == SignalType.LONG_ENTRY else Decimal("1.004")
+        return (entry_price * factor).quantize(Decimal("0.01"))
+
+    def get_target(self, entry_price, stop_loss, signal_type, indicators):
+        return (entry_price + (entry_price - stop_loss) * Decimal("1.5")).quantize(Decimal("0.01"))
+
+
+@pytest.fixture
+def candle_db(tmp_path):
+    """Three sessions of 1m candles with indicators for two symbols, plus a text column."""
+    rng = np.random.default_rng(5)
+    frames = []
+    for symbol in ("NSE:AAA-EQ", "NSE:BBB-EQ"):
+        for day in (date(2024, 6, 3), date(2024, 6, 4), date(2024, 6, 5)):
+            start = datetime.combine(day, datetime.min.time()) + timedelta(hours=9, minutes=15)
+            close = np.round(500 + np.cumsum(rng.normal(0, 0.6, 375)), 2)
+            delta = np.diff(close, prepend=close[0])
+            gain = pd.Series(np.maximum(delta, 0)).rolling(14).mean()
+            loss = pd.Series(np.maximum(-delta, 0)).rolling(14).mean()
+            volume = rng.integers(100, 1000, 375)
+            ema_21 = pd.Series(close).ewm(span=21).mean().to_numpy()
+            direction = np.where(close > ema_21, 1.0, -1.0)
+            direction[:10] = np.nan
+            frames.append(pd.DataFrame({
+                "symbol": symbol,
+                "timestamp": [(start + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S") for i in range(375)],
+                "open": close, "high": close + 0.35, "low": close - 0.35, "close": close,
+                "volume": volume,
+                "rsi_14": 100 - 100 / (1 + gain / loss),
+                "ema_9": pd.Series(close).ewm(span=9).mean(),
+                "ema_21": ema_21,
+                "ema_50": pd.Series(close).ewm(span=50).mean().where(np.arange(375) >= 50),
+                "atr_14": pd.Series(np.full(375, 0.7)).where(np.arange(375) >= 14),
+                "adx": 15 + 20 * np.abs(np.sin(np.arange(375) / 40)),
+                "supertrend": ema_21,
+                "supertrend_direction": direction,
+                "vwap": np.cumsum(close * volume) / np.cumsum(volume),
+                "note": np.where(np.arange(375) % 50 == 0, "x", "1.5"),
+            }))
+    path = tmp_path / "candles.db"
+    with sqlite3.connect(path) as conn:
+        pd.concat(frames).to_sql("candle_data", conn, index=False)
+    return str(path)
+
+
+class TestColumnarBacktest:
+    """fast=True reproduces the row-by-row engine."""
+
+    @pytest.mark.asyncio
+    async def test_fast_mode_matches_row_engine(self, candle_db):
+        config = BacktestConfig(allow_shorting=True, max_positions=2)
+        results = []
+        for fast in (False, True):
+            engine = BacktestEngine(db_path=candle_db, config=config)
+            results.append(await engine.run_backtest(
+                RSIReversalStrategy(), ["NSE:AAA-EQ", "NSE:BBB-EQ"],
+                date(2024, 6, 3), date(2024, 6, 5), fast=fast,
+            ))
+        rows, fast = results
+
+        assert len(rows.trades) > 10
+        assert {t.exit_reason for t in rows.trades} >= {"stop_loss", "target", "eod"}
+        assert fast.trades == rows.trades
+        assert fast.equity_curve == rows.equity_curve
+        assert fast.metrics == rows.metrics
+        assert (fast.signals_generated, fast.signals_executed) == (rows.signals_generated, rows.signals_executed)
+
+
+class TestVectorizedBacktest:
+    """The vectorized engine reproduces the event-driven engine."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_cls,config", [
+        (EMACrossoverStrategy, {"adx_threshold": 20}),
+        (RSIMomentumStrategy, {"oversold": 40, "overbought": 60, "extreme_oversold": 10, "extreme_overbought": 90}),
+        (SupertrendStrategy, {"adx_threshold": 20}),
+        (VWAPBounceStrategy, {}),
+    ])
+    @pytest.mark.parametrize("exit_at_eod", [True, False])
+    async def test_matches_row_engine(self, candle_db, strategy_cls, config, exit_at_eod):
+        bt_config = BacktestConfig(allow_shorting=True, exit_at_eod=exit_at_eod)
+        symbols = ["NSE:AAA-EQ", "NSE:BBB-EQ"]
+        rows = await BacktestEngine(db_path=candle_db, config=bt_config).run_backtest(
+            strategy_cls(config), symbols, date(2024, 6, 3), date(2024, 6, 5),
+        )
+        vectorized = await VectorizedBacktestEngine(db_path=candle_db, config=bt_config).run_backtest(
+            strategy_cls(config), symbols, date(2024, 6, 3), date(2024, 6, 5),
+        )
+
+        assert len(rows.trades) >= 3
+        assert vectorized.trades == rows.trades
+        assert vectorized.equity_curve == rows.equity_curve
+        assert vectorized.metrics == rows.metrics
+        assert ((vectorized.signals_generated, vectorized.signals_executed)
+                == (rows.signals_generated, rows.signals_executed))
@@ -0,0 +1,189 @@
+"""
+Tests for Candle Builder
+
+Tests the per-symbol CandleBuilder (tick- and timer-driven close),
+the columnar multi-symbol builder and the service close sweep.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from app.brokers.fyers_websocket import TickData
+from app.services.candle_builder import (
+    CandleBuilder,
+    CandleBuilderService,
+    ColumnarCandleBuilder,
+    Timeframe,
+)
+
+
+SESSION_START = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)  # 09:15 IST
+
+
+def random_ticks(n_symbols=5, n_ticks=3000, seed=1):
+    """(symbol, price, epoch seconds) ticks over ~40 minutes, time ordered."""
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, 40 * 60, n_ticks))
+    symbols = rng.integers(0, n_symbols, n_ticks)
+    prices = 100 + np.cumsum(rng.normal(0, 0.1, n_ticks))
+    base = int(SESSION_START.timestamp())
+    return [(f"SYM{s}", round(float(p), 2), base + int(o)) for s, p, o in zip(symbols, prices, offsets)]
+
+
+def at(minutes, seconds=0):
+    return SESSION_START + timedelta(minutes=minutes, seconds=seconds)
+
+
+def tick(symbol, price, when, volume=0):
+    return TickData(symbol=symbol, ltp=price, volume=volume, timestamp=when)
+
+
+class TestCandleBuilder:
+    """Tests for the per-symbol CandleBuilder."""
+
+    @pytest.mark.asyncio
+    async def test_next_tick_completes_candle(self):
+        """A tick in a later minute completes the previous 1m candle."""
+        builder = CandleBuilder("A", timeframes=[Timeframe.M1])
+        await builder.process_tick(tick("A", 100.0, at(0, 5), volume=10))
+        await builder.process_tick(tick("A", 101.0, at(0, 30), volume=5))
+
+        completed = await builder.process_tick(tick("A", 99.0, at(1, 2)))
+
+        assert len(completed) == 1
+        candle = completed[0]
+        assert candle.timestamp == at(0)
+        assert (candle.open, candle.high, candle.low, candle.close) == (100.0, 101.0, 100.0, 101.0)
+        assert (candle.volume, candle.tick_count) == (15, 2)
+
+    @pytest.mark.asyncio
+    async def test_close_due_without_next_tick(self):
+        """An illiquid symbol's candles close on the timer, higher timeframes too."""
+        builder = CandleBuilder("A", timeframes=[Timeframe.M1, Timeframe.M5])
+        await builder.process_tick(tick("A", 100.0, at(1, 10)))
+
+        assert await builder.close_due(at(1, 59)) == []
+        closed_1m = await builder.close_due(at(2))
+        closed_5m = await builder.close_due(at(5))
+
+        assert [(c.timeframe, c.timestamp) for c in closed_1m] == [(Timeframe.M1, at(1))]
+        assert [(c.timeframe, c.timestamp) for c in closed_5m] == [(Timeframe.M5, at(0))]
+        assert closed_5m[0].close == 100.0
+
+    @pytest.mark.asyncio
+    async def test_late_tick_after_timer_close_rolls_forward(self):
+        """A tick stamped inside an already closed minute goes to the next one."""
+        builder = CandleBuilder("A", timeframes=[Timeframe.M1])
+        await builder.process_tick(tick("A", 100.0, at(0, 10)))
+        await builder.close_due(at(1))
+
+        await builder.process_tick(tick("A", 100.5, at(0, 59)))
+
+        assert builder.get_current_candle(Timeframe.M1).timestamp == at(1)
+
+    @pytest.mark.asyncio
+    async def test_force_complete_includes_open_minute_in_higher_timeframes(self):
+        """At close, the still-open 1m candle is rolled into the 5m candle."""
+        builder = CandleBuilder("A", timeframes=[Timeframe.M1, Timeframe.M5])
+        await builder.process_tick(tick("A", 100.0, at(3, 10), volume=10))
+        await builder.process_tick(tick("A", 102.0, at(4, 30), volume=5))
+
+        completed = {c.timeframe: c for c in builder.force_complete()}
+
+        five = completed[Timeframe.M5]
+        assert (five.open, five.high, five.close, five.volume) == (100.0, 102.0, 102.0, 15)
+        assert builder.get_current_candle(Timeframe.M1) is None
+
+
+class TestCandleBuilderService:
+    """Tests for the service-level close sweep."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("columnar", [False, True])
+    async def test_close_due_publishes_one_burst(self, columnar):
+        """Due candles of all symbols go out in a single publish_many call."""
+        service = CandleBuilderService(timeframes=[Timeframe.M1], columnar=columnar)
+        service._event_bus = AsyncMock()
+        for i in range(20):
+            await service.process_tick(f"S{i}", tick(f"S{i}", 100.0 + i, at(0, i)))
+
+        completed = await service.close_due(at(1))
+
+        assert len(completed) == 20
+        service._event_bus.publish_many.assert_awaited_once()
+        events = service._event_bus.publish_many.await_args.args[0]
+        assert sorted(e.symbol for e in events) == sorted(f"S{i}" for i in range(20))
+        assert service.get_stats()["close_sweeps"]["candles_closed"] == 20
+
+
+class TestColumnarCandleBuilder:
+    """Tests for ColumnarCandleBuilder."""
+
+    def test_matches_reference_aggregation(self):
+        """Completed 1m/5m OHLC equals a straightforward per-bucket groupby."""
+        ticks = random_ticks()
+        timeframes = [Timeframe.M1, Timeframe.M5]
+
+        buckets = {}
+        for symbol, price, ts in ticks:
+            for tf, period in ((Timeframe.M1, 60), (Timeframe.M5, 300)):
+                buckets.setdefault((symbol, tf, ts - ts % period), []).append(price)
+        last_open = {}
+        for key in buckets:
+            symbol, tf, start = key
+            last_open[(symbol, tf)] = max(start, last_open.get((symbol, tf), 0))
+        # Candles still open at the end are not completed
+        expected = {
+            (symbol, tf, start, p[0], max(p), min(p), p[-1])
+            for (symbol, tf, start), p in buckets.items()
+            if start != last_open[(symbol, tf)]
+        }
+
+        columnar = ColumnarCandleBuilder(timeframes)
+        got = set()
+        # Feed in uneven chunks to exercise batch boundaries
+        for chunk in np.array_split(np.arange(len(ticks)), 37):
+            rows = [ticks[i] for i in chunk]
+            batches = columnar.update_many(
+                np.array([columnar.slot(r[0]) for r in rows]),
+                np.array([r[1] for r in rows]),
+                np.zeros(len(rows)),
+                np.zeros(len(rows)),
+                np.array([r[2] for r in rows]),
+            )
+            for batch in batches:
+                for c in batch.to_candles():
+                    got.add((c.symbol, c.timeframe, int(c.timestamp.timestamp()),
+                             c.open, c.high, c.low, c.close))
+
+        assert got == expected
+
+    def test_volume_and_tick_count(self):
+        """Volume is summed and OI takes the latest value within a candle."""
+        builder = ColumnarCandleBuilder([Timeframe.M1])
+        base = int(SESSION_START.timestamp())
+        slot = builder.slot("A")
+
+        builder.update_many(np.array([slot] * 3), np.array([10.0, 12.0, 9.0]),
+                            np.array([5, 7, 1]), np.array([100, 110, 120]),
+                            np.array([base, base + 10, base + 20]))
+        [batch] = builder.update_many(np.array([slot]), np.array([11.0]),
+                                      np.array([2]), np.array([130]), np.array([base + 60]))
+
+        [candle] = batch.to_candles()
+        assert (candle.open, candle.high, candle.low, candle.close) == (10.0, 12.0, 9.0, 9.0)
+        assert candle.volume == 13
+        assert candle.oi == 120
+        assert candle.tick_count == 3
+        assert candle.timestamp == SESSION_START
+
+    def test_daily_bucket_starts_at_session_open(self):
+        """Daily candles are anchored at 09:15 IST."""
+        builder = ColumnarCandleBuilder([Timeframe.D1])
+        ts = int((SESSION_START + timedelta(hours=5)).timestamp())
+        builder.update_many(np.array([builder.slot("A")]), np.array([1.0]),
+                            np.array([0]), np.array([0]), np.array([ts]))
+
+        assert builder.get_current_candle("A", Timeframe.D1).timestamp == SESSION_START
@@ -0,0 +1,55 @@
+"""
+Tests for Candle Resampler
+
+Checks the one-pass array resampler against pandas resampling offset to
+the 09:15 IST session open.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.candle_resampler import CandleResampler
+
+
+AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+@pytest.fixture
+def sessions():
+    """Four NSE sessions of 1m candles with a gap in the first one."""
+    days = [pd.date_range(f"2025-01-{d:02d} 09:15", periods=375, freq="min", tz="Asia/Kolkata")
+            for d in (6, 7, 8, 10)]
+    index = days[0].append(days[1:]).delete(np.arange(100, 130))
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+    return pd.DataFrame({
+        "open": close + 0.1, "high": close + 1, "low": close - 1, "close": close,
+        "volume": rng.integers(1, 100, len(index)).astype(float),
+    }, index=index)
+
+
+class TestResampleArrays:
+    """resample_arrays matches pandas resample aligned to 09:15 IST."""
+
+    @pytest.mark.parametrize("timeframe,rule", [("5m", "5min"), ("15m", "15min"), ("1h", "60min")])
+    def test_intraday_matches_pandas(self, sessions, timeframe, rule):
+        expected = sessions.resample(rule, origin="start_day", offset="9h15min").agg(AGG).dropna()
+        timestamps = sessions.index.tz_convert("UTC").tz_localize(None).to_numpy()
+
+        bars = CandleResampler.resample_arrays(
+            timestamps, {k: sessions[k].to_numpy() for k in AGG}, [timeframe]
+        )[timeframe]
+
+        starts = expected.index.tz_convert("UTC").tz_localize(None).to_numpy().astype("datetime64[m]")
+        np.testing.assert_array_equal(bars["timestamp"], starts)
+        for name in AGG:
+            np.testing.assert_allclose(bars[name], expected[name].to_numpy())
+
+    def test_daily_bar_starts_at_session_open(self, sessions):
+        timestamps = sessions.index.tz_convert("UTC").tz_localize(None).to_numpy()
+
+        bars = CandleResampler.resample_arrays(timestamps, {"close": sessions["close"].to_numpy()}, ["1d"])["1d"]
+
+        assert [str(t) for t in bars["timestamp"]] == [f"2025-01-{d:02d}T03:45" for d in (6, 7, 8, 10)]
+        np.testing.assert_allclose(bars["close"], sessions["close"].groupby(sessions.index.date).last())
@@ -0,0 +1,333 @@
+"""
+Tests for Event Bus
+
+Tests event (de)serialization and batching publisher behaviour
+against a mocked Redis.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.core.events import (
+    BaseEvent,
+    BatchingPublisher,
+    CandleEvent,
+    EventBus,
+    EventType,
+    InProcessEventBus,
+    OrderEvent,
+    TickEvent,
+)
+
+
+def make_tick(instrument_id: str, ltp: float) -> TickEvent:
+    return TickEvent(instrument_id=instrument_id, symbol=instrument_id, ltp=ltp)
+
+
+@pytest.fixture
+def mock_event_bus():
+    """Create a mock event bus that records published batches."""
+    bus = AsyncMock()
+    bus.batches = []
+
+    async def publish_many(events):
+        bus.batches.append(list(events))
+        return [str(i) for i in range(len(events))]
+
+    bus.publish_many = AsyncMock(side_effect=publish_many)
+    return bus
+
+
+class TestEventDecoding:
+    """Tests for typed event deserialization."""
+
+    def test_round_trip_keeps_concrete_type(self):
+        """A CandleEvent comes back as a CandleEvent with all fields."""
+        bus = EventBus(redis_url="redis://unused")
+        event = CandleEvent(
+            instrument_id="NSE_EQ|INE002A01018", symbol="RELIANCE", timeframe="1m",
+            open=100.0, high=101.0, low=99.0, close=100.5, volume=1200,
+        )
+        _, message = bus._encode_event(event)
+
+        decoded = bus._decode_event(message)
+
+        assert type(decoded) is CandleEvent
+        assert decoded == event
+
+    def test_unknown_model_falls_back_to_base_event(self):
+        """Messages without a registered model decode as BaseEvent."""
+        bus = EventBus(redis_url="redis://unused")
+        _, message = bus._encode_event(
+            BaseEvent(event_type=EventType.ORDER_FILLED, metadata={"order_id": "X1"})
+        )
+        message.pop("model")
+
+        decoded = bus._decode_event(message)
+
+        assert type(decoded) is BaseEvent
+        assert decoded.metadata == {"order_id": "X1"}
+
+
+class TestBatchingPublisher:
+    """Tests for BatchingPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_window(self, mock_event_bus):
+        """Ticks below max_batch are flushed once the window elapses."""
+        publisher = BatchingPublisher(mock_event_bus, window_ms=5, max_batch=100)
+        await publisher.start()
+
+        for i in range(10):
+            publisher.submit(make_tick("A", 100 + i))
+        await asyncio.sleep(0.05)
+
+        assert len(mock_event_bus.batches) == 1
+        assert len(mock_event_bus.batches[0]) == 10
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size(self, mock_event_bus):
+        """A full batch is flushed without waiting for the window."""
+        publisher = BatchingPublisher(mock_event_bus, window_ms=10_000, max_batch=20)
+        await publisher.start()
+
+        for i in range(45):
+            publisher.submit(make_tick(f"S{i}", 100.0))
+        await asyncio.sleep(0.01)
+
+        assert [len(b) for b in mock_event_bus.batches[:2]] == [20, 20]
+        await publisher.stop()
+        assert sum(len(b) for b in mock_event_bus.batches) == 45
+
+    @pytest.mark.asyncio
+    async def test_backpressure_conflates_per_instrument(self, mock_event_bus):
+        """When the buffer fills, only the latest tick per instrument is kept."""
+        publisher = BatchingPublisher(
+            mock_event_bus, window_ms=10_000, max_batch=50, max_pending=50,
+        )
+        # Not started: nothing drains the buffer
+        for i in range(50):
+            publisher.submit(make_tick(f"S{i % 5}", float(i)))
+
+        assert publisher.pending == 5
+        await publisher.stop()
+
+        published = mock_event_bus.batches[0]
+        assert {e.instrument_id: e.ltp for e in published} == {
+            "S0": 45.0, "S1": 46.0, "S2": 47.0, "S3": 48.0, "S4": 49.0,
+        }
+        assert publisher.get_stats()["conflated"] == 45
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_counted(self, mock_event_bus):
+        """A failed flush is recorded and does not stop the publisher."""
+        mock_event_bus.publish_many = AsyncMock(side_effect=ConnectionError("down"))
+        publisher = BatchingPublisher(mock_event_bus, window_ms=1, max_batch=10)
+        await publisher.start()
+
+        publisher.submit(make_tick("A", 1.0))
+        await asyncio.sleep(0.02)
+        await publisher.stop()
+
+        stats = publisher.get_stats()
+        assert stats["errors"] == 1
+        assert stats["dropped"] == 1
+
+
+class FakeStreamRedis:
+    """Minimal Redis stand-in serving pre-encoded stream messages once."""
+
+    def __init__(self, messages):
+        self._messages = messages
+        self.acks = []
+
+    async def xgroup_create(self, *args, **kwargs):
+        return True
+
+    async def xreadgroup(self, groupname, consumername, streams, count, block):
+        if not self._messages:
+            await asyncio.sleep(block / 1000 / 100)
+            return []
+        batch, self._messages = self._messages[:count], self._messages[count:]
+        stream_name = next(iter(streams))
+        return [(stream_name, batch)]
+
+    async def xack(self, stream_name, group, *ids):
+        self.acks.append(list(ids))
+        return len(ids)
+
+
+def make_stream_bus(events, batch_size=10, concurrency=1):
+    bus = EventBus(
+        redis_url="redis://unused",
+        consumer_batch_size=batch_size,
+        consumer_concurrency=concurrency,
+    )
+    messages = [(f"{i}-0", bus._encode_event(e)[1]) for i, e in enumerate(events)]
+    bus._redis = FakeStreamRedis(messages)
+    return bus
+
+
+class TestStreamConsumer:
+    """Tests for batched / concurrent stream consumption."""
+
+    @pytest.mark.asyncio
+    async def test_batched_acks(self):
+        """Each read batch is acknowledged with a single XACK."""
+        bus = make_stream_bus([make_tick(f"S{i}", 1.0) for i in range(25)], batch_size=10)
+        seen = []
+
+        async def on_tick(event):
+            seen.append(event.instrument_id)
+
+        await bus.subscribe(EventType.TICK_RECEIVED, on_tick)
+        bus._running = True
+        task = asyncio.create_task(bus._consume_stream(EventType.TICK_RECEIVED))
+        await asyncio.sleep(0.05)
+        bus._running = False
+        await task
+
+        assert len(seen) == 25
+        assert [len(a) for a in bus._redis.acks] == [10, 10, 5]
+        metrics = bus.get_consumer_metrics()["kg:events:tick.received"]
+        assert metrics["acked"] == 25
+        assert metrics["handlers"]["TestStreamConsumer.test_batched_acks.<locals>.on_tick"]["calls"] == 25
+
+    @pytest.mark.asyncio
+    async def test_slow_instrument_does_not_block_others(self):
+        """Concurrent mode overlaps instruments but keeps each one ordered."""
+        events = [make_tick("SLOW", 1.0), make_tick("FAST", 1.0),
+                  make_tick("SLOW", 2.0), make_tick("FAST", 2.0)]
+        bus = make_stream_bus(events, batch_size=10, concurrency=4)
+        order = []
+
+        async def on_tick(event):
+            if event.instrument_id == "SLOW":
+                await asyncio.sleep(0.02)
+            order.append((event.instrument_id, event.ltp))
+
+        await bus.subscribe(EventType.TICK_RECEIVED, on_tick)
+        bus._running = True
+        task = asyncio.create_task(bus._consume_stream(EventType.TICK_RECEIVED))
+        await asyncio.sleep(0.1)
+        bus._running = False
+        await task
+
+        assert order[:2] == [("FAST", 1.0), ("FAST", 2.0)]
+        assert [o for o in order if o[0] == "SLOW"] == [("SLOW", 1.0), ("SLOW", 2.0)]
+        assert sum(len(a) for a in bus._redis.acks) == 4
+
+
+class TestInProcessEventBus:
+    """Tests for the in-process event bus backend."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_same_object_without_redis(self):
+        """Subscribers get the published object itself, in order."""
+        bus = InProcessEventBus(mirror_to_redis=False)
+        received = []
+
+        async def on_tick(event):
+            received.append(event)
+
+        await bus.subscribe("tick", on_tick)
+        await bus.start_consuming()
+
+        ticks = [make_tick("A", float(i)) for i in range(5)]
+        for tick in ticks:
+            await bus.publish(tick)
+        await asyncio.sleep(0.01)
+        await bus.disconnect()
+
+        assert received == ticks
+        assert received[0] is ticks[0]
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_a_consumer(self):
+        """A type subscribed after start_consuming() is drained, so publishers never block."""
+        bus = InProcessEventBus(mirror_to_redis=False, queue_size=2)
+        await bus.start_consuming()
+        received = []
+
+        async def on_candle(event):
+            received.append(event)
+
+        await bus.subscribe(EventType.CANDLE_FORMED, on_candle)
+        candles = [
+            CandleEvent(instrument_id="A", symbol="A", timeframe="1m",
+                        open=1.0, high=1.0, low=1.0, close=1.0, volume=i)
+            for i in range(5)
+        ]
+        for candle in candles:
+            await asyncio.wait_for(bus.publish(candle), timeout=1)
+        await asyncio.sleep(0.01)
+        await bus.disconnect()
+
+        assert received == candles
+
+    @pytest.mark.asyncio
+    async def test_legacy_string_publish_and_mirror(self):
+        """String events are converted and every event is mirrored."""
+        bus = InProcessEventBus(mirror_to_redis=True)
+        mirrored = []
+
+        async def mirror_many(events):
+            mirrored.extend(events)
+
+        bus._mirror = BatchingPublisher(bus, window_ms=1, publish_many=mirror_many)
+        await bus._mirror.start()
+        received = []
+
+        async def on_fill(event):
+            received.append(event)
+
+        await bus.subscribe(EventType.ORDER_FILLED, on_fill)
+        bus._running = True
+        bus._consumer_tasks.append(
+            asyncio.create_task(bus._consume_stream(EventType.ORDER_FILLED))
+        )
+
+        await bus.publish("order_filled", {"order_id": "X1"})
+        await asyncio.sleep(0.02)
+        await bus._mirror.stop()
+        bus._mirror = None
+        await bus.disconnect()
+
+        assert received[0].metadata == {"order_id": "X1"}
+        assert mirrored == received
+
+    @pytest.mark.asyncio
+    async def test_mirror_under_pressure_keeps_every_order(self, monkeypatch):
+        """Backpressure conflates mirrored ticks but never order events."""
+        bus = InProcessEventBus(mirror_to_redis=True)
+        redis_settings = SimpleNamespace(
+            tick_batch_window_ms=5.0, tick_batch_max_events=2, tick_batch_max_pending=8,
+        )
+        monkeypatch.setattr("app.core.events.settings", SimpleNamespace(redis=redis_settings))
+
+        async def connect(self):
+            self._redis = AsyncMock()
+
+        with patch.object(EventBus, "connect", connect):
+            await bus.connect()
+
+        orders = [
+            OrderEvent(order_id=f"O{i}", instrument_id="A", symbol="A", side="BUY",
+                       order_type="MARKET", quantity=1, status="PLACED")
+            for i in range(3)
+        ]
+        for i in range(6):
+            bus._mirror.submit(make_tick("A", float(i)))
+            if i % 2:
+                bus._mirror.submit(orders[i // 2])
+
+        pending = bus._mirror._pending
+        assert [e for e in pending if isinstance(e, OrderEvent)] == orders
+        assert [e.ltp for e in pending if isinstance(e, TickEvent)] == [5.0]
+        stats = bus._mirror.get_stats()
+        assert stats["conflated"] == 5 and stats["dropped"] == 0
+        bus._mirror._pending.clear()
+        await bus.disconnect()
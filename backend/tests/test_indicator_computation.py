@@ -0,0 +1,112 @@
+"""
+Tests for IndicatorComputationService storage
+
+Checks the binary COPY columns built from a DataFrame chunk and the
+chunked replace-on-store path against an in-memory SQLite database.
+"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models.candle_data import Base, CandleData
+from app.services import indicator_computation
+from app.services.indicator_computation import STORE_COLUMNS, IndicatorComputationService
+from app.utils import pg_copy
+
+
+def session_candles(n=500, seed=5):
+    """1m candles over 09:15-15:30 IST sessions (UTC timestamps)."""
+    days = pd.bdate_range("2025-01-06", periods=n // 375 + 1).to_numpy() + np.timedelta64(225, "m")
+    minutes = np.arange(375).astype("timedelta64[m]")
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime((days[:, None] + minutes[None, :]).ravel()[:n], utc=True),
+        "open": close + rng.normal(0, 0.1, n),
+        "high": close + rng.uniform(0, 1, n),
+        "low": close - rng.uniform(0, 1, n),
+        "close": close,
+        "volume": rng.integers(1, 1000, n),
+    })
+
+
+class TestCopyColumns:
+    """A DataFrame chunk becomes COPY columns in STORE_COLUMNS order."""
+
+    def test_values_and_nulls(self):
+        chunk = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2025-01-06 03:45", "2025-01-06 03:46"], utc=True),
+            "open": [100.0, 101.0],
+            "high": [102.0, 103.0],
+            "low": [99.0, 100.0],
+            "close": [101.0, 102.0],
+            "volume": [1500, 2500],
+            "rsi_14": [np.nan, 55.5],
+            "supertrend_direction": [np.nan, -1.0],
+        })
+
+        columns = dict(zip(
+            (name for name, _ in STORE_COLUMNS),
+            IndicatorComputationService._copy_columns("NIFTY", "1m", chunk),
+        ))
+
+        assert columns["symbol"].dictionary == [b"NIFTY"]
+        assert columns["timeframe"].dictionary == [b"1m"]
+        stamp = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc) - datetime(2000, 1, 1, tzinfo=timezone.utc)
+        assert columns["timestamp"].values.tolist() == [
+            stamp.total_seconds() * 1_000_000, stamp.total_seconds() * 1_000_000 + 60_000_000,
+        ]
+        assert columns["volume"].kind == "int8"
+        assert columns["volume"].values.tolist() == [1500, 2500]
+        assert columns["rsi_14"].nulls.tolist() == [True, False]
+        assert columns["rsi_14"].values[1] == 55.5
+        assert columns["supertrend_direction"].kind == "int4"
+        assert columns["supertrend_direction"].nulls.tolist() == [True, False]
+        assert columns["supertrend_direction"].values.tolist() == [0, -1]
+        assert columns["sma_200"].nulls.all()  # not in the chunk
+        assert pg_copy.encode_copy_binary(list(columns.values()))
+
+
+class TestSqliteStore:
+    """Without COPY, each chunk replaces its rows with one bulk INSERT."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_replace_overlapping_rows(self, monkeypatch):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        candles = session_candles()
+        chunk_rows = []
+        insert_chunk = IndicatorComputationService._insert_chunk
+
+        async def record_chunk(self, symbol, timeframe, chunk):
+            chunk_rows.append(len(chunk))
+            await insert_chunk(self, symbol, timeframe, chunk)
+
+        monkeypatch.setattr(IndicatorComputationService, "_insert_chunk", record_chunk)
+        monkeypatch.setattr(indicator_computation, "DELETE_BATCH_ROWS", 50)
+
+        async with AsyncSession(engine) as session:
+            service = IndicatorComputationService(session)
+            assert await service.store_candles_with_indicators("NIFTY", "1m", candles[:300], chunk_size=64) == 300
+            # Overlaps rows 200-299; recomputed without their warm-up
+            assert await service.store_candles_with_indicators("NIFTY", "1m", candles[200:], chunk_size=128) == 300
+
+            rows = (await session.execute(
+                select(CandleData.timestamp, CandleData.sma_20, CandleData.volume).order_by(CandleData.timestamp)
+            )).all()
+            count = await session.scalar(select(func.count()).select_from(CandleData))
+        await engine.dispose()
+
+        assert chunk_rows == [64, 64, 64, 64, 44, 128, 128, 44]
+        assert count == len(rows) == 500
+        assert len({row.timestamp for row in rows}) == 500
+        assert rows[210].sma_20 is None  # second run: only 10 candles in
+        assert rows[250].sma_20 == pytest.approx(candles["close"][231:251].mean())
+        assert rows[150].sma_20 == pytest.approx(candles["close"][131:151].mean())
+        assert [row.volume for row in rows] == candles["volume"].tolist()
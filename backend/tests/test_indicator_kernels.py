@@ -0,0 +1,96 @@
+"""
+Tests for Indicator Kernels
+
+Tests the loop-free recursive kernels against straightforward sequential
+reference loops, across block boundaries and NaN inputs.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils import indicator_kernels
+
+
+def sequential(x, decay, gain, initial):
+    y = np.empty(len(x))
+    prev = initial
+    for i, value in enumerate(x):
+        prev = decay * prev + gain * value
+        y[i] = prev
+    return y
+
+
+def reference_supertrend(high, low, close, period, multiplier):
+    band = multiplier * indicator_kernels.atr(high, low, close, period)
+    upper, lower = (high + low) / 2 + band, (high + low) / 2 - band
+    line = np.full(len(close), np.nan)
+    direction = np.zeros(len(close), dtype=np.int16)
+    line[period - 1], direction[period - 1] = upper[period - 1], -1
+    for i in range(period, len(close)):
+        if close[i - 1] > line[i - 1]:
+            line[i] = max(lower[i], line[i - 1] if direction[i - 1] == 1 else lower[i])
+            direction[i] = 1
+        else:
+            line[i] = min(upper[i], line[i - 1] if direction[i - 1] == -1 else upper[i])
+            direction[i] = -1
+    return line, direction
+
+
+def random_bars(n, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 20000 * np.exp(np.cumsum(rng.normal(0, 5e-4, n)))
+    high = close * (1 + rng.uniform(0, 2e-3, n))
+    low = close * (1 - rng.uniform(0, 2e-3, n))
+    return high, low, close
+
+
+class TestLinearRecurrence:
+    """The blocked closed form matches the sequential recurrence."""
+
+    @pytest.mark.parametrize("decay", [0.0, 1e-120, 0.1, 0.8, 13 / 14, 199 / 201])
+    def test_matches_sequential(self, decay):
+        x = np.random.default_rng(1).normal(100, 5, 20_000)
+        expected = sequential(x, decay, 1 - decay, 97.5)
+
+        actual = indicator_kernels.linear_recurrence(x, decay, 1 - decay, 97.5)
+
+        np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+    def test_nan_propagates_forward(self):
+        x = np.ones(1000)
+        x[600] = np.nan
+
+        y = indicator_kernels.linear_recurrence(x, 0.9, 0.1, 1.0)
+
+        assert not np.isnan(y[:600]).any()
+        assert np.isnan(y[600:]).all()
+        assert np.isnan(indicator_kernels.linear_recurrence(x[:10], 0.9, 0.1, np.nan)).all()
+
+
+class TestIndicatorKernels:
+    """Indicator kernels keep the stage 1 seeding and warm-up."""
+
+    def test_ema_seed_and_warm_up(self):
+        data = np.arange(1.0, 31.0)
+        result = indicator_kernels.ema(data, 10)
+
+        assert np.isnan(result[:9]).all()
+        assert result[9] == np.mean(data[:10])
+        np.testing.assert_allclose(result[10:], sequential(data[10:], 9 / 11, 2 / 11, result[9]))
+        assert np.isnan(indicator_kernels.ema(data[:5], 10)).all()
+
+    def test_rsi_is_100_without_losses(self):
+        result = indicator_kernels.rsi(np.arange(1.0, 40.0), 14)
+
+        assert np.isnan(result[:14]).all()
+        assert (result[14:] == 100).all()
+
+    def test_supertrend_matches_sequential_switch(self):
+        high, low, close = random_bars(50_000)
+
+        line, direction = indicator_kernels.supertrend(high, low, close, 10, 3)
+        expected_line, expected_direction = reference_supertrend(high, low, close, 10, 3)
+
+        np.testing.assert_array_equal(line, expected_line)
+        np.testing.assert_array_equal(direction, expected_direction)
+        assert (np.diff(direction[9:]) != 0).sum() > 50  # many trend flips exercised
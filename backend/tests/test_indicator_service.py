@@ -0,0 +1,196 @@
+"""
+Tests for Indicator Service
+
+Tests that the streaming IndicatorCalculator reproduces the batch
+implementations in scripts/pipeline/stage1_compute.py (exactly for the
+moving averages, to rounding for the loop-free recursive kernels), and
+that the vectorized cross-symbol batch mode matches it.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.core.events import CandleEvent, IndicatorBatchEvent
+from app.services.candle_builder import Candle, Timeframe
+from app.services.indicator_service import (
+    BatchIndicatorCalculator,
+    IndicatorCalculator,
+    IndicatorService,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "pipeline"))
+import stage1_compute  # noqa: E402
+
+
+def random_ohlcv(n=700, seed=3):
+    rng = np.random.default_rng(seed)
+    close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.004, n))), 2)
+    open_ = np.round(close * (1 + rng.normal(0, 0.001, n)), 2)
+    high = np.round(np.maximum(open_, close) * (1 + rng.uniform(0, 0.003, n)), 2)
+    low = np.round(np.minimum(open_, close) * (1 - rng.uniform(0, 0.003, n)), 2)
+    volume = rng.integers(0, 5000, n).astype(float)
+    volume[:40] = 0  # exercise the zero-volume VWMA fallback
+    return open_, high, low, close, volume
+
+
+@pytest.fixture(scope="module")
+def streamed():
+    """Indicator values after every candle, as arrays (NaN = not warmed up)."""
+    open_, high, low, close, volume = random_ohlcv()
+    calc = IndicatorCalculator("TEST", "1m", max_history=500)
+    start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+    rows = []
+    for i in range(len(close)):
+        calc.add_candle(Candle(
+            symbol="TEST", timeframe=Timeframe.M1, timestamp=start + timedelta(minutes=i),
+            open=open_[i], high=high[i], low=low[i], close=close[i], volume=volume[i],
+        ))
+        rows.append(calc.compute_all().values)
+    names = {name for row in rows for name in row}
+    series = {name: np.array([row.get(name, np.nan) for row in rows]) for name in names}
+    return series, (high, low, close, volume)
+
+
+def assert_close(actual, expected):
+    """Streaming recurrences vs the blocked batch kernels differ only by rounding."""
+    np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-10)
+
+
+class TestIndicatorCalculatorParity:
+    """Streaming values match the stage 1 batch functions."""
+
+    def test_moving_averages(self, streamed):
+        series, (high, low, close, volume) = streamed
+        for period in (9, 21, 50, 200):
+            assert_close(series[f"ema_{period}"], stage1_compute.compute_ema(close, period))
+        for period in (20, 50, 200):
+            np.testing.assert_array_equal(series[f"sma_{period}"], stage1_compute.compute_sma(close, period))
+
+    def test_wilder_indicators(self, streamed):
+        series, (high, low, close, volume) = streamed
+        assert_close(series["rsi_14"], stage1_compute.compute_rsi(close, 14))
+        assert_close(series["atr_14"], stage1_compute.compute_atr(high, low, close, 14))
+
+    def test_supertrend_and_macd(self, streamed):
+        series, (high, low, close, volume) = streamed
+        supertrend, direction = stage1_compute.compute_supertrend(high, low, close, 10, 3)
+        assert_close(series["supertrend"], supertrend)
+        warm = ~np.isnan(supertrend)
+        np.testing.assert_array_equal(series["supertrend_direction"][warm], direction[warm])
+
+        macd, signal, histogram = stage1_compute.compute_macd(close, 12, 26, 9)
+        assert_close(series["macd"], macd)
+        assert_close(series["macd_signal"], signal)
+        assert_close(series["macd_histogram"], histogram)
+
+    def test_vwma(self, streamed):
+        series, (high, low, close, volume) = streamed
+        for period in (22, 31):
+            pv = stage1_compute.compute_sma(close * volume, period)
+            vol = stage1_compute.compute_sma(volume, period)
+            sma = stage1_compute.compute_sma(close, period)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                expected = np.where(vol > 0, pv / vol, sma)
+            np.testing.assert_array_equal(series[f"vwma_{period}"], expected)
+
+
+class TestBatchIndicatorCalculator:
+    """The vectorized cross-symbol update matches per-symbol calculators."""
+
+    def test_matches_per_symbol_calculator(self):
+        rng = np.random.default_rng(5)
+        batch = BatchIndicatorCalculator("1m", capacity=4)  # forces growth
+        single = {}
+        start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+
+        for step in range(260):
+            # Symbols join over time and skip some candles
+            active = [s for s in range(60) if s < 10 + step and rng.random() < 0.8]
+            rng.shuffle(active)
+            close = 100 + rng.normal(0, 1, len(active))
+            high = close + rng.uniform(0, 1, len(active))
+            low = close - rng.uniform(0, 1, len(active))
+            volume = rng.integers(0, 100, len(active)).astype(float)
+
+            values = batch.update(
+                np.array([batch.slot(f"S{s}") for s in active]), high, low, close, volume,
+            )
+
+            for k, s in enumerate(active):
+                calc = single.setdefault(s, IndicatorCalculator(f"S{s}", "1m"))
+                calc.add_candle(Candle(
+                    symbol=f"S{s}", timeframe=Timeframe.M1, timestamp=start,
+                    open=close[k], high=high[k], low=low[k], close=close[k], volume=volume[k],
+                ))
+                got = {n: v for n, v in zip(batch.names, values[k].tolist()) if v == v}
+                assert got == calc.compute_all().values
+
+    @pytest.mark.asyncio
+    async def test_service_publishes_one_batch_event(self):
+        """Candles of one timeframe closing together produce one event."""
+        service = IndicatorService(timeframes=["1m"], batch=True)
+        service._event_bus = AsyncMock()
+        start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+        candles = [
+            Candle(symbol=f"S{i}", timeframe=Timeframe.M1, timestamp=start,
+                   open=100.0, high=101.0, low=99.0, close=100.0 + i, volume=10)
+            for i in range(50)
+        ]
+
+        results = await service.compute_indicators_batch("1m", candles)
+
+        assert [r.symbol for r in results] == [f"S{i}" for i in range(50)]
+        service._event_bus.publish.assert_awaited_once()
+        event = service._event_bus.publish.await_args.args[0]
+        assert isinstance(event, IndicatorBatchEvent)
+        assert event.symbols == [f"S{i}" for i in range(50)]
+        assert dict(event.rows())["S0"] == {}  # nothing warmed up after one candle
+
+    @pytest.mark.asyncio
+    async def test_candles_arriving_during_a_flush_are_published(self):
+        """Candles buffered while a batch is processed get their own flush."""
+        service = IndicatorService(timeframes=["1m"], batch=True, batch_window_ms=1)
+        service._event_bus = AsyncMock()
+        start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+
+        def candle_event(symbol):
+            return CandleEvent(
+                instrument_id=symbol, symbol=symbol, timeframe="1m", timestamp=start,
+                open=100.0, high=101.0, low=99.0, close=100.0, volume=10,
+            )
+
+        published = []
+
+        async def publish(event):
+            published.append(event.symbols)
+            if len(published) == 1:
+                await service._handle_candle_event(candle_event("C"))
+                await service._handle_candle_event(candle_event("D"))
+
+        service._event_bus.publish.side_effect = publish
+        await service._handle_candle_event(candle_event("A"))
+        await service._handle_candle_event(candle_event("B"))
+        await service._flush_task
+
+        assert published == [["A", "B"], ["C", "D"]]
+        assert not service._candle_buffer
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_buffered_candles(self):
+        service = IndicatorService(timeframes=["1m"], batch=True, batch_window_ms=10_000)
+        service._event_bus = AsyncMock()
+        start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+        service._candle_buffer["1m"].append(
+            Candle(symbol="A", timeframe=Timeframe.M1, timestamp=start,
+                   open=100.0, high=101.0, low=99.0, close=100.0, volume=10)
+        )
+
+        await service.stop()
+
+        service._event_bus.publish.assert_awaited_once()
+        assert service._event_bus.publish.await_args.args[0].symbols == ["A"]
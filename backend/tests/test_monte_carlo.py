@@ -0,0 +1,57 @@
+"""
+Tests for the Monte Carlo simulator
+
+Checks the batched mode simulates the same paths as the per-simulation
+loops for a given seed, and that the memory cap only changes chunking.
+"""
+
+import numpy as np
+import pytest
+
+from app.backtest.monte_carlo import MonteCarloSimulator, SimulationType, TradeRecord
+
+
+@pytest.fixture
+def trades():
+    rng = np.random.default_rng(3)
+    return [TradeRecord(pnl=float(p), pnl_percent=float(p) / 1000) for p in rng.normal(150, 2500, 120)]
+
+
+def distributions(result):
+    return result.return_distribution, result.drawdown_distribution, result.sharpe_distribution
+
+
+class TestBatchedSimulation:
+    """batched=True reproduces the per-simulation loops."""
+
+    @pytest.mark.parametrize("sim_type", list(SimulationType))
+    def test_matches_loop(self, trades, sim_type):
+        loop = MonteCarloSimulator(seed=7, batched=False).run(trades, 300, sim_type)
+        batched = MonteCarloSimulator(seed=7).run(trades, 300, sim_type)
+
+        for expected, actual in zip(distributions(loop), distributions(batched)):
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+        assert batched.probability_of_ruin == loop.probability_of_ruin
+        assert len(set(np.round(batched.drawdown_distribution, 12))) > 100
+
+    @pytest.mark.parametrize("sim_type", list(SimulationType))
+    def test_memory_limit_only_changes_chunking(self, trades, sim_type):
+        # 0.01 MB holds 21 paths of 120 trades, so 300 simulations take 15 chunks
+        whole = MonteCarloSimulator(seed=7).run(trades, 300, sim_type)
+        chunked = MonteCarloSimulator(seed=7, memory_limit_mb=0.01).run(trades, 300, sim_type)
+
+        assert distributions(chunked) == distributions(whole)
+
+    def test_shuffle_keeps_total_return(self, trades):
+        result = MonteCarloSimulator(seed=1).run(trades, 200, SimulationType.SHUFFLE)
+        total = sum(t.pnl for t in trades) / 100000.0
+
+        assert result.return_distribution == pytest.approx([total] * 200)
+
+    @pytest.mark.parametrize("batched", [True, False])
+    def test_sim_type_is_validated(self, trades, batched):
+        simulator = MonteCarloSimulator(seed=1, batched=batched)
+
+        assert simulator.run(trades, 20, "bootstrap").simulation_type == SimulationType.BOOTSTRAP
+        with pytest.raises(ValueError):
+            simulator.run(trades, 20, "bogus")
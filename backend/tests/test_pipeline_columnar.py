@@ -0,0 +1,154 @@
+"""
+Tests for the columnar pipeline output
+
+Decodes the binary COPY payload built from an Arrow record batch and
+checks it against the computed indicator arrays.
+"""
+
+import struct
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "pipeline"))
+import columnar  # noqa: E402
+import stage1_compute  # noqa: E402
+import stage3_db_load_fast  # noqa: E402
+
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+DECODERS = {
+    "uuid": lambda b: str(uuid.UUID(bytes=b)),
+    "text": lambda b: b.decode(),
+    "timestamptz": lambda b: PG_EPOCH + timedelta(microseconds=struct.unpack(">q", b)[0]),
+    "int4": lambda b: struct.unpack(">i", b)[0],
+    "float8": lambda b: struct.unpack(">d", b)[0],
+}
+
+
+def decode_copy_binary(payload, columns):
+    """Reference decoder for PostgreSQL binary COPY, one dict per row."""
+    payload = bytes(payload)
+    assert payload.startswith(columnar.COPY_HEADER)
+    pos, rows = len(columnar.COPY_HEADER), []
+    while True:
+        (count,) = struct.unpack_from(">h", payload, pos)
+        pos += 2
+        if count == -1:
+            break
+        assert count == len(columns)
+        row = {}
+        for name in columns:
+            (length,) = struct.unpack_from(">i", payload, pos)
+            pos += 4
+            if length == -1:
+                row[name] = None
+                continue
+            row[name] = DECODERS[columnar.staging_type(name)](payload[pos:pos + length])
+            pos += length
+        rows.append(row)
+    assert pos == len(payload)
+    return rows
+
+
+def computed_batch(instrument_id, timeframe="1m", n=600, seed=2):
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+    timestamps = [start + timedelta(minutes=i) for i in range(n)]
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    volume = rng.integers(0, 100, n).astype(float)
+    volume[:30] = 0  # NULL VWAP at the start of the day
+    indicators = stage1_compute.compute_all_indicators(timestamps, close + 1, close - 1, close, volume)
+    return indicators, columnar.to_record_batch(indicators, instrument_id, timeframe)
+
+
+class TestCopyBinaryEncoding:
+    """encode_copy_binary produces exactly the computed values."""
+
+    def test_round_trip_with_nulls(self):
+        instrument_id = str(uuid.uuid4())
+        indicators, batch = computed_batch(instrument_id)
+
+        rows = decode_copy_binary(columnar.encode_copy_binary(batch, columnar.DB_COLUMNS), columnar.DB_COLUMNS)
+
+        assert len(rows) == batch.num_rows
+        by_time = {row["timestamp"]: row for row in rows}
+        for i, timestamp in enumerate(indicators["timestamp"]):
+            row = by_time[timestamp]
+            assert row["instrument_id"] == instrument_id
+            assert row["timeframe"] == "1m"
+            for name in columnar.DB_COLUMNS[3:]:
+                expected = indicators[name][i]
+                if isinstance(expected, float) and np.isnan(expected):
+                    assert row[name] is None, (i, name)
+                else:
+                    assert row[name] == expected, (i, name)
+
+    def test_mixed_text_values(self):
+        """Rows with different text values (e.g. timeframes) share one payload."""
+        batches = [computed_batch(str(uuid.uuid4()), tf, n=50, seed=k)[1]
+                   for k, tf in enumerate(["1m", "15m", "1h"])]
+        batch = pa.Table.from_batches(batches).combine_chunks().to_batches()[0]
+
+        rows = decode_copy_binary(columnar.encode_copy_binary(batch, columnar.DB_COLUMNS), columnar.DB_COLUMNS)
+
+        assert sorted(row["timeframe"] for row in rows) == sorted(["1m"] * 50 + ["15m"] * 50 + ["1h"] * 50)
+        assert len({row["instrument_id"] for row in rows}) == 3
+
+
+class TestStage3Batches:
+    """Stage 3 merges pandas-written Parquet files into one COPY payload."""
+
+    def test_multi_file_batch(self, tmp_path):
+        files, expected = [], {}
+        for k in range(4):
+            instrument_id = str(uuid.uuid4())
+            indicators, batch = computed_batch(instrument_id, n=300, seed=k)
+            path = tmp_path / f"SYM{k}_indicators_1m.parquet"
+            batch.to_pandas().to_parquet(path, index=False)  # as stage 2 writes it
+            files.append(path)
+            expected[instrument_id] = indicators
+
+        assert [len(b) for b in stage3_db_load_fast.plan_batches(files, 500)] == [2, 2]
+        payload, columns, count, read_files = stage3_db_load_fast.read_parquet_batch(files)
+        rows = decode_copy_binary(payload, columns)
+
+        assert count == len(rows) == 1200
+        assert read_files == files
+        for row in rows[::37]:
+            indicators = expected[row["instrument_id"]]
+            i = indicators["timestamp"].index(row["timestamp"])
+            assert row["supertrend_direction"] == indicators["supertrend_direction"][i]
+            assert row["sma_20"] == indicators["sma_20"][i] or (row["sma_20"] is None and i < 19)
+
+    def test_unreadable_file_is_not_reported_as_read(self, tmp_path):
+        good = tmp_path / "GOOD_indicators_1m.parquet"
+        computed_batch(str(uuid.uuid4()), n=50)[1].to_pandas().to_parquet(good, index=False)
+        bad = tmp_path / "BAD_indicators_1m.parquet"
+        bad.write_bytes(b"not parquet")
+
+        payload, columns, count, read_files = stage3_db_load_fast.read_parquet_batch([bad, good])
+
+        assert count == len(decode_copy_binary(payload, columns)) == 50
+        assert read_files == [good]
+
+    @pytest.mark.asyncio
+    async def test_staging_table_has_every_column(self):
+        """A column subset is copied, but the reused staging table holds them all."""
+        conn = AsyncMock()
+        conn.execute.return_value = "INSERT 0 3"
+        columns = ["instrument_id", "timeframe", "timestamp", "sma_9"]
+
+        assert await columnar.copy_payload(conn, b"", columns) == 3
+
+        create = conn.execute.await_args_list[0].args[0]
+        staged = [part.split()[0] for part in create.split("(", 1)[1].split(",")]
+        assert staged == list(columnar.DB_COLUMNS)
+        assert conn.copy_to_table.await_args.kwargs["columns"] == columns
+        insert = conn.execute.await_args_list[-1].args[0]
+        assert "sma_20" not in insert
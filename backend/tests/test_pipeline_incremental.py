@@ -0,0 +1,226 @@
+"""
+Tests for incremental indicator recompute
+
+Computes a series in pieces from persisted warm-up state and checks it
+against one full compute_all_indicators pass.
+"""
+
+import asyncio
+import json
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "pipeline"))
+import incremental_state  # noqa: E402
+import stage1_compute  # noqa: E402
+import stage2_parquet  # noqa: E402
+
+
+def session_candles(n=3000, seed=3):
+    """1m candles over several 03:45-10:00 UTC sessions."""
+    rng = np.random.default_rng(seed)
+    timestamps, ts = [], datetime(2025, 1, 6, 3, 45, tzinfo=timezone.utc)
+    for _ in range(n):
+        timestamps.append(ts)
+        ts += timedelta(minutes=1)
+        if ts.hour >= 10:
+            ts = ts.replace(hour=3, minute=45) + timedelta(days=1)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    high = close + rng.uniform(0, 1, n)
+    low = close - rng.uniform(0, 1, n)
+    volume = rng.integers(0, 100, n).astype(float)
+    return timestamps, high, low, close, volume
+
+
+class TestIncrementalRecompute:
+    """Continuing from saved state matches a full recompute."""
+
+    def test_pieces_match_full_compute(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(incremental_state, "STATE_DIR", tmp_path)
+        candles = session_candles()
+        expected = stage1_compute.compute_all_indicators(*candles)
+
+        # Not warm before 200 candles; cuts land mid-session (VWAP carry-over)
+        pieces, state = [], None
+        for lo, hi in [(0, 150), (0, 1000), (1000, 1190), (1190, 1191), (1191, 3000)]:
+            if incremental_state.resume_after(state) is None:
+                assert lo == 0
+            indicators, state = incremental_state.compute_incremental(state, *(c[lo:hi] for c in candles))
+            incremental_state.save_state("inst", "1m", state)
+            state = incremental_state.load_state("inst", "1m")
+            if hi > 150:
+                pieces.append(indicators)
+
+        assert state.candle_count == 3000
+        assert incremental_state.resume_after(state) == candles[0][-1]
+        for name, values in expected.items():
+            actual = np.concatenate([p[name] for p in pieces])
+            if name in ("timestamp", "obv", "supertrend_direction"):
+                np.testing.assert_array_equal(actual, values, err_msg=name)
+            else:
+                np.testing.assert_allclose(actual, values, rtol=1e-10, atol=1e-10, err_msg=name)
+
+
+    def test_incremental_output_gets_its_own_parquet_name(self, tmp_path, monkeypatch):
+        """A follow-up run never reuses the full-history staging or Parquet name."""
+        monkeypatch.setattr(incremental_state, "STATE_DIR", tmp_path / "state")
+        monkeypatch.setattr(stage1_compute, "OUTPUT_DIR", tmp_path)
+        monkeypatch.setattr(stage2_parquet, "PARQUET_DIR", tmp_path)
+        candles = session_candles()
+        first = [c[:2000] for c in candles]
+        rest = [c[2000:] for c in candles]
+
+        full = stage1_compute.compute_and_save("inst", "M&M", "1m", *first)
+        state = incremental_state.compute_incremental(None, *first)[1]
+        update = stage1_compute.compute_and_save("inst", "M&M", "1m", *rest, incremental=True, state=state)
+        assert full != update
+        assert stage2_parquet.convert_to_parquet(full)
+        assert stage2_parquet.convert_to_parquet(update)
+
+        stamp = rest[0][0].strftime("%Y%m%d%H%M")
+        names = sorted(p.name for p in tmp_path.glob("*.parquet"))
+        assert names == ["M_M_indicators_1m.parquet", f"M_M_indicators_1m_{stamp}.parquet"]
+        assert len(pd.read_parquet(tmp_path / names[1])) == 1000
+
+
+class TestProgressJournal:
+    """The stage 1 journal resumes from its last line per instrument."""
+
+    def test_resume_reads_latest_status(self, tmp_path):
+        path = tmp_path / "compute_progress.jsonl"
+        (tmp_path / "compute_progress.json").write_text('{"completed": ["legacy"], "failed": []}')
+        journal = stage1_compute.ProgressJournal(path)
+        journal.record("a", "A", True, candles=10)
+        journal.record("b", "B", False, "boom")
+        journal.record("b", "B", True)
+        journal.record("c", "C", True)
+        journal.record("c", "C", False, "boom")
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"id": "d", "sta')  # interrupted write
+
+        assert stage1_compute.ProgressJournal(path).completed == {"legacy", "a", "b"}
+        assert stage1_compute.ProgressJournal(path, resume=False).completed == set()
+
+
+class FakeCursorConnection:
+    """Serves candles through asyncpg's transaction / server-side cursor calls."""
+
+    def __init__(self, candles):
+        self.rows = list(zip(*candles))
+        self.fetches = 0
+
+    def transaction(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def cursor(self, query, *args):
+        return self
+
+    async def fetch(self, n):
+        self.fetches += 1
+        rows, self.rows = self.rows[:n], self.rows[n:]
+        return rows
+
+
+class TestChunkedCompute:
+    """Chunk-by-chunk compute writes the same rows as one full pass."""
+
+    def test_chunk_size_from_measured_footprint(self):
+        candle_bytes = stage1_compute.measure_candle_bytes(1000)
+
+        # At least the five fetched columns and the float indicator columns
+        assert candle_bytes > 8 * (5 + 2 * 30)
+        assert stage1_compute.chunk_candles_for(512, candle_bytes) == 512 * 2**20 // candle_bytes
+        assert stage1_compute.chunk_candles_for(1, candle_bytes) == stage1_compute.MIN_CHUNK_CANDLES
+
+    def test_chunks_match_full_compute(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(stage1_compute, "OUTPUT_DIR", tmp_path)
+        candles = session_candles()
+        expected = stage1_compute.compute_all_indicators(*candles)
+        conn = FakeCursorConnection(candles)
+
+        n, state = asyncio.run(stage1_compute.compute_chunked(conn, "inst", "SYM", "1m", chunk_candles=700))
+
+        assert n == 3000 and state.candle_count == 3000
+        assert conn.fetches == 6  # five chunks, then the empty fetch
+        parts = []
+        for path in sorted(tmp_path.glob("inst_*.pkl")):
+            with open(path, "rb") as f:
+                parts.append(pickle.load(f))
+        assert [p["candle_count"] for p in parts] == [700, 700, 700, 700, 200]
+        for name, values in expected.items():
+            actual = np.concatenate([p[name] for p in parts])
+            if name in ("timestamp", "obv", "supertrend_direction"):
+                np.testing.assert_array_equal(actual, values, err_msg=name)
+            else:
+                np.testing.assert_allclose(actual, values, rtol=1e-10, atol=1e-10, err_msg=name)
+
+
+class FakePool:
+    """asyncpg pool stand-in serving the instrument list and 1m candles."""
+
+    def __init__(self, histories):
+        self.histories = histories
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetch(self, query, *args):
+        if "instrument_master" in query:
+            return [
+                {"instrument_id": inst_id, "trading_symbol": inst_id, "candle_count": len(c[0])}
+                for inst_id, c in self.histories.items()
+            ]
+        fields = ("timestamp", "high", "low", "close", "volume")
+        return [dict(zip(fields, row)) for row in zip(*self.histories[args[0]])]
+
+    async def close(self):
+        pass
+
+
+class TestTimeframesMain:
+    """main() with --timeframes journals every instrument exactly once."""
+
+    def test_instrument_without_usable_timeframes_is_skipped(self, tmp_path, monkeypatch):
+        pool = FakePool({"LONG": session_candles(3000), "SHORT": session_candles(200)})
+
+        async def create_pool(*args, **kwargs):
+            return pool
+
+        monkeypatch.setattr(stage1_compute.asyncpg, "create_pool", create_pool)
+        monkeypatch.setattr(stage1_compute, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(stage1_compute, "OUTPUT_DIR", tmp_path)
+        computed = []
+
+        def compute_fn(instrument_id, symbol, timeframe, *candles):
+            computed.append((symbol, timeframe))
+            return SimpleNamespace(name=f"{symbol}_{timeframe}")
+
+        progress = tmp_path / "progress.jsonl"
+        asyncio.run(stage1_compute.main(
+            workers=2, compute_workers=2, compute_fn=compute_fn,
+            progress_file=progress, timeframes=["1h", "1d"],
+        ))
+
+        assert computed == [("LONG", "1h")]  # 1d and all of SHORT are under MIN_CANDLES
+        statuses = {e["id"]: e["status"] for e in map(json.loads, progress.read_text().splitlines())}
+        assert statuses == {"LONG": "completed", "SHORT": "failed"}
@@ -0,0 +1,126 @@
+"""
+Tests for Walk-Forward optimization
+
+Runs the parameter searches sequentially and on a process pool over shared
+memory and checks both choose the same parameters, and that budgeted
+searches hand strategy_runner fewer, shrinking candidate sets.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.enhanced_engine import OrderSide, Trade
+from app.backtest.param_search import SearchMethod, SuccessiveHalving, create_search
+from app.backtest.walk_forward import SharedFrame, WalkForwardConfig, WalkForwardEngine
+
+WIDE_RANGES = {"window": [3, 5, 8, 10, 15, 20, 30, 40, 60, 80], "hold": [1, 2, 3, 4, 6, 8, 12], "tag": ["a", "b", "c"]}
+
+
+def sma_cross_runner(data, params, backtest_config):
+    """Long while close is above its SMA; ``tag`` does not change results, so it only creates ties."""
+    close = data["close"]
+    above = (close > close.rolling(params["window"]).mean()).to_numpy()
+    entries = np.flatnonzero(above[1:] & ~above[:-1]) + 1
+    trades = []
+    for i in entries[:-1]:
+        exit_i = min(i + params["hold"], len(data) - 1)
+        entry, exit_ = close.iloc[i], close.iloc[exit_i]
+        trades.append(Trade(
+            entry_time=data.index[i], exit_time=data.index[exit_i], symbol=data["symbol"].iloc[i],
+            side=OrderSide.BUY, entry_price=entry, exit_price=exit_, quantity=1,
+            pnl=exit_ - entry, pnl_percent=(exit_ / entry - 1) * 100, commission=0.0, slippage=0.0,
+        ))
+    pnl = np.array([t.pnl_percent for t in trades])
+    sharpe = float(pnl.mean() / pnl.std()) if len(pnl) > 1 and pnl.std() > 0 else 0.0
+    return trades, {"sharpe_ratio": round(sharpe, 6), "total_return_percent": float(pnl.sum()) if len(pnl) else 0.0}
+
+
+@pytest.fixture
+def hourly_data():
+    index = pd.date_range("2024-01-01 09:00", periods=2400, freq="h", tz="Asia/Kolkata")
+    close = 100 + np.cumsum(np.random.default_rng(11).normal(0, 1, len(index)))
+    return pd.DataFrame({"close": close, "symbol": "NSE:AAA-EQ"}, index=index)
+
+
+class TestParallelOptimization:
+    """optimize_workers > 1 reproduces the sequential grid search."""
+
+    @pytest.mark.parametrize("method,ranges", [
+        (SearchMethod.GRID, {"window": [5, 10, 20, 40], "hold": [2, 6], "tag": ["a", "b"]}),
+        (SearchMethod.HALVING, WIDE_RANGES),
+        (SearchMethod.TPE, WIDE_RANGES),
+    ])
+    def test_parallel_matches_sequential(self, hourly_data, method, ranges):
+        results = []
+        for workers in (1, 2):
+            config = WalkForwardConfig(
+                training_period_days=30, testing_period_days=10, step_days=10,
+                min_training_trades=5, min_testing_trades=1,
+                parameter_ranges=ranges, search_method=method, search_budget=40,
+                optimize_workers=workers,
+            )
+            results.append(WalkForwardEngine(config, sma_cross_runner).run(hourly_data.copy()))
+        sequential, parallel = results
+
+        assert len(sequential.windows) > 5
+        assert all(w.optimized_params for w in sequential.windows)
+        assert [w.optimized_params for w in parallel.windows] == [w.optimized_params for w in sequential.windows]
+        assert parallel.combined_metrics == sequential.combined_metrics
+        if method == SearchMethod.GRID:
+            assert all(w.optimized_params["tag"] == "a" for w in sequential.windows)
+
+    def test_shared_frame_round_trip(self, hourly_data):
+        shared = SharedFrame(hourly_data)
+        try:
+            pd.testing.assert_frame_equal(shared.frame(), hourly_data, check_freq=False)
+        finally:
+            shared.unlink()
+
+
+class TestParameterSearch:
+    """Budgeted searches stay within budget and shrink their candidate sets."""
+
+    @pytest.mark.parametrize("method", [SearchMethod.RANDOM, SearchMethod.TPE])
+    def test_budget_limits_runs(self, hourly_data, method):
+        calls = []
+
+        def counting_runner(data, params, backtest_config):
+            calls.append(tuple(params.values()))
+            return sma_cross_runner(data, params, backtest_config)
+
+        config = WalkForwardConfig(
+            training_period_days=30, testing_period_days=10, step_days=10, min_training_trades=5,
+            parameter_ranges=WIDE_RANGES, search_method=method, search_budget=25,
+        )
+        engine = WalkForwardEngine(config, counting_runner)
+        engine.windows = engine.generate_windows(hourly_data.index.min(), hourly_data.index.max())
+
+        params = engine.optimize_parameters(hourly_data, engine.windows[0])
+
+        assert len(calls) == len(set(calls)) == 25
+        assert params and tuple(params.values()) in calls
+
+    def test_halving_grows_data_as_candidates_shrink(self):
+        search = SuccessiveHalving(WIDE_RANGES, budget=50, rng=np.random.default_rng(0))
+        rounds = []
+        while (proposal := search.ask()) is not None:
+            candidates, fraction = proposal
+            rounds.append((len(candidates), fraction))
+            search.tell(candidates, [float(p["window"]) for p in candidates])
+
+        assert rounds == [(50, pytest.approx(1 / 9)), (17, pytest.approx(1 / 3)), (6, 1)]
+        assert all(p["window"] >= 60 for p in candidates)
+
+    def test_tpe_concentrates_on_good_values(self):
+        search = create_search(SearchMethod.TPE, WIDE_RANGES, budget=60, seed=1)
+        history = []
+        while (proposal := search.ask()) is not None:
+            candidates, _ = proposal
+            search.tell(candidates, [-abs(p["window"] - 30) - abs(p["hold"] - 4) for p in candidates])
+            history += candidates
+
+        # Uniform sampling puts 3 / 10 of proposals on these windows
+        later = history[30:]
+        assert sum(p["window"] in (20, 30, 40) for p in later) >= 1.5 * 0.3 * len(later)
+        assert {"window": 30, "hold": 4} in [{k: p[k] for k in ("window", "hold")} for p in history]